@@ -17,6 +17,10 @@ NOTIFICATION_POLL_INTERVAL_MS = 30 * 1000
 # Notify this many minutes before a meeting starts
 PRE_MEETING_NOTIFY_MINUTES = 5
 
+# Keys for the notification kinds persisted in the database
+NOTIFIED_KIND_UPCOMING = "upcoming"
+NOTIFIED_KIND_REMINDER = "reminder"
+
 
 class NotificationWorker(QThread):
     """Background thread for meeting notifications and recording reminders.
@@ -74,20 +78,40 @@ class NotificationWorker(QThread):
         self._is_recording = is_recording
         self._mutex.unlock()
 
-    def _reset_daily_state(self) -> None:
-        """Reset notification tracking at the start of each day."""
-        today = get_now().date()
+    def _reset_daily_state(self, today: date) -> None:
+        """Reload notification tracking at the start of each day.
+
+        Already-notified events are restored from the database so restarting the
+        worker mid-day doesn't repeat notifications; earlier days are pruned.
+        """
         if self._last_reset_date != today:
-            self._notified_upcoming.clear()
-            self._notified_reminder.clear()
+            try:
+                self.db.prune_notified_ids(today)
+                self._notified_upcoming = self.db.get_notified_ids(today, NOTIFIED_KIND_UPCOMING)
+                self._notified_reminder = self.db.get_notified_ids(today, NOTIFIED_KIND_REMINDER)
+            except Exception as e:
+                logger.warning("Notification worker: failed to load notified events: %s", e)
+                self._notified_upcoming = set()
+                self._notified_reminder = set()
             self._last_reset_date = today
 
+    def _mark_notified(self, kind: str, event_key: str) -> None:
+        """Persist that a notification was shown for an event today."""
+        if self._last_reset_date is None:
+            return
+        try:
+            self.db.add_notified_id(self._last_reset_date, kind, event_key)
+        except Exception as e:
+            logger.warning("Notification worker: failed to save notified event: %s", e)
+
     def _check_notifications(self) -> None:
         """Check for meetings that need notifications."""
         if not config.get("notifications_enabled", True):
             return
 
-        self._reset_daily_state()
+        # Read the clock once per tick and derive everything else from it
+        now = get_now()
+        self._reset_daily_state(now.date())
 
         try:
             events = self.db.get_todays_calendar_events()
@@ -95,7 +119,6 @@ class NotificationWorker(QThread):
             logger.warning("Notification worker: failed to get events: %s", e)
             return
 
-        now = get_now()
         video_only = config.get("notify_video_only", True)
         grace_minutes = config.get("reminder_grace_period_minutes", 2)
 
@@ -157,6 +180,7 @@ class NotificationWorker(QThread):
 
             self.notify.emit(f"Upcoming: {title}", message, 5000)
             self._notified_upcoming.add(event_key)
+            self._mark_notified(NOTIFIED_KIND_UPCOMING, event_key)
             logger.info("Notification sent for upcoming meeting: %s", title)
 
     def _check_recording_reminder(
@@ -195,6 +219,7 @@ class NotificationWorker(QThread):
 
         self.recording_reminder.emit(event_key, title)
         self._notified_reminder.add(event_key)
+        self._mark_notified(NOTIFIED_KIND_REMINDER, event_key)
         logger.info("Recording reminder sent for meeting: %s", title)
 
     @staticmethod
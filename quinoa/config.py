@@ -1,8 +1,12 @@
 import contextlib
+import functools
 import json
 import logging
 import os
+import threading
+from collections import ChainMap
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import keyring
@@ -16,35 +20,91 @@ SERVICE_NAME = "quinoa"
 API_KEY_USER = "gemini_api_key"
 FILE_SEARCH_STORE_USER = "file_search_store_name"
 
-DEFAULT_CONFIG = {
-    "output_dir": os.path.expanduser("~/Music/Quinoa"),
-    "system_audio_enabled": True,
-    "mic_device_id": None,
-    # AI model
-    "gemini_model": None,  # Uses GEMINI_MODEL_TRANSCRIPTION constant if None
-    "cached_gemini_models": None,  # Cached list of available models from API
-    # Window state persistence
-    "splitter_sizes": None,  # Will use SPLITTER_DEFAULT_SIZES if None
-    "left_panel_collapsed": False,
-    "right_panel_collapsed": False,
-    # File Search settings
-    "file_search_enabled": False,  # User opt-in
-    "file_search_delay_minutes": 5,  # Delay before sync
-    "calendar_auth_expired": False,  # True if refresh failed
-    # Automation
-    "auto_transcribe": True,  # Transcribe automatically after recording stops
-    # Notifications
-    "notifications_enabled": True,  # Show meeting notifications
-    "recording_reminder_enabled": True,  # Warn if meeting started but not recording
-    "reminder_grace_period_minutes": 2,  # Minutes after meeting start before reminder
-    "notify_video_only": True,  # Only notify for meetings with video links
+# Config keys stored in the system keyring instead of config.json
+KEYRING_USERS = {
+    "api_key": API_KEY_USER,
+    "file_search_store_name": FILE_SEARCH_STORE_USER,
+}
+
+# Placeholder for defaults that are only computed when first read
+_LAZY_DEFAULT = object()
+
+# Read-only defaults; user overrides live in Config._user
+DEFAULT_CONFIG = MappingProxyType(
+    {
+        "output_dir": _LAZY_DEFAULT,  # ~/Music/Quinoa, expanded on first get()
+        "system_audio_enabled": True,
+        "mic_device_id": None,
+        # AI model
+        "gemini_model": None,  # Uses GEMINI_MODEL_TRANSCRIPTION constant if None
+        "cached_gemini_models": None,  # Cached list of available models from API
+        # Window state persistence
+        "splitter_sizes": None,  # Will use SPLITTER_DEFAULT_SIZES if None
+        "left_panel_collapsed": False,
+        "right_panel_collapsed": False,
+        # File Search settings
+        "file_search_enabled": False,  # User opt-in
+        "file_search_delay_minutes": 5,  # Delay before sync
+        "file_search_store_verified": None,  # {"name": ..., "at": epoch} of last store check
+        "file_search_sync_concurrency": None,  # Uses FILE_SEARCH_SYNC_CONCURRENCY if None
+        "calendar_auth_expired": False,  # True if refresh failed
+        "content_hash_algorithm": "xxh3",  # "sha256" for the legacy change-detection hash
+        # Automation
+        "auto_transcribe": True,  # Transcribe automatically after recording stops
+        # Notifications
+        "notifications_enabled": True,  # Show meeting notifications
+        "recording_reminder_enabled": True,  # Warn if meeting started but not recording
+        "reminder_grace_period_minutes": 2,  # Minutes after meeting start before reminder
+        "notify_video_only": True,  # Only notify for meetings with video links
+    }
+)
+
+
+@functools.cache
+def _default_output_dir() -> str:
+    return os.path.expanduser("~/Music/Quinoa")
+
+
+# Resolvers for _LAZY_DEFAULT entries
+_LAZY_DEFAULTS = {
+    "output_dir": _default_output_dir,
 }
 
 
 class Config:
     def __init__(self) -> None:
-        self._data = DEFAULT_CONFIG.copy()
+        # Only user-set values are stored; unset keys fall through to the defaults
+        self._user: dict[str, Any] = {}
+        # ChainMap only ever writes to its first map, so the read-only defaults are safe
+        self._data: ChainMap[str, Any] = ChainMap(self._user, DEFAULT_CONFIG)  # type: ignore[arg-type]
+        # Keyring values cached after first read (keyring user -> value)
+        self._secret_cache: dict[str, str | None] = {}
+        self._secret_lock = threading.Lock()
         self.load()
+        # Warm the keyring cache off the main thread so the first get() doesn't
+        # block on a D-Bus round-trip.
+        threading.Thread(target=self._prefetch_secrets, daemon=True).start()
+
+    def _prefetch_secrets(self) -> None:
+        """Read all keyring-backed values into the cache."""
+        for user in KEYRING_USERS.values():
+            try:
+                value = keyring.get_password(SERVICE_NAME, user)
+            except Exception as e:
+                logger.debug("Keyring prefetch failed for %s: %s", user, e)
+                continue
+            with self._secret_lock:
+                self._secret_cache.setdefault(user, value)
+
+    def _get_secret(self, user: str) -> str | None:
+        """Return a keyring value, reading it synchronously if not cached yet."""
+        with self._secret_lock:
+            if user in self._secret_cache:
+                return self._secret_cache[user]
+        value: str | None = keyring.get_password(SERVICE_NAME, user)
+        with self._secret_lock:
+            self._secret_cache[user] = value
+        return value
 
     def load(self) -> None:
         if CONFIG_FILE.exists():
@@ -54,7 +114,7 @@ class Config:
                     # Filter out api_key if it was accidentally saved in json before
                     if "api_key" in saved:
                         del saved["api_key"]
-                    self._data.update(saved)
+                    self._user.update(saved)
             except Exception as e:
                 logger.warning("Failed to load config: %s", e)
 
@@ -63,49 +123,45 @@ class Config:
         try:
             with open(CONFIG_FILE, "w") as f:
                 # Ensure we never save api_key to json
-                data_to_save = {k: v for k, v in self._data.items() if k != "api_key"}
+                data_to_save = {k: v for k, v in self._user.items() if k != "api_key"}
                 json.dump(data_to_save, f, indent=4)
         except Exception as e:
             logger.warning("Failed to save config: %s", e)
 
     def get(self, key: str, default: Any | None = None) -> Any:
         # Keys stored in keyring for security
-        if key == "api_key":
+        user = KEYRING_USERS.get(key)
+        if user is not None:
             try:
-                return keyring.get_password(SERVICE_NAME, API_KEY_USER) or default
+                return self._get_secret(user) or default
             except Exception as e:
                 logger.warning("Keyring error: %s", e)
                 return default
-        if key == "file_search_store_name":
-            try:
-                return keyring.get_password(SERVICE_NAME, FILE_SEARCH_STORE_USER) or default
-            except Exception as e:
-                logger.warning("Keyring error: %s", e)
-                return default
-        return self._data.get(key, default)
+        value = self._data.get(key, default)
+        if value is _LAZY_DEFAULT:
+            return _LAZY_DEFAULTS[key]()
+        return value
 
     def set(self, key: str, value: Any) -> None:
         # Keys stored in keyring for security
-        if key == "api_key":
-            try:
-                if value:
-                    keyring.set_password(SERVICE_NAME, API_KEY_USER, value)
-                else:
-                    with contextlib.suppress(keyring.errors.PasswordDeleteError):
-                        keyring.delete_password(SERVICE_NAME, API_KEY_USER)
-            except Exception as e:
-                logger.warning("Failed to save to keyring: %s", e)
-        elif key == "file_search_store_name":
+        user = KEYRING_USERS.get(key)
+        if user is not None:
             try:
                 if value:
-                    keyring.set_password(SERVICE_NAME, FILE_SEARCH_STORE_USER, value)
+                    keyring.set_password(SERVICE_NAME, user, value)
                 else:
                     with contextlib.suppress(keyring.errors.PasswordDeleteError):
-                        keyring.delete_password(SERVICE_NAME, FILE_SEARCH_STORE_USER)
+                        keyring.delete_password(SERVICE_NAME, user)
             except Exception as e:
                 logger.warning("Failed to save to keyring: %s", e)
+                # Drop the cached value so the next get() re-reads the keyring
+                with self._secret_lock:
+                    self._secret_cache.pop(user, None)
+                return
+            with self._secret_lock:
+                self._secret_cache[user] = value or None
         else:
-            self._data[key] = value
+            self._user[key] = value
             self.save()
 
 
@@ -1,7 +1,7 @@
 """Constants for Quinoa application."""
 
 import os
-from datetime import datetime
+from datetime import date, datetime
 from enum import IntEnum
 
 # Gemini Models
@@ -23,6 +23,10 @@ LEFT_PANEL_MIN_WIDTH = 200
 RIGHT_PANEL_WIDTH = 300
 SPLITTER_DEFAULT_SIZES = [LEFT_PANEL_WIDTH, 440, RIGHT_PANEL_WIDTH]
 
+# History search
+SEARCH_DEBOUNCE_MS = 250  # Wait for a pause in typing before querying
+SEARCH_CACHE_SIZE = 64  # Recent queries whose results are kept until the next refresh
+
 # Layout
 LAYOUT_SPACING = 15
 LAYOUT_MARGIN = 20
@@ -32,11 +36,20 @@ LAYOUT_MARGIN_SMALL = 10
 DEFAULT_SAMPLE_RATE = 48000
 AUDIO_CHUNK_SIZE = 4096
 TIMER_INTERVAL_MS = 100
+PLAYBACK_UI_INTERVAL_MS = 250  # Min position change before the player UI repaints
 SILENCE_THRESHOLD = 0.01  # VU level below which audio is considered silent
 SILENCE_NOTIFICATION_SECONDS = 90  # Notify after this many seconds of silence
 
 # Storage
 MIN_DISK_SPACE_BYTES = 500 * 1024 * 1024  # 500 MB
+DB_OPTIMIZE_INTERVAL_COMMITS = 1000  # Run PRAGMA optimize this often per connection
+
+# Logging
+LOG_FILE_MAX_BYTES = 5_000_000  # Rotate quinoa.log at ~5 MB
+LOG_FILE_BACKUP_COUNT = 3
+
+# Calendar
+CALENDAR_AUTH_CHECK_SECONDS = 30  # Re-read the keyring for calendar auth at most this often
 
 # Notes
 NOTES_AUTO_SAVE_INTERVAL_MS = 30000  # 30 seconds
@@ -45,6 +58,10 @@ NOTES_AUTO_SAVE_INTERVAL_MS = 30000  # 30 seconds
 FILE_SEARCH_DELAY_MS = 5 * 60 * 1000  # 5 minutes before sync
 FILE_SEARCH_POLL_INTERVAL_MS = 60 * 1000  # Check every minute
 MIN_SYNC_DURATION_SECONDS = 30  # Skip recordings shorter than 30s
+FILE_SEARCH_SYNC_CONCURRENCY = 8  # Max concurrent uploads/deletes
+FILE_SEARCH_STORE_VERIFY_INTERVAL_SECONDS = 24 * 60 * 60  # Re-check the store daily
+UPLOAD_POLL_INITIAL_SECONDS = 0.1  # First check of an upload operation
+UPLOAD_POLL_MAX_SECONDS = 2.0  # Backoff cap between upload operation checks
 CHAT_MAX_HISTORY = 50  # Max messages to retrieve
 
 # Application Icon
@@ -77,18 +94,29 @@ ICON_CALENDAR = "\U0001f4c5"  # 📅
 ICON_STOPWATCH = "\u23f1"  # ⏱
 
 
+def _parse_date_override() -> date | None:
+    """Parse QUINOA_DATE_OVERRIDE once; the environment doesn't change at runtime."""
+    override = os.environ.get("QUINOA_DATE_OVERRIDE")
+    if override:
+        try:
+            return datetime.fromisoformat(override).date()
+        except ValueError:
+            pass
+    return None
+
+
+_DATE_OVERRIDE = _parse_date_override()
+
+
 def get_now() -> datetime:
     """Return the current datetime, or a spoofed date if QUINOA_DATE_OVERRIDE is set.
 
     Set QUINOA_DATE_OVERRIDE to an ISO date (e.g. '2026-03-02') to test the UI
     as if it were a different day. Time-of-day is preserved from the real clock.
     """
-    override = os.environ.get("QUINOA_DATE_OVERRIDE")
-    if override:
-        try:
-            fake_date = datetime.fromisoformat(override).date()
-            real_now = datetime.now()
-            return real_now.replace(year=fake_date.year, month=fake_date.month, day=fake_date.day)
-        except ValueError:
-            pass
-    return datetime.now()
+    real_now = datetime.now()
+    if _DATE_OVERRIDE is None:
+        return real_now
+    return real_now.replace(
+        year=_DATE_OVERRIDE.year, month=_DATE_OVERRIDE.month, day=_DATE_OVERRIDE.day
+    )
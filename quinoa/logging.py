@@ -1,9 +1,12 @@
 """Logging configuration for Quinoa."""
 
 import logging
+import logging.handlers
 import sys
 from pathlib import Path
 
+from quinoa.constants import LOG_FILE_BACKUP_COUNT, LOG_FILE_MAX_BYTES
+
 # Create logger
 logger = logging.getLogger("quinoa")
 
@@ -11,9 +14,15 @@ logger = logging.getLogger("quinoa")
 def setup_logging(verbose: bool = False) -> None:
     """Configure logging for the application.
 
+    Safe to call more than once; handlers are only attached on the first call.
+
     Args:
         verbose: If True, set DEBUG level. Otherwise INFO.
     """
+    if getattr(logger, "_quinoa_configured", False):
+        return
+    logger._quinoa_configured = True  # type: ignore[attr-defined]
+
     level = logging.DEBUG if verbose else logging.INFO
 
     # Console handler
@@ -25,7 +34,11 @@ def setup_logging(verbose: bool = False) -> None:
     # File handler (optional - only if log dir exists)
     log_dir = Path.home() / ".local" / "share" / "quinoa"
     if log_dir.exists():
-        file_handler = logging.FileHandler(log_dir / "quinoa.log")
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_dir / "quinoa.log",
+            maxBytes=LOG_FILE_MAX_BYTES,
+            backupCount=LOG_FILE_BACKUP_COUNT,
+        )
         file_handler.setLevel(logging.DEBUG)
         file_format = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
         file_handler.setFormatter(file_format)
@@ -1,7 +1,11 @@
 """Search module for Gemini File Search integration."""
 
 from quinoa.search.chat_worker import ChatWorker
-from quinoa.search.content_formatter import compute_content_hash, format_meeting_document
+from quinoa.search.content_formatter import (
+    compute_content_hash,
+    format_and_hash,
+    format_meeting_document,
+)
 from quinoa.search.file_search import FileSearchError, FileSearchManager
 from quinoa.search.sync_worker import SyncWorker
 
@@ -11,5 +15,6 @@ __all__ = [
     "FileSearchManager",
     "SyncWorker",
     "compute_content_hash",
+    "format_and_hash",
     "format_meeting_document",
 ]
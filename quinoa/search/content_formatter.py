@@ -1,27 +1,29 @@
 """Format meeting data for File Search upload."""
 
 import hashlib
+import io
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any
 
+import xxhash
 
-def format_meeting_document(
+# Change-detection hash algorithms (see compute_content_hash)
+HASH_ALGORITHM_XXH3 = "xxh3"
+HASH_ALGORITHM_SHA256 = "sha256"
+
+
+def _iter_meeting_sections(
     recording: dict[str, Any],
     transcript: dict[str, Any] | None,
     notes: str,
     action_items: list[dict[str, Any]],
     folder_name: str | None = None,
     attendees: list[dict[str, Any]] | None = None,
-) -> str:
-    """Format meeting data as structured markdown for File Search.
-
-    Uses markdown for optimal chunking and retrieval quality.
-    """
-    sections = []
-
+) -> Iterator[str]:
+    """Yield the meeting document as consecutive markdown chunks."""
     # Title and metadata
     title = recording.get("title", "Untitled Meeting")
-    sections.append(f"# {title}")
 
     # Parse and format datetime
     started_at = recording.get("started_at")
@@ -43,49 +45,107 @@ def format_meeting_document(
     else:
         duration_str = "Unknown duration"
 
-    sections.append(f"{date_str} ({duration_str})")
+    yield f"# {title}\n{date_str} ({duration_str})"
 
     # Metadata line: folder and attendees
     meta_parts = []
     if folder_name:
         meta_parts.append(f"Series: {folder_name}")
     if attendees:
-        names = [a.get("name") or a.get("email", "Unknown") for a in attendees]
-        meta_parts.append(f"Attendees: {', '.join(names)}")
+        names = ", ".join(a.get("name") or a.get("email", "Unknown") for a in attendees)
+        meta_parts.append(f"Attendees: {names}")
     if meta_parts:
-        sections.append(" | ".join(meta_parts))
+        yield "\n"
+        yield " | ".join(meta_parts)
 
-    sections.append("")
+    yield "\n"
 
+    # Each section starts on a new line and ends with a blank line
     # Notes section
     if notes and notes.strip():
-        sections.append("## Notes")
-        sections.append(notes.strip())
-        sections.append("")
+        yield "\n## Notes\n"
+        yield notes.strip()
+        yield "\n"
 
     # Summary section
     if transcript and transcript.get("summary"):
-        sections.append("## Summary")
-        sections.append(transcript["summary"])
-        sections.append("")
+        yield "\n## Summary\n"
+        yield transcript["summary"]
+        yield "\n"
 
     # Action items section
     if action_items:
-        sections.append("## Action Items")
+        yield "\n## Action Items"
         for item in action_items:
             assignee = item.get("assignee") or "Unassigned"
             status = "x" if item.get("status") == "completed" else " "
-            sections.append(f"- [{status}] {item['text']} (Assignee: {assignee})")
-        sections.append("")
+            yield f"\n- [{status}] {item['text']} (Assignee: {assignee})"
+        yield "\n"
 
     # Transcript section
     if transcript and transcript.get("text"):
-        sections.append("## Transcript")
-        sections.append(transcript["text"])
+        yield "\n## Transcript\n"
+        yield transcript["text"]
 
-    return "\n".join(sections)
+
+def format_meeting_document(
+    recording: dict[str, Any],
+    transcript: dict[str, Any] | None,
+    notes: str,
+    action_items: list[dict[str, Any]],
+    folder_name: str | None = None,
+    attendees: list[dict[str, Any]] | None = None,
+) -> bytes:
+    """Format meeting data as structured markdown for File Search.
+
+    Uses markdown for optimal chunking and retrieval quality. Returns UTF-8
+    bytes so the same buffer can be hashed and uploaded without re-encoding.
+    """
+    sections = _iter_meeting_sections(
+        recording, transcript, notes, action_items, folder_name, attendees
+    )
+    return "".join(sections).encode()
 
 
-def compute_content_hash(content: str) -> str:
-    """Compute SHA256 hash for change detection."""
-    return hashlib.sha256(content.encode()).hexdigest()
+def format_and_hash(
+    recording: dict[str, Any],
+    transcript: dict[str, Any] | None,
+    notes: str,
+    action_items: list[dict[str, Any]],
+    folder_name: str | None = None,
+    attendees: list[dict[str, Any]] | None = None,
+    algorithm: str = HASH_ALGORITHM_XXH3,
+) -> tuple[bytes, str]:
+    """Format a meeting document and compute its content hash in a single pass.
+
+    Equivalent to format_meeting_document followed by compute_content_hash, but
+    each chunk is hashed as it is written instead of re-scanning the result.
+    """
+    buf = io.BytesIO()
+    hasher = _new_hasher(algorithm)
+    for section in _iter_meeting_sections(
+        recording, transcript, notes, action_items, folder_name, attendees
+    ):
+        chunk = section.encode()
+        buf.write(chunk)
+        hasher.update(chunk)
+    return buf.getvalue(), str(hasher.hexdigest())
+
+
+def _new_hasher(algorithm: str) -> Any:
+    """Create an incremental hasher for a change-detection algorithm."""
+    if algorithm == HASH_ALGORITHM_SHA256:
+        return hashlib.sha256()
+    return xxhash.xxh3_64()
+
+
+def compute_content_hash(content: bytes, algorithm: str = HASH_ALGORITHM_XXH3) -> str:
+    """Compute a hash for change detection.
+
+    The hash is only compared against the previously stored one, so a fast
+    non-cryptographic xxh3_64 is used by default. Hashes from a different
+    algorithm never match, which just triggers a one-time re-sync.
+    """
+    hasher = _new_hasher(algorithm)
+    hasher.update(content)
+    return str(hasher.hexdigest())
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import io
 import logging
-import tempfile
+import threading
 import time
 from typing import TYPE_CHECKING, Any
 
@@ -12,13 +13,31 @@ from google.genai import types
 from google.genai.errors import ClientError
 
 from quinoa.config import config
-from quinoa.constants import GEMINI_MODEL_SEARCH
+from quinoa.constants import (
+    FILE_SEARCH_STORE_VERIFY_INTERVAL_SECONDS,
+    GEMINI_MODEL_SEARCH,
+    UPLOAD_POLL_INITIAL_SECONDS,
+    UPLOAD_POLL_MAX_SECONDS,
+)
 
 if TYPE_CHECKING:
     from quinoa.ui.right_panel import MeetingContext
 
 logger = logging.getLogger("quinoa")
 
+# System instruction for the search-focused assistant (viewing context is appended)
+SEARCH_SYSTEM_INSTRUCTION = (
+    "You are a helpful assistant for searching through meeting recordings and notes.\n"
+    "Your primary purpose is to help users find information from their past meetings.\n"
+    "When answering:\n"
+    "- Be concise and direct\n"
+    "- Cite specific meetings when referencing information\n"
+    "- If you can't find relevant information in the meetings, say so clearly\n"
+    "- Focus on facts from the meetings, not general knowledge\n"
+    "- When quoting, use the exact text from the transcript\n"
+    "- For questions about tasks, assignments, or requests, prioritize searching the 'Action Items' or 'Notes' sections."
+)
+
 
 class FileSearchError(Exception):
     """Base exception for File Search operations."""
@@ -40,22 +59,48 @@ class FileSearchManager:
         """
         self.client = genai.Client(api_key=api_key)
         self._store_name = store_name
+        self._store_lock = threading.Lock()
+        # {"name": ..., "at": epoch} of the last successful store check. Kept in
+        # memory because uploads run on pool threads; the owner persists it from
+        # the GUI thread via store_verified.
+        self._store_verified: dict[str, Any] | None = config.get("file_search_store_verified")
+        # Query config objects, rebuilt only when the store changes
+        self._tools: types.ToolListUnion = []
+        self._tools_store_name: str | None = None
+        self._default_query_config: types.GenerateContentConfig | None = None
 
     @property
     def store_name(self) -> str | None:
         """Get the current store name."""
         return self._store_name
 
+    @property
+    def store_verified(self) -> dict[str, Any] | None:
+        """Get the last successful store check, for saving to config."""
+        return self._store_verified
+
     def ensure_store_exists(self) -> str:
         """Create or retrieve the File Search store.
 
+        An existing store is only re-checked against the API if it hasn't been
+        verified within FILE_SEARCH_STORE_VERIFY_INTERVAL_SECONDS.
+
         Returns the store name identifier.
         """
+        with self._store_lock:
+            return self._ensure_store_exists()
+
+    def _ensure_store_exists(self) -> str:
         if self._store_name:
+            if self._store_recently_verified(self._store_name):
+                logger.debug("Using verified File Search store: %s", self._store_name)
+                return self._store_name
+
             # Verify existing store is valid
             try:
                 self.client.file_search_stores.get(name=self._store_name)
                 logger.debug("Using existing File Search store: %s", self._store_name)
+                self._mark_store_verified(self._store_name)
                 return self._store_name
             except Exception:
                 logger.warning("Stored File Search store not found, creating new one")
@@ -70,21 +115,44 @@ class FileSearchManager:
             logger.info("Created File Search store: %s", self._store_name)
             if self._store_name is None:
                 raise FileSearchError("Store created but has no name")
+            self._mark_store_verified(self._store_name)
             return self._store_name
         except Exception as e:
             raise FileSearchError(f"Failed to create File Search store: {e}") from e
 
+    def _store_recently_verified(self, store_name: str) -> bool:
+        """Check whether the store was confirmed to exist recently."""
+        verified = self._store_verified
+        if not isinstance(verified, dict) or verified.get("name") != store_name:
+            return False
+        age = time.time() - float(verified.get("at") or 0)
+        return 0 <= age < FILE_SEARCH_STORE_VERIFY_INTERVAL_SECONDS
+
+    def _mark_store_verified(self, store_name: str | None) -> None:
+        """Record (or with None, clear) the last successful store check."""
+        self._store_verified = {"name": store_name, "at": time.time()} if store_name else None
+
+    def _handle_missing_store(self, store_name: str) -> None:
+        """Drop the cached verification and recreate the store after a 404."""
+        with self._store_lock:
+            # Another thread may already have replaced the store
+            if self._store_name != store_name:
+                return
+            logger.warning("File Search store %s no longer exists", store_name)
+            self._mark_store_verified(None)
+            self._ensure_store_exists()
+
     def upload_meeting(
         self,
         rec_id: str,
-        content: str,
+        content: bytes,
         meeting_date: str,
     ) -> str:
         """Upload meeting content to File Search store.
 
         Args:
             rec_id: Recording ID
-            content: Formatted meeting content (markdown)
+            content: Formatted meeting content (UTF-8 markdown)
             meeting_date: Meeting date string for metadata
 
         Returns:
@@ -93,42 +161,59 @@ class FileSearchManager:
         if not self._store_name:
             raise FileSearchError("Store not initialized. Call ensure_store_exists() first.")
 
-        display_name = f"meeting_{rec_id}.md"
-
+        store_name = self._store_name
         try:
-            # Write content to a temporary file for upload
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as tmp_file:
-                tmp_file.write(content)
-                tmp_path = tmp_file.name
-
-            # Upload file and import into store
-            operation = self.client.file_search_stores.upload_to_file_search_store(
-                file=tmp_path,
-                file_search_store_name=self._store_name,
-                config={
-                    "display_name": display_name,
-                    "custom_metadata": [
-                        {"key": "recording_id", "string_value": rec_id},
-                        {"key": "meeting_date", "string_value": meeting_date},
-                    ],
-                },
-            )
+            try:
+                return self._upload_document(store_name, rec_id, content, meeting_date)
+            except ClientError as e:
+                if e.code != 404:
+                    raise
+                # The store was deleted since it was last verified; recreate it
+                # and retry once.
+                self._handle_missing_store(store_name)
+                store_name = self.ensure_store_exists()
+                return self._upload_document(store_name, rec_id, content, meeting_date)
+        except Exception as e:
+            raise FileSearchError(f"Failed to upload meeting {rec_id}: {e}") from e
 
-            # Wait for import to complete
-            while not operation.done:
-                time.sleep(2)
-                operation = self.client.operations.get(operation)
+    def _upload_document(
+        self, store_name: str, rec_id: str, content: bytes, meeting_date: str
+    ) -> str:
+        """Upload and import a meeting document, waiting for the import to finish."""
+        display_name = f"meeting_{rec_id}.md"
 
-            # Extract document resource name for future deletion
-            document_name = ""
-            if operation.response:
-                document_name = operation.response.document_name or ""
+        # Upload straight from memory and import into store. The MIME type
+        # can't be guessed from a buffer, so it is set explicitly. The payload is
+        # deliberately not gzipped: File Search indexes the uploaded bytes as the
+        # declared document type and doesn't accept gzip archives.
+        operation = self.client.file_search_stores.upload_to_file_search_store(
+            file=io.BytesIO(content),
+            file_search_store_name=store_name,
+            config={
+                "display_name": display_name,
+                "mime_type": "text/markdown",
+                "custom_metadata": [
+                    {"key": "recording_id", "string_value": rec_id},
+                    {"key": "meeting_date", "string_value": meeting_date},
+                ],
+            },
+        )
 
-            logger.info("Uploaded meeting %s to File Search (document: %s)", rec_id, document_name)
-            return document_name or display_name
+        # Wait for import to complete, polling quickly at first so small
+        # documents don't wait out a full interval
+        attempt = 0
+        while not operation.done:
+            time.sleep(min(UPLOAD_POLL_MAX_SECONDS, UPLOAD_POLL_INITIAL_SECONDS * 1.5**attempt))
+            attempt += 1
+            operation = self.client.operations.get(operation)
 
-        except Exception as e:
-            raise FileSearchError(f"Failed to upload meeting {rec_id}: {e}") from e
+        # Extract document resource name for future deletion
+        document_name = ""
+        if operation.response:
+            document_name = operation.response.document_name or ""
+
+        logger.info("Uploaded meeting %s to File Search (document: %s)", rec_id, document_name)
+        return document_name or display_name
 
     def delete_meeting(self, document_name: str) -> bool:
         """Remove a meeting document from the File Search store.
@@ -156,6 +241,13 @@ class FileSearchManager:
             self.client.file_search_stores.documents.delete(name=document_name)
             logger.info("Deleted document %s from File Search", document_name)
             return True
+        except ClientError as e:
+            if e.code != 404:
+                logger.warning("Failed to delete document %s: %s", document_name, e)
+                return False
+            # The document, or the whole store, is already gone
+            logger.info("Document %s no longer exists in File Search", document_name)
+            return True
         except Exception as e:
             logger.warning("Failed to delete document %s: %s", document_name, e)
             return False
@@ -179,21 +271,16 @@ class FileSearchManager:
         if not self._store_name:
             raise FileSearchError("Store not initialized. Call ensure_store_exists() first.")
 
-        # Build conversation context
-        contents = []
-        if chat_history:
-            for msg in chat_history[-10:]:  # Last 10 messages for context
-                contents.append(
-                    types.Content(
-                        role=msg["role"], parts=[types.Part.from_text(text=msg["content"])]
-                    )
-                )
-
-        # Add current question
-        contents.append(types.Content(role="user", parts=[types.Part.from_text(text=question)]))
+        # Build conversation context from the last 10 messages plus the current question
+        content_cls = types.Content
+        part_from_text = types.Part.from_text
+        contents = [
+            content_cls(role=msg["role"], parts=[part_from_text(text=msg["content"])])
+            for msg in (chat_history or [])[-10:]
+        ]
+        contents.append(content_cls(role="user", parts=[part_from_text(text=question)]))
 
-        # System instruction for search-focused assistant
-        system_instruction = self._build_system_instruction(meeting_context)
+        query_config = self._query_config(self._store_name, meeting_context)
 
         try:
             logger.debug("File Search query: %s", question)
@@ -208,16 +295,7 @@ class FileSearchManager:
                 response = self.client.models.generate_content(
                     model=model,
                     contents=contents,
-                    config=types.GenerateContentConfig(
-                        system_instruction=system_instruction,
-                        tools=[
-                            types.Tool(
-                                file_search=types.FileSearch(
-                                    file_search_store_names=[self._store_name]
-                                )
-                            )
-                        ],
-                    ),
+                    config=query_config,
                 )
             except Exception as e:
                 # If the configured model doesn't support tools, retry with the
@@ -239,16 +317,7 @@ class FileSearchManager:
                     response = self.client.models.generate_content(
                         model=GEMINI_MODEL_SEARCH,
                         contents=contents,
-                        config=types.GenerateContentConfig(
-                            system_instruction=system_instruction,
-                            tools=[
-                                types.Tool(
-                                    file_search=types.FileSearch(
-                                        file_search_store_names=[self._store_name]
-                                    )
-                                )
-                            ],
-                        ),
+                        config=query_config,
                     )
                 else:
                     raise
@@ -295,19 +364,32 @@ class FileSearchManager:
             logger.exception("File Search query failed")
             raise FileSearchError(f"Query failed: {e}") from e
 
+    def _query_config(
+        self, store_name: str, meeting_context: MeetingContext | None
+    ) -> types.GenerateContentConfig:
+        """Get the generate_content config for a query, reusing cached objects."""
+        if self._tools_store_name != store_name:
+            self._tools = [
+                types.Tool(file_search=types.FileSearch(file_search_store_names=[store_name]))
+            ]
+            self._tools_store_name = store_name
+            self._default_query_config = None
+
+        if meeting_context:
+            return types.GenerateContentConfig(
+                system_instruction=self._build_system_instruction(meeting_context),
+                tools=self._tools,
+            )
+
+        if self._default_query_config is None:
+            self._default_query_config = types.GenerateContentConfig(
+                system_instruction=SEARCH_SYSTEM_INSTRUCTION, tools=self._tools
+            )
+        return self._default_query_config
+
     def _build_system_instruction(self, meeting_context: MeetingContext | None) -> str:
         """Build the system instruction, optionally enriched with viewing context."""
-        base = (
-            "You are a helpful assistant for searching through meeting recordings and notes.\n"
-            "Your primary purpose is to help users find information from their past meetings.\n"
-            "When answering:\n"
-            "- Be concise and direct\n"
-            "- Cite specific meetings when referencing information\n"
-            "- If you can't find relevant information in the meetings, say so clearly\n"
-            "- Focus on facts from the meetings, not general knowledge\n"
-            "- When quoting, use the exact text from the transcript\n"
-            "- For questions about tasks, assignments, or requests, prioritize searching the 'Action Items' or 'Notes' sections."
-        )
+        base = SEARCH_SYSTEM_INSTRUCTION
 
         if not meeting_context:
             return base
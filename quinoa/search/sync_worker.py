@@ -1,14 +1,28 @@
 """Background worker for syncing meetings to Gemini File Search."""
 
 import contextlib
+import gzip
+import heapq
+import json
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import TYPE_CHECKING, Any
 
 from PyQt6.QtCore import QThread, pyqtSignal
 
-from quinoa.constants import FILE_SEARCH_POLL_INTERVAL_MS, MIN_SYNC_DURATION_SECONDS
-from quinoa.search.content_formatter import compute_content_hash, format_meeting_document
+from quinoa.config import config
+from quinoa.constants import (
+    FILE_SEARCH_POLL_INTERVAL_MS,
+    FILE_SEARCH_SYNC_CONCURRENCY,
+    MIN_SYNC_DURATION_SECONDS,
+)
+from quinoa.search.content_formatter import (
+    HASH_ALGORITHM_XXH3,
+    compute_content_hash,
+    format_and_hash,
+)
 from quinoa.search.file_search import FileSearchError, FileSearchManager
 
 if TYPE_CHECKING:
@@ -16,11 +30,18 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("quinoa")
 
+# Minimum gap between sync_progress signals during a batch
+PROGRESS_EMIT_INTERVAL_SECONDS = 0.1
+
 
 class SyncWorker(QThread):
-    """Background worker for syncing meetings to File Search."""
+    """Background worker for syncing meetings to File Search.
+
+    Eligible recordings are synced concurrently on a bounded thread pool,
+    since each upload is independent network I/O.
+    """
 
-    sync_completed = pyqtSignal(str)  # recording_id
+    sync_completed_batch = pyqtSignal(list)  # recording_ids synced in one pass
     sync_failed = pyqtSignal(str, str)  # recording_id, error
     sync_progress = pyqtSignal(int, int)  # current, total
     store_ready = pyqtSignal(str)  # store_name
@@ -36,7 +57,19 @@ class SyncWorker(QThread):
         self.file_search = file_search
         self.poll_interval_ms = poll_interval_ms
         self._running = True
-        self._pending_queue: list[tuple[str, float]] = []  # (rec_id, eligible_time)
+        # Min-heap of (eligible_time, rec_id). Re-queued recordings leave stale heap
+        # entries behind; _pending_times holds the live eligible time per recording.
+        self._pending_queue: list[tuple[float, str]] = []
+        self._pending_times: dict[str, float] = {}
+        self._queue_lock = threading.Lock()
+        # Set to wake the loop early (new item queued or stop requested)
+        self._wake_event = threading.Event()
+        # Serializes sync status writes from the pool threads
+        self._db_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=config.get("file_search_sync_concurrency") or FILE_SEARCH_SYNC_CONCURRENCY,
+            thread_name_prefix="quinoa-sync",
+        )
 
     def queue_for_sync(self, rec_id: str, delay_seconds: int = 300) -> None:
         """Queue a recording for delayed sync.
@@ -46,22 +79,42 @@ class SyncWorker(QThread):
             delay_seconds: Seconds to wait before syncing (default 5 min)
         """
         eligible_time = time.time() + delay_seconds
-        # Remove any existing entry for this recording
-        self._pending_queue = [(rid, t) for rid, t in self._pending_queue if rid != rec_id]
-        self._pending_queue.append((rec_id, eligible_time))
+        with self._queue_lock:
+            # Supersedes any existing entry for this recording
+            self._push_pending(rec_id, eligible_time)
+        self._wake_event.set()
         logger.debug("Queued %s for sync in %d seconds", rec_id, delay_seconds)
 
     def queue_all_unsynced(self) -> None:
         """Queue all unsynced recordings for immediate sync (backfill)."""
         unsynced = self.db.get_unsynced_recordings(MIN_SYNC_DURATION_SECONDS)
-        for recording in unsynced:
-            rec_id = recording["id"]
-            # Queue with no delay for backfill
-            self._pending_queue.append((rec_id, time.time()))
+        now = time.time()
+        with self._queue_lock:
+            for recording in unsynced:
+                # Queue with no delay for backfill
+                self._push_pending(recording["id"], now)
+        self._wake_event.set()
         logger.info("Queued %d recordings for backfill sync", len(unsynced))
 
+    def _push_pending(self, rec_id: str, eligible_time: float) -> None:
+        """Add a recording to the pending heap (caller holds _queue_lock)."""
+        self._pending_times[rec_id] = eligible_time
+        heapq.heappush(self._pending_queue, (eligible_time, rec_id))
+
+    def _drop_stale_head(self) -> None:
+        """Pop superseded entries off the top of the heap (caller holds _queue_lock)."""
+        queue = self._pending_queue
+        while queue and self._pending_times.get(queue[0][1]) != queue[0][0]:
+            heapq.heappop(queue)
+
     def run(self) -> None:
         """Main sync loop."""
+        try:
+            self._run_loop()
+        finally:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _run_loop(self) -> None:
         # Initialize store
         try:
             store_name = self.file_search.ensure_store_exists()
@@ -78,83 +131,156 @@ class SyncWorker(QThread):
                 # 2. Check pending queue for eligible items
                 self._process_pending_queue()
 
-                # 3. Sleep for poll interval
-                self.msleep(self.poll_interval_ms)
+                # An upload may have recreated a store that went missing
+                if self.file_search.store_name and self.file_search.store_name != store_name:
+                    store_name = self.file_search.store_name
+                    self.store_ready.emit(store_name)
+
+                # 3. Sleep until the next item is due or something wakes us
+                self._wait(self._next_wait_seconds())
 
             except Exception as e:
                 logger.error("Sync worker error: %s", e)
-                self.msleep(5000)  # Brief pause on error
+                self._wait(5.0)  # Brief pause on error
+
+    def _wait(self, timeout: float) -> None:
+        """Sleep for up to timeout seconds, returning early if woken."""
+        self._wake_event.wait(timeout)
+        self._wake_event.clear()
+
+    def _next_wait_seconds(self) -> float:
+        """Seconds until the next queued item is eligible, capped at the poll interval.
+
+        The cap keeps deletions marked in the database from waiting indefinitely.
+        """
+        wait = self.poll_interval_ms / 1000
+        with self._queue_lock:
+            self._drop_stale_head()
+            if self._pending_queue:
+                next_time = self._pending_queue[0][0]
+                wait = min(wait, max(0.0, next_time - time.time()))
+        return wait
 
     def _process_pending_queue(self) -> None:
         """Process recordings that have passed their delay period."""
         now = time.time()
-        ready = [(rid, t) for rid, t in self._pending_queue if t <= now]
-        self._pending_queue = [(rid, t) for rid, t in self._pending_queue if t > now]
+        ready: list[str] = []
+        with self._queue_lock:
+            self._drop_stale_head()
+            while self._pending_queue and self._pending_queue[0][0] <= now:
+                _, rec_id = heapq.heappop(self._pending_queue)
+                del self._pending_times[rec_id]
+                ready.append(rec_id)
+                self._drop_stale_head()
 
         total = len(ready)
-        for i, (rec_id, _) in enumerate(ready):
+        if not total:
+            return
+
+        futures = {self._executor.submit(self._sync_recording, rec_id): rec_id for rec_id in ready}
+        synced: list[str] = []
+        # Throttle progress signals so large backfills don't flood the GUI thread
+        step = max(1, total // 100)
+        last_emit = 0.0
+        for i, future in enumerate(as_completed(futures), start=1):
             if not self._running:
                 break
-            self.sync_progress.emit(i + 1, total)
-            self._sync_recording(rec_id)
+            if future.result():
+                synced.append(futures[future])
+            now = time.monotonic()
+            if i == total or i % step == 0 or now - last_emit > PROGRESS_EMIT_INTERVAL_SECONDS:
+                self.sync_progress.emit(i, total)
+                last_emit = now
+
+        if synced:
+            self.sync_completed_batch.emit(synced)
+
+    def _set_sync_status(self, rec_id: str, status: str, **kwargs: Any) -> None:
+        """Update sync status, serialized across pool threads."""
+        with self._db_lock:
+            self.db.set_sync_status(rec_id, status, **kwargs)
 
-    def _sync_recording(self, rec_id: str) -> None:
-        """Sync a single recording to File Search."""
+    def _sync_recording(self, rec_id: str) -> bool:
+        """Sync a single recording to File Search (runs on the thread pool).
+
+        Returns True if the recording was uploaded.
+        """
+        if not self._running:
+            return False
+        content_gz: bytes | None = None
+        source_updated_at: str | None = None
         try:
-            # Get recording data
-            recording = self.db.get_recording(rec_id)
-            if not recording:
+            # Nothing to do if no source rows changed since the last sync
+            if self.db.is_sync_up_to_date(rec_id):
+                logger.debug("Skipping %s - unchanged since last sync", rec_id)
+                return False
+
+            # Cheap presence check before loading transcript and notes
+            if not self.db.has_syncable_content(rec_id):
+                logger.debug("Skipping %s - no content to sync", rec_id)
+                return False
+
+            # Get recording data and related rows in one round-trip
+            bundle = self.db.get_sync_bundle(rec_id)
+            if not bundle:
                 logger.warning("Recording %s not found", rec_id)
-                return
+                return False
+            recording = bundle["recording"]
+            source_updated_at = recording.get("content_updated_at")
 
             # Skip short recordings
             duration = recording.get("duration_seconds", 0)
             if duration and duration < MIN_SYNC_DURATION_SECONDS:
                 logger.debug("Skipping %s - too short (%.1fs)", rec_id, duration)
-                return
+                return False
 
-            transcript = self.db.get_transcript(rec_id)
-            notes = self.db.get_notes(rec_id)
-            action_items = self.db.get_action_items(rec_id)
+            transcript = bundle["transcript"]
+            notes = bundle["notes"]
+            action_items = bundle["action_items"]
 
-            # Fetch folder and attendee metadata for richer documents
-            folder_name: str | None = None
+            # Folder and attendee metadata for richer documents
+            folder_name: str | None = bundle["folder_name"]
             attendees: list[dict[str, Any]] | None = None
-
-            folder_id = recording.get("folder_id")
-            if folder_id:
-                folder = self.db.get_folder(folder_id)
-                if folder:
-                    folder_name = folder.get("name")
-
-            event = self.db.get_event_for_recording(rec_id)
-            if event and event.get("attendees"):
-                import json
-
+            if bundle["attendees"]:
                 with contextlib.suppress(json.JSONDecodeError, TypeError):
-                    attendees = json.loads(event["attendees"])
-
-            # Skip if no meaningful content
-            if not transcript and not notes:
-                logger.debug("Skipping %s - no content to sync", rec_id)
-                return
-
-            # Format content
-            content = format_meeting_document(
-                recording,
-                transcript,
-                notes,
-                action_items,
-                folder_name=folder_name,
-                attendees=attendees,
-            )
-            content_hash = compute_content_hash(content)
+                    attendees = json.loads(bundle["attendees"])
+
+            # Reuse the cached document if it was built from the current source rows
+            # (e.g. retrying after a failed upload); otherwise format it
+            sync_status = bundle["sync_status"]
+            hash_algorithm = config.get("content_hash_algorithm", HASH_ALGORITHM_XXH3)
+            if (
+                sync_status
+                and sync_status.get("content_gz")
+                and sync_status.get("content_gz_source_updated_at") == source_updated_at
+            ):
+                content_gz = sync_status["content_gz"]
+                content = gzip.decompress(content_gz)
+                content_hash = compute_content_hash(content, hash_algorithm)
+            else:
+                content, content_hash = format_and_hash(
+                    recording,
+                    transcript,
+                    notes,
+                    action_items,
+                    folder_name=folder_name,
+                    attendees=attendees,
+                    algorithm=hash_algorithm,
+                )
+                content_gz = gzip.compress(content, compresslevel=1)
 
             # Check if already synced with same content
-            sync_status = self.db.get_sync_status(rec_id)
             if sync_status and sync_status.get("content_hash") == content_hash:
                 logger.debug("Skipping %s - content unchanged", rec_id)
-                return
+                if sync_status.get("sync_status") == "synced":
+                    # Record the freshness marker so the next check skips formatting
+                    self._set_sync_status(
+                        rec_id,
+                        "synced",
+                        source_updated_at=source_updated_at,
+                        content_gz=content_gz,
+                    )
+                return False
 
             # Delete old document before re-uploading (prevents duplicates)
             if sync_status and sync_status.get("file_search_file_name"):
@@ -166,35 +292,63 @@ class SyncWorker(QThread):
             file_name = self.file_search.upload_meeting(rec_id, content, meeting_date)
 
             # Update sync status
-            self.db.set_sync_status(
-                rec_id, "synced", file_name=file_name, content_hash=content_hash
+            self._set_sync_status(
+                rec_id,
+                "synced",
+                file_name=file_name,
+                content_hash=content_hash,
+                source_updated_at=source_updated_at,
+                content_gz=content_gz,
             )
 
-            self.sync_completed.emit(rec_id)
             logger.info("Synced recording %s", rec_id)
+            return True
 
         except FileSearchError as e:
             logger.error("Failed to sync %s: %s", rec_id, e)
-            self.db.set_sync_status(rec_id, "error", error=str(e))
+            self._set_sync_status(
+                rec_id,
+                "error",
+                error=str(e),
+                source_updated_at=source_updated_at,
+                content_gz=content_gz,
+            )
             self.sync_failed.emit(rec_id, str(e))
+            return False
         except Exception as e:
             logger.error("Unexpected error syncing %s: %s", rec_id, e)
-            self.db.set_sync_status(rec_id, "error", error=str(e))
+            self._set_sync_status(
+                rec_id,
+                "error",
+                error=str(e),
+                source_updated_at=source_updated_at,
+                content_gz=content_gz,
+            )
             self.sync_failed.emit(rec_id, str(e))
+            return False
 
     def _process_deletions(self) -> None:
         """Remove deleted recordings from File Search."""
-        pending_deletions = self.db.get_pending_deletions()
-        for record in pending_deletions:
-            rec_id = record["recording_id"]
-            file_name = record.get("file_search_file_name")
-            if file_name:
-                success = self.file_search.delete_meeting(file_name)
-                if success:
-                    # Remove from sync table
-                    self.db.set_sync_status(rec_id, "removed")
-                    logger.info("Removed %s from File Search", rec_id)
+        pending_deletions = [
+            (record["recording_id"], record["file_search_file_name"])
+            for record in self.db.get_pending_deletions()
+            if record.get("file_search_file_name")
+        ]
+        if not pending_deletions:
+            return
+
+        futures = {
+            self._executor.submit(self.file_search.delete_meeting, file_name): rec_id
+            for rec_id, file_name in pending_deletions
+        }
+        removed = [futures[future] for future in as_completed(futures) if future.result()]
+        if removed:
+            # Remove from sync table
+            with self._db_lock:
+                self.db.set_sync_status_many(removed, "removed")
+            logger.info("Removed %d recordings from File Search", len(removed))
 
     def stop(self) -> None:
         """Stop the sync worker."""
         self._running = False
+        self._wake_event.set()
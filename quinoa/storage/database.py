@@ -1,17 +1,173 @@
+import calendar
 import logging
 import os
 import sqlite3
 import threading
-from collections.abc import Generator
+import time
+from collections.abc import Callable, Generator, Iterator, Sequence
 from contextlib import contextmanager
-from datetime import datetime, timedelta
+from datetime import date, datetime
+from functools import cache
 from pathlib import Path
 from typing import Any
 
-from quinoa.constants import get_now
+from quinoa.constants import DB_OPTIMIZE_INTERVAL_COMMITS, get_now
 
 logger = logging.getLogger("quinoa")
 
+# Bookkeeping timestamps that nothing reads back (transcripts.created_at,
+# file_search_sync.last_synced_at, calendar_events.synced_at,
+# meeting_folders.created_at) are written as integer epoch seconds; rows written
+# before may still hold text.
+
+# SQL expression for the current time, used by change-tracking triggers
+_SQL_NOW = "strftime('%Y-%m-%d %H:%M:%f', 'now')"
+
+# Rows fetched per round-trip by the iter_* query methods
+_FETCH_BATCH_SIZE = 200
+
+# Applied to every new connection. WAL lets readers run alongside the writer, and
+# synchronous=NORMAL is durable in WAL mode while skipping the fsync per commit.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=30000",
+    "PRAGMA foreign_keys=ON",
+)
+_READ_CONNECTION_PRAGMAS = (
+    "PRAGMA query_only=ON",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=30000",
+)
+
+_UPSERT_CALENDAR_EVENT_SQL = """
+    INSERT INTO calendar_events
+        (event_id, calendar_id, title, start_time, end_time, start_ts, end_ts,
+         meet_link, attendees, organizer_email, etag, synced_at, recurring_event_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(event_id) DO UPDATE SET
+        calendar_id = excluded.calendar_id,
+        title = excluded.title,
+        start_time = excluded.start_time,
+        end_time = excluded.end_time,
+        start_ts = excluded.start_ts,
+        end_ts = excluded.end_ts,
+        meet_link = excluded.meet_link,
+        attendees = excluded.attendees,
+        organizer_email = excluded.organizer_email,
+        etag = excluded.etag,
+        synced_at = excluded.synced_at,
+        recurring_event_id = excluded.recurring_event_id,
+        hidden = COALESCE(calendar_events.hidden, 0)
+"""
+
+_INSERT_RECORDING_SQL = """
+    INSERT INTO recordings
+        (id, title, started_at, started_at_ts, mic_path, sys_path, status,
+         mic_device_id, mic_device_name, directory_path)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Calendar events joined with their linked recording's summary columns
+_CALENDAR_EVENT_SELECT = """
+    SELECT
+        ce.*,
+        r.id as rec_id,
+        r.title as rec_title,
+        r.duration_seconds as rec_duration,
+        r.status as rec_status
+    FROM calendar_events ce
+    LEFT JOIN recordings r ON ce.recording_id = r.id
+"""
+_PAST_CALENDAR_EVENTS_SQL = (
+    _CALENDAR_EVENT_SELECT
+    + """
+    WHERE ce.start_ts < ?
+      AND (ce.hidden IS NULL OR ce.hidden = 0)
+    ORDER BY ce.start_ts DESC
+"""
+)
+_CALENDAR_EVENTS_IN_RANGE_SQL = (
+    _CALENDAR_EVENT_SELECT
+    + """
+    WHERE ce.start_ts >= ? AND ce.start_ts < ?
+      AND (ce.hidden IS NULL OR ce.hidden = 0)
+    ORDER BY ce.start_ts ASC
+"""
+)
+_CALENDAR_EVENT_BY_ID_SQL = _CALENDAR_EVENT_SELECT + "WHERE ce.event_id = ?"
+
+# Looked up when a recording starts, to suggest the meeting to link
+_CURRENT_MEETING_SQL = """
+    SELECT * FROM calendar_events
+    WHERE (hidden IS NULL OR hidden = 0)
+      AND (start_ts BETWEEN ? AND ?
+           OR (start_ts <= ? AND end_ts >= ?))
+    ORDER BY start_ts ASC
+    LIMIT 1
+"""
+
+_INSERT_FOLDER_SQL = """
+    INSERT INTO meeting_folders
+    (id, name, parent_id, recurring_event_id, created_at, sort_order)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+
+@cache
+def _update_recording_sql(columns: tuple[str, ...]) -> str:
+    """Build (once per column combination) the UPDATE used by update_recording_status."""
+    assignments = ", ".join(f"{column} = ?" for column in columns)
+    return f"UPDATE recordings SET {assignments} WHERE id = ?"
+
+
+def _dict_rows(cursor: sqlite3.Cursor) -> list[dict[str, Any]]:
+    """Convert a cursor's remaining rows to dicts.
+
+    Zipping with the column names read once is cheaper than dict(row), which
+    looks each column up by name on every row.
+    """
+    names = [column[0] for column in cursor.description]
+    return [dict(zip(names, row, strict=True)) for row in cursor]
+
+
+def _epoch_seconds(dt: datetime) -> int:
+    """Convert a datetime to the epoch seconds SQLite's strftime('%s') gives its text.
+
+    Naive datetimes are taken as-is (as if UTC), matching how SQLite reads the
+    stored naive timestamps.
+    """
+    return calendar.timegm(dt.utctimetuple())
+
+
+def _event_epoch(dt: datetime) -> int:
+    """Convert a calendar event time or query bound to calendar_events.start_ts/end_ts.
+
+    Aware times from the Calendar API convert exactly; naive ones are local time,
+    as returned by get_now().
+    """
+    return int(dt.timestamp())
+
+
+def _fts_prefix_query(query: str, min_token_length: int) -> str:
+    """Build an FTS5 MATCH expression requiring every word as a quoted prefix.
+
+    Quoting each word keeps user input from being parsed as FTS5 operators.
+    """
+    tokens = [token for token in query.split() if len(token) >= min_token_length]
+    return " ".join('"{}"*'.format(token.replace('"', '""')) for token in tokens)
+
+
+def _like_substring(token: str) -> str:
+    """Build a LIKE pattern (ESCAPE '\\') matching token anywhere in the text."""
+    escaped = token.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
 
 class Database:
     """SQLite database with connection pooling.
@@ -20,6 +176,9 @@ class Database:
     The connection is created lazily on first use.
     """
 
+    # Stored in PRAGMA user_version; bump it and add a migration on schema changes
+    SCHEMA_VERSION = 8
+
     def __init__(self, db_path: str | Path | None = None) -> None:
         if not db_path:
             data_dir = os.path.expanduser("~/.local/share/quinoa")
@@ -37,10 +196,42 @@ class Database:
                 self.db_path,
                 check_same_thread=False,
                 timeout=30.0,
+                cached_statements=256,
+                # Writes take the write lock up front (BEGIN IMMEDIATE), so a busy
+                # database waits on busy_timeout instead of failing mid-transaction
+                isolation_level="IMMEDIATE",
             )
+            for pragma in _CONNECTION_PRAGMAS:
+                self._local.conn.execute(pragma)
+            self._local.commits = 0
             self._local.conn.row_factory = sqlite3.Row
         return self._local.conn  # type: ignore[no-any-return]
 
+    def _get_read_connection(self) -> sqlite3.Connection:
+        """Get or create a read-only connection for the current thread.
+
+        Under WAL, reads on this connection don't wait on the write connection,
+        so background writers (calendar and transcript saves) don't stall UI reads.
+        """
+        if getattr(self._local, "read_conn", None) is None:
+            self._get_connection()  # Ensure the database file and WAL mode exist
+            self._local.read_conn = sqlite3.connect(
+                f"{Path(self.db_path).resolve().as_uri()}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+                timeout=30.0,
+                cached_statements=256,
+            )
+            for pragma in _READ_CONNECTION_PRAGMAS:
+                self._local.read_conn.execute(pragma)
+            self._local.read_conn.row_factory = sqlite3.Row
+        return self._local.read_conn  # type: ignore[no-any-return]
+
+    @contextmanager
+    def _read_conn(self) -> Generator[sqlite3.Connection, None, None]:
+        """Context manager for SELECT-only operations on the read-only connection."""
+        yield self._get_read_connection()
+
     @contextmanager
     def _conn(self) -> Generator[sqlite3.Connection, None, None]:
         """Context manager for database operations with auto-commit."""
@@ -51,233 +242,535 @@ class Database:
         except Exception:
             conn.rollback()
             raise
+        # Periodically refresh planner statistics on long-lived connections
+        self._local.commits += 1
+        if self._local.commits >= DB_OPTIMIZE_INTERVAL_COMMITS:
+            self._local.commits = 0
+            self._optimize(conn)
+
+    def _iter_rows(self, sql: str, params: Sequence[Any] = ()) -> Iterator[dict[str, Any]]:
+        """Yield the rows of a read-only query as dicts, fetching in batches.
+
+        Uses the read-only connection, so callers that stop iterating early
+        leave no transaction open on the writer.
+        """
+        cursor = self._get_read_connection().execute(sql, params)
+        cursor.arraysize = _FETCH_BATCH_SIZE
+        names = [column[0] for column in cursor.description]
+        try:
+            while rows := cursor.fetchmany():
+                yield from (dict(zip(names, row, strict=True)) for row in rows)
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def _optimize(conn: sqlite3.Connection) -> None:
+        """Run PRAGMA optimize, which only re-analyzes tables that need it."""
+        try:
+            conn.execute("PRAGMA optimize")
+        except sqlite3.Error as e:
+            logger.debug("PRAGMA optimize failed: %s", e)
 
     def close(self) -> None:
-        """Close the connection for the current thread."""
+        """Close the connections for the current thread."""
+        if getattr(self._local, "read_conn", None) is not None:
+            self._local.read_conn.close()
+            self._local.read_conn = None
         if hasattr(self._local, "conn") and self._local.conn is not None:
+            self._optimize(self._local.conn)
             self._local.conn.close()
             self._local.conn = None
 
     def _init_db(self) -> None:
+        """Create or migrate the schema, skipping all DDL when already current."""
         with self._conn() as conn:
-            # Create table with full schema
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS recordings (
-                    id TEXT PRIMARY KEY,
-                    title TEXT,
-                    started_at TIMESTAMP,
-                    ended_at TIMESTAMP,
-                    duration_seconds REAL,
-                    mic_path TEXT,
-                    sys_path TEXT,
-                    stereo_path TEXT,
-                    status TEXT,
-                    mic_device_id TEXT,
-                    mic_device_name TEXT,
-                    directory_path TEXT
-                )
-            """)
-
-            # Check for missing columns (migration for existing DBs)
-            cursor = conn.execute("PRAGMA table_info(recordings)")
-            columns = [row[1] for row in cursor.fetchall()]
-
-            if "ended_at" not in columns:
-                conn.execute("ALTER TABLE recordings ADD COLUMN ended_at TIMESTAMP")
-            if "mic_device_id" not in columns:
-                conn.execute("ALTER TABLE recordings ADD COLUMN mic_device_id TEXT")
-            if "mic_device_name" not in columns:
-                conn.execute("ALTER TABLE recordings ADD COLUMN mic_device_name TEXT")
-            if "directory_path" not in columns:
-                conn.execute("ALTER TABLE recordings ADD COLUMN directory_path TEXT")
-            if "notes" not in columns:
-                conn.execute("ALTER TABLE recordings ADD COLUMN notes TEXT DEFAULT ''")
-            if "enhanced_notes" not in columns:
-                conn.execute("ALTER TABLE recordings ADD COLUMN enhanced_notes TEXT")
-            if "folder_id" not in columns:
-                conn.execute(
-                    "ALTER TABLE recordings ADD COLUMN folder_id TEXT REFERENCES meeting_folders(id)"
-                )
-
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS meeting_folders (
-                    id TEXT PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    parent_id TEXT,
-                    recurring_event_id TEXT,
-                    created_at TIMESTAMP,
-                    sort_order INTEGER DEFAULT 0,
-                    FOREIGN KEY(parent_id) REFERENCES meeting_folders(id)
-                )
-            """)
-
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS speaker_profiles (
-                    name TEXT PRIMARY KEY,
-                    usage_count INTEGER DEFAULT 1,
-                    last_used_at TIMESTAMP
-                )
-            """)
-
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS transcripts (
-                    recording_id TEXT PRIMARY KEY,
-                    text TEXT,
-                    summary TEXT,
-                    utterances TEXT,
-                    speaker_names TEXT,
-                    created_at TIMESTAMP,
-                    FOREIGN KEY(recording_id) REFERENCES recordings(id)
-                )
-            """)
-
-            # Migration for existing transcripts table
-            cursor = conn.execute("PRAGMA table_info(transcripts)")
-            transcript_columns = [row[1] for row in cursor.fetchall()]
-            if "utterances" not in transcript_columns:
-                conn.execute("ALTER TABLE transcripts ADD COLUMN utterances TEXT")
-            if "speaker_names" not in transcript_columns:
-                conn.execute("ALTER TABLE transcripts ADD COLUMN speaker_names TEXT")
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS action_items (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    recording_id TEXT NOT NULL,
-                    text TEXT NOT NULL,
-                    assignee TEXT,
-                    status TEXT DEFAULT 'open',
-                    FOREIGN KEY(recording_id) REFERENCES recordings(id)
-                )
-            """)
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version >= self.SCHEMA_VERSION:
+                return
+            for target_version, migrate in self._migrations():
+                if target_version > version:
+                    migrate(conn)
+            conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            # Give the planner statistics for the migrated schema
+            conn.execute("ANALYZE")
+
+    def _migrations(self) -> list[tuple[int, Callable[[sqlite3.Connection], None]]]:
+        """Schema migrations in order, keyed by the user_version they produce."""
+        return [
+            (1, self._create_schema),
+            (2, self._add_recordings_fts),
+            (3, self._add_lookup_indexes),
+            (4, self._cascade_recording_deletes),
+            (5, self._add_started_at_epoch),
+            (6, self._add_unsynced_lookup_indexes),
+            (7, self._add_event_window_indexes),
+            (8, self._add_event_epoch_columns),
+        ]
+
+    def _create_schema(self, conn: sqlite3.Connection) -> None:
+        """Create the base schema (version 1).
+
+        Idempotent, so databases created before user_version tracking are brought
+        up to date by the same column and trigger checks.
+        """
+        # Create table with full schema
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS recordings (
+                id TEXT PRIMARY KEY,
+                title TEXT,
+                started_at TIMESTAMP,
+                ended_at TIMESTAMP,
+                duration_seconds REAL,
+                mic_path TEXT,
+                sys_path TEXT,
+                stereo_path TEXT,
+                status TEXT,
+                mic_device_id TEXT,
+                mic_device_name TEXT,
+                directory_path TEXT
+            )
+        """)
+
+        # Check for missing columns (migration for existing DBs)
+        cursor = conn.execute("PRAGMA table_info(recordings)")
+        columns = [row[1] for row in cursor.fetchall()]
+
+        if "ended_at" not in columns:
+            conn.execute("ALTER TABLE recordings ADD COLUMN ended_at TIMESTAMP")
+        if "mic_device_id" not in columns:
+            conn.execute("ALTER TABLE recordings ADD COLUMN mic_device_id TEXT")
+        if "mic_device_name" not in columns:
+            conn.execute("ALTER TABLE recordings ADD COLUMN mic_device_name TEXT")
+        if "directory_path" not in columns:
+            conn.execute("ALTER TABLE recordings ADD COLUMN directory_path TEXT")
+        if "notes" not in columns:
+            conn.execute("ALTER TABLE recordings ADD COLUMN notes TEXT DEFAULT ''")
+        if "enhanced_notes" not in columns:
+            conn.execute("ALTER TABLE recordings ADD COLUMN enhanced_notes TEXT")
+        if "folder_id" not in columns:
+            conn.execute(
+                "ALTER TABLE recordings ADD COLUMN folder_id TEXT REFERENCES meeting_folders(id)"
+            )
 
-            # File Search sync tracking
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS file_search_sync (
-                    recording_id TEXT PRIMARY KEY,
-                    file_search_file_name TEXT,
-                    last_synced_at TIMESTAMP,
-                    content_hash TEXT,
-                    sync_status TEXT DEFAULT 'pending',
-                    error_message TEXT,
-                    FOREIGN KEY(recording_id) REFERENCES recordings(id)
-                )
-            """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS meeting_folders (
+                id TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                parent_id TEXT,
+                recurring_event_id TEXT,
+                created_at TIMESTAMP,
+                sort_order INTEGER DEFAULT 0,
+                FOREIGN KEY(parent_id) REFERENCES meeting_folders(id)
+            )
+        """)
 
-            # FTS5 Search Table
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS speaker_profiles (
+                name TEXT PRIMARY KEY,
+                usage_count INTEGER DEFAULT 1,
+                last_used_at TIMESTAMP
+            )
+        """)
+
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS transcripts (
+                recording_id TEXT PRIMARY KEY,
+                text TEXT,
+                summary TEXT,
+                utterances TEXT,
+                speaker_names TEXT,
+                created_at TIMESTAMP,
+                FOREIGN KEY(recording_id) REFERENCES recordings(id) ON DELETE CASCADE
+            )
+        """)
+
+        # Migration for existing transcripts table
+        cursor = conn.execute("PRAGMA table_info(transcripts)")
+        transcript_columns = [row[1] for row in cursor.fetchall()]
+        if "utterances" not in transcript_columns:
+            conn.execute("ALTER TABLE transcripts ADD COLUMN utterances TEXT")
+        if "speaker_names" not in transcript_columns:
+            conn.execute("ALTER TABLE transcripts ADD COLUMN speaker_names TEXT")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS action_items (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                recording_id TEXT NOT NULL,
+                text TEXT NOT NULL,
+                assignee TEXT,
+                status TEXT DEFAULT 'open',
+                FOREIGN KEY(recording_id) REFERENCES recordings(id) ON DELETE CASCADE
+            )
+        """)
+
+        # File Search sync tracking
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS file_search_sync (
+                recording_id TEXT PRIMARY KEY,
+                file_search_file_name TEXT,
+                last_synced_at TIMESTAMP,
+                content_hash TEXT,
+                sync_status TEXT DEFAULT 'pending',
+                error_message TEXT,
+                FOREIGN KEY(recording_id) REFERENCES recordings(id) ON DELETE CASCADE
+            )
+        """)
+
+        # FTS5 search index over transcripts. External-content mode reads text from
+        # the transcripts table instead of storing a second copy of every transcript.
+        cursor = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'transcripts_fts'"
+        )
+        row = cursor.fetchone()
+        rebuild_fts = row is None or "content=" not in row[0]
+        if rebuild_fts:
+            # Migration: drop the standalone index and its triggers
+            conn.execute("DROP TRIGGER IF EXISTS transcripts_ai")
+            conn.execute("DROP TRIGGER IF EXISTS transcripts_ad")
+            conn.execute("DROP TRIGGER IF EXISTS transcripts_au")
+            conn.execute("DROP TABLE IF EXISTS transcripts_fts")
             conn.execute("""
-                CREATE VIRTUAL TABLE IF NOT EXISTS transcripts_fts USING fts5(
-                    recording_id UNINDEXED,
+                CREATE VIRTUAL TABLE transcripts_fts USING fts5(
                     text,
-                    summary
+                    summary,
+                    content='transcripts',
+                    content_rowid='rowid'
                 )
             """)
 
-            # Triggers to keep FTS index updated
-            conn.execute("""
-                CREATE TRIGGER IF NOT EXISTS transcripts_ai AFTER INSERT ON transcripts BEGIN
-                  INSERT INTO transcripts_fts(recording_id, text, summary)
-                  VALUES (new.recording_id, new.text, new.summary);
-                END;
-            """)
-            conn.execute("""
-                CREATE TRIGGER IF NOT EXISTS transcripts_ad AFTER DELETE ON transcripts BEGIN
-                  DELETE FROM transcripts_fts WHERE recording_id = old.recording_id;
-                END;
-            """)
-            conn.execute("""
-                CREATE TRIGGER IF NOT EXISTS transcripts_au AFTER UPDATE ON transcripts BEGIN
-                  UPDATE transcripts_fts SET text = new.text, summary = new.summary
-                  WHERE recording_id = new.recording_id;
-                END;
-            """)
+        # Triggers to keep FTS index updated
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS transcripts_ai AFTER INSERT ON transcripts BEGIN
+              INSERT INTO transcripts_fts(rowid, text, summary)
+              VALUES (new.rowid, new.text, new.summary);
+            END;
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS transcripts_ad AFTER DELETE ON transcripts BEGIN
+              INSERT INTO transcripts_fts(transcripts_fts, rowid, text, summary)
+              VALUES ('delete', old.rowid, old.text, old.summary);
+            END;
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS transcripts_au
+            AFTER UPDATE OF text, summary ON transcripts BEGIN
+              INSERT INTO transcripts_fts(transcripts_fts, rowid, text, summary)
+              VALUES ('delete', old.rowid, old.text, old.summary);
+              INSERT INTO transcripts_fts(rowid, text, summary)
+              VALUES (new.rowid, new.text, new.summary);
+            END;
+        """)
+
+        if rebuild_fts:
+            # Index any transcripts that already exist
+            conn.execute("INSERT INTO transcripts_fts(transcripts_fts) VALUES ('rebuild')")
+
+        # Chat history for AI assistant
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS chat_history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                session_id TEXT NOT NULL,
+                role TEXT NOT NULL,
+                content TEXT NOT NULL,
+                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                citations TEXT
+            )
+        """)
+
+        # Calendar events for meetings-first integration
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS calendar_events (
+                event_id TEXT PRIMARY KEY,
+                calendar_id TEXT DEFAULT 'primary',
+                title TEXT NOT NULL,
+                start_time TIMESTAMP NOT NULL,
+                end_time TIMESTAMP NOT NULL,
+                meet_link TEXT,
+                attendees TEXT,
+                organizer_email TEXT,
+                etag TEXT,
+                synced_at TIMESTAMP,
+                recording_id TEXT,
+                hidden INTEGER DEFAULT 0,
+                notes TEXT DEFAULT '',
+                FOREIGN KEY(recording_id) REFERENCES recordings(id)
+            )
+        """)
+
+        # Check for missing hidden/notes columns (migration)
+        cursor = conn.execute("PRAGMA table_info(calendar_events)")
+        columns = [row[1] for row in cursor.fetchall()]
+        if "hidden" not in columns:
+            conn.execute("ALTER TABLE calendar_events ADD COLUMN hidden INTEGER DEFAULT 0")
+        if "notes" not in columns:
+            conn.execute("ALTER TABLE calendar_events ADD COLUMN notes TEXT DEFAULT ''")
+        if "folder_id" not in columns:
+            conn.execute(
+                "ALTER TABLE calendar_events ADD COLUMN folder_id TEXT REFERENCES meeting_folders(id)"
+            )
+        if "recurring_event_id" not in columns:
+            conn.execute("ALTER TABLE calendar_events ADD COLUMN recurring_event_id TEXT")
+
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_calendar_events_recording
+            ON calendar_events(recording_id)
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_calendar_events_recurring
+            ON calendar_events(recurring_event_id)
+        """)
+
+        # Track when a recording's synced content last changed, so File Search
+        # sync can skip formatting/hashing recordings that haven't changed
+        cursor = conn.execute("PRAGMA table_info(recordings)")
+        columns = [row[1] for row in cursor.fetchall()]
+        if "content_updated_at" not in columns:
+            conn.execute("ALTER TABLE recordings ADD COLUMN content_updated_at TIMESTAMP")
+            conn.execute(
+                f"UPDATE recordings SET content_updated_at = {_SQL_NOW} "
+                "WHERE content_updated_at IS NULL"
+            )
+        cursor = conn.execute("PRAGMA table_info(file_search_sync)")
+        columns = [row[1] for row in cursor.fetchall()]
+        if "source_updated_at" not in columns:
+            conn.execute("ALTER TABLE file_search_sync ADD COLUMN source_updated_at TIMESTAMP")
+        # Last formatted document (gzip) and the content_updated_at it was built from
+        if "content_gz" not in columns:
+            conn.execute("ALTER TABLE file_search_sync ADD COLUMN content_gz BLOB")
+        if "content_gz_source_updated_at" not in columns:
+            conn.execute(
+                "ALTER TABLE file_search_sync ADD COLUMN content_gz_source_updated_at TIMESTAMP"
+            )
 
-            # Populate FTS if empty but transcripts exist (migration)
-            cursor = conn.execute("SELECT count(*) FROM transcripts_fts")
-            if cursor.fetchone()[0] == 0:
-                conn.execute(
-                    "INSERT INTO transcripts_fts(recording_id, text, summary) SELECT recording_id, text, summary FROM transcripts"
-                )
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS recordings_content_ai AFTER INSERT ON recordings BEGIN
+              UPDATE recordings SET content_updated_at = {_SQL_NOW} WHERE id = new.id;
+            END;
+        """)
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS recordings_content_au
+            AFTER UPDATE OF title, started_at, duration_seconds, notes, folder_id ON recordings
+            BEGIN
+              UPDATE recordings SET content_updated_at = {_SQL_NOW} WHERE id = new.id;
+            END;
+        """)
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS transcripts_content_ai AFTER INSERT ON transcripts BEGIN
+              UPDATE recordings SET content_updated_at = {_SQL_NOW} WHERE id = new.recording_id;
+            END;
+        """)
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS transcripts_content_au
+            AFTER UPDATE OF text, summary ON transcripts BEGIN
+              UPDATE recordings SET content_updated_at = {_SQL_NOW} WHERE id = new.recording_id;
+            END;
+        """)
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS transcripts_content_ad AFTER DELETE ON transcripts BEGIN
+              UPDATE recordings SET content_updated_at = {_SQL_NOW} WHERE id = old.recording_id;
+            END;
+        """)
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS action_items_content_ai AFTER INSERT ON action_items BEGIN
+              UPDATE recordings SET content_updated_at = {_SQL_NOW} WHERE id = new.recording_id;
+            END;
+        """)
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS action_items_content_au AFTER UPDATE ON action_items BEGIN
+              UPDATE recordings SET content_updated_at = {_SQL_NOW} WHERE id = new.recording_id;
+            END;
+        """)
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS action_items_content_ad AFTER DELETE ON action_items BEGIN
+              UPDATE recordings SET content_updated_at = {_SQL_NOW} WHERE id = old.recording_id;
+            END;
+        """)
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS meeting_folders_content_au
+            AFTER UPDATE OF name ON meeting_folders BEGIN
+              UPDATE recordings SET content_updated_at = {_SQL_NOW} WHERE folder_id = new.id;
+            END;
+        """)
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS calendar_events_content_au
+            AFTER UPDATE OF attendees, recording_id ON calendar_events
+            WHEN old.attendees IS NOT new.attendees OR old.recording_id IS NOT new.recording_id
+            BEGIN
+              UPDATE recordings SET content_updated_at = {_SQL_NOW}
+              WHERE id IN (old.recording_id, new.recording_id);
+            END;
+        """)
+
+        # Notifications already shown, so worker restarts don't repeat them
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS notified_events (
+                date TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                event_id TEXT NOT NULL,
+                PRIMARY KEY(date, kind, event_id)
+            )
+        """)
 
-            # Chat history for AI assistant
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS chat_history (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    session_id TEXT NOT NULL,
-                    role TEXT NOT NULL,
-                    content TEXT NOT NULL,
-                    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    citations TEXT
-                )
-            """)
+    def _add_recordings_fts(self, conn: sqlite3.Connection) -> None:
+        """Index recording titles in FTS5 (version 2).
 
-            # Calendar events for meetings-first integration
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS calendar_events (
-                    event_id TEXT PRIMARY KEY,
-                    calendar_id TEXT DEFAULT 'primary',
-                    title TEXT NOT NULL,
-                    start_time TIMESTAMP NOT NULL,
-                    end_time TIMESTAMP NOT NULL,
-                    meet_link TEXT,
-                    attendees TEXT,
-                    organizer_email TEXT,
-                    etag TEXT,
-                    synced_at TIMESTAMP,
-                    recording_id TEXT,
-                    hidden INTEGER DEFAULT 0,
-                    notes TEXT DEFAULT '',
-                    FOREIGN KEY(recording_id) REFERENCES recordings(id)
-                )
-            """)
+        The trigram tokenizer matches substrings case-insensitively, like the
+        title LIKE '%query%' scan it replaces.
+        """
+        conn.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS recordings_fts USING fts5(
+                title,
+                content='recordings',
+                content_rowid='rowid',
+                tokenize='trigram'
+            )
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS recordings_fts_ai AFTER INSERT ON recordings BEGIN
+              INSERT INTO recordings_fts(rowid, title) VALUES (new.rowid, new.title);
+            END;
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS recordings_fts_ad AFTER DELETE ON recordings BEGIN
+              INSERT INTO recordings_fts(recordings_fts, rowid, title)
+              VALUES ('delete', old.rowid, old.title);
+            END;
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS recordings_fts_au AFTER UPDATE OF title ON recordings BEGIN
+              INSERT INTO recordings_fts(recordings_fts, rowid, title)
+              VALUES ('delete', old.rowid, old.title);
+              INSERT INTO recordings_fts(rowid, title) VALUES (new.rowid, new.title);
+            END;
+        """)
+        conn.execute("INSERT INTO recordings_fts(recordings_fts) VALUES ('rebuild')")
+
+    def _add_lookup_indexes(self, conn: sqlite3.Connection) -> None:
+        """Index the columns recording lists and sync queries filter on (version 3)."""
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_recordings_started_at
+            ON recordings(started_at DESC)
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_recordings_status_started
+            ON recordings(status, started_at DESC)
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_file_search_sync_status
+            ON file_search_sync(sync_status)
+        """)
+
+    def _cascade_recording_deletes(self, conn: sqlite3.Connection) -> None:
+        """Make rows owned by a recording cascade on delete (version 4).
+
+        SQLite can't alter a foreign key, so older tables are rebuilt from their
+        stored schema with ON DELETE CASCADE added. Rowids are preserved because
+        transcripts_fts is keyed on them.
+        """
+        # Dangling references would fail foreign key checks once enforced
+        conn.execute(
+            "UPDATE calendar_events SET recording_id = NULL "
+            "WHERE recording_id NOT IN (SELECT id FROM recordings)"
+        )
+        for table in ("transcripts", "action_items", "file_search_sync"):
+            foreign_keys = conn.execute(f"PRAGMA foreign_key_list({table})").fetchall()
+            if all(fk[6] == "CASCADE" for fk in foreign_keys if fk[2] == "recordings"):
+                continue
+            conn.execute(
+                f"DELETE FROM {table} WHERE recording_id NOT IN (SELECT id FROM recordings)"
+            )
+            table_sql = conn.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+            ).fetchone()[0]
+            table_sql = table_sql.replace(
+                f"CREATE TABLE {table} (", f"CREATE TABLE {table}_new (", 1
+            ).replace("REFERENCES recordings(id)", "REFERENCES recordings(id) ON DELETE CASCADE")
+            columns = ", ".join(row[1] for row in conn.execute(f"PRAGMA table_info({table})"))
+            conn.execute(table_sql)
+            conn.execute(
+                f"INSERT INTO {table}_new (rowid, {columns}) SELECT rowid, {columns} FROM {table}"
+            )
+            conn.execute(f"DROP TABLE {table}")
+            conn.execute(f"ALTER TABLE {table}_new RENAME TO {table}")
 
-            # Check for missing hidden/notes columns (migration)
-            cursor = conn.execute("PRAGMA table_info(calendar_events)")
-            columns = [row[1] for row in cursor.fetchall()]
-            if "hidden" not in columns:
-                conn.execute("ALTER TABLE calendar_events ADD COLUMN hidden INTEGER DEFAULT 0")
-            if "notes" not in columns:
-                conn.execute("ALTER TABLE calendar_events ADD COLUMN notes TEXT DEFAULT ''")
-            if "folder_id" not in columns:
-                conn.execute(
-                    "ALTER TABLE calendar_events ADD COLUMN folder_id TEXT REFERENCES meeting_folders(id)"
-                )
-            if "recurring_event_id" not in columns:
-                conn.execute("ALTER TABLE calendar_events ADD COLUMN recurring_event_id TEXT")
+        # Dropping the old tables also dropped their triggers and indexes
+        self._create_schema(conn)
+        self._add_lookup_indexes(conn)
 
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_calendar_events_start
-                ON calendar_events(start_time)
-            """)
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_calendar_events_recording
-                ON calendar_events(recording_id)
-            """)
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_calendar_events_recurring
-                ON calendar_events(recurring_event_id)
-            """)
+    def _add_started_at_epoch(self, conn: sqlite3.Connection) -> None:
+        """Add an integer epoch copy of recordings.started_at (version 5).
+
+        started_at stays as text for display; range queries compare the integer.
+        """
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(recordings)")]
+        if "started_at_ts" not in columns:
+            conn.execute("ALTER TABLE recordings ADD COLUMN started_at_ts INTEGER")
+        conn.execute(
+            "UPDATE recordings SET started_at_ts = CAST(strftime('%s', started_at) AS INTEGER) "
+            "WHERE started_at_ts IS NULL"
+        )
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_recordings_started_at_ts
+            ON recordings(started_at_ts DESC)
+        """)
+
+    def _add_unsynced_lookup_indexes(self, conn: sqlite3.Connection) -> None:
+        """Cover the filters and join in get_unsynced_recordings (version 6)."""
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_file_search_sync_rec_status
+            ON file_search_sync(recording_id, sync_status)
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_recordings_status_duration
+            ON recordings(status, duration_seconds)
+        """)
+
+    def _add_event_window_indexes(self, conn: sqlite3.Connection) -> None:
+        """Index visible events by time and folders by display order (version 7)."""
+        # Partial index matching the hidden filter used by the calendar queries
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_events_time
+            ON calendar_events(start_time, end_time)
+            WHERE hidden IS NULL OR hidden = 0
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_folders_sort
+            ON meeting_folders(sort_order, name)
+        """)
+
+    def _add_event_epoch_columns(self, conn: sqlite3.Connection) -> None:
+        """Add integer epoch copies of calendar event times (version 8).
+
+        start_time/end_time stay as text for display. Their stored UTC offsets
+        made text comparison against local query bounds unreliable; strftime('%s')
+        applies the offset, so the backfilled integers compare exactly.
+        """
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(calendar_events)")]
+        if "start_ts" not in columns:
+            conn.execute("ALTER TABLE calendar_events ADD COLUMN start_ts INTEGER")
+        if "end_ts" not in columns:
+            conn.execute("ALTER TABLE calendar_events ADD COLUMN end_ts INTEGER")
+        conn.execute(
+            "UPDATE calendar_events SET "
+            "start_ts = CAST(strftime('%s', start_time) AS INTEGER), "
+            "end_ts = CAST(strftime('%s', end_time) AS INTEGER) "
+            "WHERE start_ts IS NULL OR end_ts IS NULL"
+        )
+        # The time queries now filter and sort on the integers only
+        conn.execute("DROP INDEX IF EXISTS idx_calendar_events_start")
+        conn.execute("DROP INDEX IF EXISTS idx_events_time")
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_events_time
+            ON calendar_events(start_ts, end_ts)
+            WHERE hidden IS NULL OR hidden = 0
+        """)
 
     def get_all_past_calendar_events(self) -> list[dict[str, Any]]:
         """Get all past calendar events (for history view)."""
-        now = get_now()
-        with self._conn() as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                """
-                SELECT
-                    ce.*,
-                    r.id as rec_id,
-                    r.title as rec_title,
-                    r.duration_seconds as rec_duration,
-                    r.status as rec_status
-                FROM calendar_events ce
-                LEFT JOIN recordings r ON ce.recording_id = r.id
-                WHERE ce.start_time < ?
-                  AND (ce.hidden IS NULL OR ce.hidden = 0)
-                ORDER BY ce.start_time DESC
-                """,
-                (now,),
-            )
-            return [dict(row) for row in cursor.fetchall()]
+        return list(self.iter_all_past_calendar_events())
+
+    def iter_all_past_calendar_events(self) -> Iterator[dict[str, Any]]:
+        """Yield past calendar events, newest first, with recording info."""
+        return self._iter_rows(_PAST_CALENDAR_EVENTS_SQL, (_event_epoch(get_now()),))
 
     def add_recording(
         self,
@@ -292,11 +785,12 @@ class Database:
     ) -> None:
         with self._conn() as conn:
             conn.execute(
-                "INSERT INTO recordings (id, title, started_at, mic_path, sys_path, status, mic_device_id, mic_device_name, directory_path) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                _INSERT_RECORDING_SQL,
                 (
                     rec_id,
                     title,
                     started_at,
+                    _epoch_seconds(started_at),
                     str(mic_path),
                     str(sys_path),
                     "recording",
@@ -314,26 +808,21 @@ class Database:
         stereo_path: str | Path | None = None,
         ended_at: datetime | None = None,
     ) -> None:
-        with self._conn() as conn:
-            updates = ["status = ?"]
-            params: list[Any] = [status]
-
-            if duration is not None:
-                updates.append("duration_seconds = ?")
-                params.append(duration)
-
-            if ended_at is not None:
-                updates.append("ended_at = ?")
-                params.append(ended_at)
+        columns = ["status"]
+        params: list[Any] = [status]
+        if duration is not None:
+            columns.append("duration_seconds")
+            params.append(duration)
+        if ended_at is not None:
+            columns.append("ended_at")
+            params.append(ended_at)
+        if stereo_path is not None:
+            columns.append("stereo_path")
+            params.append(str(stereo_path))
+        params.append(rec_id)
 
-            if stereo_path is not None:
-                updates.append("stereo_path = ?")
-                params.append(str(stereo_path))
-
-            params.append(rec_id)
-
-            query = f"UPDATE recordings SET {', '.join(updates)} WHERE id = ?"
-            conn.execute(query, params)
+        with self._conn() as conn:
+            conn.execute(_update_recording_sql(tuple(columns)), params)
 
     def update_recording_paths(
         self,
@@ -363,113 +852,160 @@ class Database:
         utterances: str | None = None,
     ) -> None:
         """Save transcript with optional utterances JSON."""
+        # Upsert rather than INSERT OR REPLACE: REPLACE deletes the old row without
+        # firing delete triggers, which would leave stale entries in transcripts_fts
         with self._conn() as conn:
             conn.execute(
-                """INSERT OR REPLACE INTO transcripts
+                """INSERT INTO transcripts
                    (recording_id, text, summary, utterances, created_at)
-                   VALUES (?, ?, ?, ?, ?)""",
-                (rec_id, text, summary, utterances, datetime.now()),
+                   VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT(recording_id) DO UPDATE SET
+                       text = excluded.text,
+                       summary = excluded.summary,
+                       utterances = excluded.utterances,
+                       speaker_names = NULL,
+                       created_at = excluded.created_at""",
+                (rec_id, text, summary, utterances, int(time.time())),
             )
 
     def get_recordings(self) -> list[dict[str, Any]]:
-        with self._conn() as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("SELECT * FROM recordings ORDER BY started_at DESC")
-            return [dict(row) for row in cursor.fetchall()]
+        return list(self.iter_recordings())
+
+    def iter_recordings(self) -> Iterator[dict[str, Any]]:
+        """Yield all recordings, newest first, without materializing the full list."""
+        return self._iter_rows("SELECT * FROM recordings ORDER BY started_at DESC")
 
     def get_recordings_in_range(self, start: datetime, end: datetime) -> list[dict[str, Any]]:
         """Get recordings within a date range (inclusive)."""
-        with self._conn() as conn:
-            conn.row_factory = sqlite3.Row
+        with self._read_conn() as conn:
             cursor = conn.execute(
                 """SELECT * FROM recordings
-                   WHERE started_at >= ? AND started_at <= ?
-                   ORDER BY started_at DESC""",
-                (start.isoformat(), end.isoformat()),
+                   WHERE started_at_ts >= ? AND started_at_ts <= ?
+                   ORDER BY started_at_ts DESC""",
+                (_epoch_seconds(start), _epoch_seconds(end)),
             )
-            return [dict(row) for row in cursor.fetchall()]
+            return _dict_rows(cursor)
 
     def get_recording(self, rec_id: str) -> dict[str, Any] | None:
-        with self._conn() as conn:
-            conn.row_factory = sqlite3.Row
+        with self._read_conn() as conn:
             cursor = conn.execute("SELECT * FROM recordings WHERE id = ?", (rec_id,))
             row = cursor.fetchone()
             return dict(row) if row else None
 
+    def get_recording_flags(self) -> dict[str, tuple[bool, bool]]:
+        """Get (has_notes, has_transcript) for every recording in one query."""
+        with self._read_conn() as conn:
+            cursor = conn.execute(
+                """
+                SELECT r.id,
+                       COALESCE(r.notes, '') != '',
+                       EXISTS(SELECT 1 FROM transcripts t WHERE t.recording_id = r.id)
+                FROM recordings r
+                """
+            )
+            return {row[0]: (bool(row[1]), bool(row[2])) for row in cursor.fetchall()}
+
     def get_transcript(self, rec_id: str) -> dict[str, Any] | None:
-        with self._conn() as conn:
-            conn.row_factory = sqlite3.Row
+        with self._read_conn() as conn:
             cursor = conn.execute("SELECT * FROM transcripts WHERE recording_id = ?", (rec_id,))
             row = cursor.fetchone()
             return dict(row) if row else None
 
-    def search_transcripts(self, query: str) -> list[dict[str, Any]]:
-        """Search transcripts using FTS5 and title search."""
-        if not query or not query.strip():
-            return []
+    def search_transcripts(
+        self, query: str, snippet_limit: int | None = None
+    ) -> list[dict[str, Any]]:
+        """Search transcripts and recording titles using FTS5, best matches first.
 
-        clean_query = query.replace('"', '""')
-        fts_query = f'"{clean_query}"'
-        like_query = f"%{query}%"
+        Every word must match, as a word prefix in transcripts and as a substring
+        in titles. Snippets are generated only for the returned results, or just
+        the first snippet_limit of them when given.
+        """
+        fts_query = _fts_prefix_query(query, min_token_length=2)
+        if not fts_query:
+            return []
+        # Trigram titles can't match words shorter than 3 characters, so those
+        # are matched with LIKE instead
+        title_query = _fts_prefix_query(query, min_token_length=3)
+        short_words = [_like_substring(token) for token in query.split() if len(token) == 2]
+        short_words_sql = "".join(" AND rec.title LIKE ? ESCAPE '\\'" for _ in short_words)
+        if title_query:
+            title_hits_sql = f"""
+                    SELECT rec.id, NULL, recordings_fts.rank, NULL
+                    FROM recordings_fts
+                    JOIN recordings rec ON rec.rowid = recordings_fts.rowid
+                    WHERE recordings_fts MATCH ?{short_words_sql}
+            """
+            title_params = [title_query, *short_words]
+        else:
+            title_hits_sql = f"""
+                    SELECT rec.id, NULL, 0, NULL
+                    FROM recordings rec
+                    WHERE 1{short_words_sql}
+            """
+            title_params = short_words
 
         logger.info(f"Searching transcripts for: '{query}' (FTS: '{fts_query}')")
 
-        with self._conn() as conn:
-            conn.row_factory = sqlite3.Row
-
-            # FTS Search
+        with self._read_conn() as conn:
+            # Rank first without snippets. Transcript and title hits for the same
+            # recording collapse into one row (title-only hits have no transcript).
+            # bm25 scores from the two FTS tables aren't comparable, so title hits
+            # come first in title rank order, then the rest in transcript rank order.
             cursor = conn.execute(
-                """
-                SELECT
-                    fts.recording_id,
-                    snippet(transcripts_fts, 1, '<b>', '</b>', '...', 32) as text_snippet,
-                    r.title,
-                    r.started_at,
-                    r.duration_seconds
-                FROM transcripts_fts fts
-                JOIN recordings r ON fts.recording_id = r.id
-                WHERE transcripts_fts MATCH ?
-                ORDER BY rank
-                LIMIT 50
-                """,
-                (fts_query,),
-            )
-            results = {row["recording_id"]: dict(row) for row in cursor.fetchall()}
-            logger.info(f"FTS found {len(results)} matches")
-
-            # Title Search
-            cursor = conn.execute(
-                """
+                f"""
                 SELECT
                     r.id as recording_id,
+                    MAX(hits.transcript_rowid) as transcript_rowid,
                     r.title,
                     r.started_at,
                     r.duration_seconds
-                FROM recordings r
-                WHERE r.title LIKE ?
-                ORDER BY r.started_at DESC
+                FROM (
+                    SELECT
+                        t.recording_id,
+                        t.rowid as transcript_rowid,
+                        NULL as title_rank,
+                        transcripts_fts.rank as transcript_rank
+                    FROM transcripts_fts
+                    JOIN transcripts t ON t.rowid = transcripts_fts.rowid
+                    WHERE transcripts_fts MATCH ?
+                    UNION ALL
+                    {title_hits_sql.strip()}
+                ) hits
+                JOIN recordings r ON r.id = hits.recording_id
+                GROUP BY r.id
+                ORDER BY
+                    MIN(hits.title_rank) IS NULL,
+                    MIN(hits.title_rank),
+                    MIN(hits.transcript_rank),
+                    r.started_at DESC
                 LIMIT 50
                 """,
-                (like_query,),
+                (fts_query, *title_params),
             )
+            results = _dict_rows(cursor)
+
+            snippet_rowids = [
+                result["transcript_rowid"]
+                for result in results[:snippet_limit]
+                if result["transcript_rowid"] is not None
+            ]
+            snippets: dict[int, str] = {}
+            if snippet_rowids:
+                placeholders = ", ".join("?" * len(snippet_rowids))
+                cursor = conn.execute(
+                    f"""
+                    SELECT rowid, snippet(transcripts_fts, 0, '<b>', '</b>', '...', 32)
+                    FROM transcripts_fts
+                    WHERE transcripts_fts MATCH ? AND rowid IN ({placeholders})
+                    """,
+                    (fts_query, *snippet_rowids),
+                )
+                snippets = {row[0]: row[1] for row in cursor}
+            for result in results:
+                result["text_snippet"] = snippets.get(result.pop("transcript_rowid"))
 
-            title_matches = 0
-            for row in cursor.fetchall():
-                rec_id = row["recording_id"]
-                if rec_id not in results:
-                    data = dict(row)
-                    data["text_snippet"] = None  # No text match, just title
-                    results[rec_id] = data
-                    title_matches += 1
-
-            logger.info(f"Title search added {title_matches} unique matches")
-
-            # Convert to list and sort
-            final_list = list(results.values())
-            # Basic sort by date descending
-            final_list.sort(key=lambda x: x["started_at"] or "", reverse=True)
-
-            return final_list
+            logger.info(f"FTS found {len(results)} matches")
+            return results
 
     def upsert_speaker_profile(self, name: str) -> None:
         """Upsert a speaker profile, incrementing usage count."""
@@ -487,7 +1023,7 @@ class Database:
 
     def get_frequent_speakers(self, min_usage: int = 3) -> list[str]:
         """Get names of frequent speakers."""
-        with self._conn() as conn:
+        with self._read_conn() as conn:
             cursor = conn.execute(
                 """
                 SELECT name FROM speaker_profiles
@@ -508,7 +1044,7 @@ class Database:
 
     def get_speaker_names(self, rec_id: str) -> str | None:
         """Get speaker name mappings JSON."""
-        with self._conn() as conn:
+        with self._read_conn() as conn:
             cursor = conn.execute(
                 "SELECT speaker_names FROM transcripts WHERE recording_id = ?", (rec_id,)
             )
@@ -526,17 +1062,15 @@ class Database:
     def save_action_items(self, rec_id: str, items: list[dict[str, Any]]) -> None:
         with self._conn() as conn:
             conn.execute("DELETE FROM action_items WHERE recording_id = ?", (rec_id,))
-            for item in items:
-                conn.execute(
-                    "INSERT INTO action_items (recording_id, text, assignee) VALUES (?, ?, ?)",
-                    (rec_id, item.get("text"), item.get("assignee")),
-                )
+            conn.executemany(
+                "INSERT INTO action_items (recording_id, text, assignee) VALUES (?, ?, ?)",
+                [(rec_id, item.get("text"), item.get("assignee")) for item in items],
+            )
 
     def get_action_items(self, rec_id: str) -> list[dict[str, Any]]:
-        with self._conn() as conn:
-            conn.row_factory = sqlite3.Row
+        with self._read_conn() as conn:
             cursor = conn.execute("SELECT * FROM action_items WHERE recording_id = ?", (rec_id,))
-            return [dict(row) for row in cursor.fetchall()]
+            return _dict_rows(cursor)
 
     def save_notes(self, rec_id: str, notes: str) -> None:
         """Save notes for a recording."""
@@ -548,7 +1082,7 @@ class Database:
 
     def get_notes(self, rec_id: str) -> str:
         """Get notes for a recording."""
-        with self._conn() as conn:
+        with self._read_conn() as conn:
             cursor = conn.execute("SELECT notes FROM recordings WHERE id = ?", (rec_id,))
             row = cursor.fetchone()
             return row[0] if row and row[0] else ""
@@ -563,7 +1097,7 @@ class Database:
 
     def get_enhanced_notes(self, rec_id: str) -> str:
         """Get AI-enhanced notes for a recording."""
-        with self._conn() as conn:
+        with self._read_conn() as conn:
             cursor = conn.execute("SELECT enhanced_notes FROM recordings WHERE id = ?", (rec_id,))
             row = cursor.fetchone()
             return row[0] if row and row[0] else ""
@@ -571,28 +1105,87 @@ class Database:
     def delete_recording(self, rec_id: str) -> None:
         """Delete a recording and all related data."""
         with self._conn() as conn:
-            # Unlink from calendar events first
+            # Unlink from calendar events first (the event itself is kept)
             conn.execute(
                 "UPDATE calendar_events SET recording_id = NULL WHERE recording_id = ?", (rec_id,)
             )
-
-            conn.execute("DELETE FROM action_items WHERE recording_id = ?", (rec_id,))
-            conn.execute("DELETE FROM transcripts WHERE recording_id = ?", (rec_id,))
-            conn.execute("DELETE FROM file_search_sync WHERE recording_id = ?", (rec_id,))
+            # Transcript, action items and sync status cascade
             conn.execute("DELETE FROM recordings WHERE id = ?", (rec_id,))
 
     # ==================== File Search Sync Methods ====================
 
     def get_sync_status(self, rec_id: str) -> dict[str, Any] | None:
         """Get sync status for a recording."""
-        with self._conn() as conn:
-            conn.row_factory = sqlite3.Row
+        with self._read_conn() as conn:
             cursor = conn.execute(
                 "SELECT * FROM file_search_sync WHERE recording_id = ?", (rec_id,)
             )
             row = cursor.fetchone()
             return dict(row) if row else None
 
+    def has_syncable_content(self, rec_id: str) -> bool:
+        """Check whether a recording has a transcript or notes, without loading them."""
+        with self._read_conn() as conn:
+            cursor = conn.execute(
+                """
+                SELECT EXISTS(SELECT 1 FROM transcripts WHERE recording_id = ?)
+                    OR EXISTS(SELECT 1 FROM recordings WHERE id = ? AND notes != '')
+                """,
+                (rec_id, rec_id),
+            )
+            return bool(cursor.fetchone()[0])
+
+    def get_sync_bundle(self, rec_id: str) -> dict[str, Any] | None:
+        """Get everything needed to sync a recording, using one connection.
+
+        Returns None if the recording doesn't exist. Otherwise a dict with keys
+        recording, transcript, notes, action_items, sync_status, folder_name and
+        attendees (the linked calendar event's raw attendees JSON).
+        """
+        with self._read_conn() as conn:
+            row = conn.execute(
+                """
+                SELECT r.*, f.name AS folder_name
+                FROM recordings r
+                LEFT JOIN meeting_folders f ON r.folder_id = f.id
+                WHERE r.id = ?
+                """,
+                (rec_id,),
+            ).fetchone()
+            if not row:
+                return None
+            recording = dict(row)
+            folder_name = recording.pop("folder_name")
+
+            row = conn.execute(
+                "SELECT * FROM transcripts WHERE recording_id = ?", (rec_id,)
+            ).fetchone()
+            transcript = dict(row) if row else None
+
+            action_items = _dict_rows(
+                conn.execute("SELECT * FROM action_items WHERE recording_id = ?", (rec_id,))
+            )
+
+            row = conn.execute(
+                "SELECT * FROM file_search_sync WHERE recording_id = ?", (rec_id,)
+            ).fetchone()
+            sync_status = dict(row) if row else None
+
+            row = conn.execute(
+                "SELECT attendees FROM calendar_events WHERE recording_id = ?", (rec_id,)
+            ).fetchone()
+            attendees = row[0] if row else None
+
+        return {
+            "recording": recording,
+            "transcript": transcript,
+            "notes": recording.get("notes") or "",
+            "action_items": action_items,
+            "sync_status": sync_status,
+            "folder_name": folder_name,
+            "attendees": attendees,
+        }
+
     def set_sync_status(
         self,
         rec_id: str,
@@ -600,21 +1193,34 @@ class Database:
         file_name: str | None = None,
         content_hash: str | None = None,
         error: str | None = None,
+        source_updated_at: str | None = None,
+        content_gz: bytes | None = None,
     ) -> None:
-        """Update sync status for a recording."""
+        """Update sync status for a recording.
+
+        source_updated_at is the recording's content_updated_at at the time the
+        synced content was built (see is_sync_up_to_date). If content_gz is given,
+        it is cached as the formatted document for that source_updated_at.
+        """
         with self._conn() as conn:
             conn.execute(
                 """
                 INSERT INTO file_search_sync
                     (recording_id, sync_status, file_search_file_name, content_hash,
-                     error_message, last_synced_at)
-                VALUES (?, ?, ?, ?, ?, ?)
+                     error_message, last_synced_at, source_updated_at,
+                     content_gz, content_gz_source_updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
                 ON CONFLICT(recording_id) DO UPDATE SET
                     sync_status = excluded.sync_status,
                     file_search_file_name = COALESCE(excluded.file_search_file_name, file_search_file_name),
                     content_hash = COALESCE(excluded.content_hash, content_hash),
                     error_message = excluded.error_message,
-                    last_synced_at = excluded.last_synced_at
+                    last_synced_at = excluded.last_synced_at,
+                    source_updated_at = excluded.source_updated_at,
+                    content_gz = COALESCE(excluded.content_gz, content_gz),
+                    content_gz_source_updated_at = COALESCE(
+                        excluded.content_gz_source_updated_at, content_gz_source_updated_at
+                    )
                 """,
                 (
                     rec_id,
@@ -622,14 +1228,50 @@ class Database:
                     file_name,
                     content_hash,
                     error,
-                    datetime.now() if status == "synced" else None,
+                    int(time.time()) if status == "synced" else None,
+                    source_updated_at if status == "synced" else None,
+                    content_gz,
+                    source_updated_at if content_gz is not None else None,
                 ),
             )
 
-    def get_unsynced_recordings(self, min_duration_seconds: float = 30) -> list[dict[str, Any]]:
-        """Get recordings that need syncing (have transcripts, long enough, not synced)."""
+    def set_sync_status_many(self, rec_ids: list[str], status: str) -> None:
+        """Set a non-synced status (e.g. 'removed') on existing sync records in one batch."""
         with self._conn() as conn:
-            conn.row_factory = sqlite3.Row
+            conn.executemany(
+                """
+                UPDATE file_search_sync
+                SET sync_status = ?, error_message = NULL,
+                    last_synced_at = NULL, source_updated_at = NULL,
+                    content_gz = NULL, content_gz_source_updated_at = NULL
+                WHERE recording_id = ?
+                """,
+                [(status, rec_id) for rec_id in rec_ids],
+            )
+
+    def is_sync_up_to_date(self, rec_id: str) -> bool:
+        """Check whether a synced recording's content is unchanged since its last sync."""
+        with self._read_conn() as conn:
+            cursor = conn.execute(
+                """
+                SELECT 1 FROM file_search_sync s
+                JOIN recordings r ON r.id = s.recording_id
+                WHERE s.recording_id = ?
+                  AND s.sync_status = 'synced'
+                  AND s.source_updated_at IS NOT NULL
+                  AND s.source_updated_at = r.content_updated_at
+                """,
+                (rec_id,),
+            )
+            return cursor.fetchone() is not None
+
+    def get_unsynced_recordings(self, min_duration_seconds: float = 30) -> list[dict[str, Any]]:
+        """Get recordings that need syncing (have transcripts, long enough, not synced).
+
+        Synced recordings are included only if their content changed since the last
+        sync (content_updated_at differs from the stored source_updated_at).
+        """
+        with self._read_conn() as conn:
             cursor = conn.execute(
                 """
                 SELECT r.* FROM recordings r
@@ -637,19 +1279,21 @@ class Database:
                 LEFT JOIN file_search_sync s ON r.id = s.recording_id
                 WHERE r.status = 'completed'
                   AND r.duration_seconds >= ?
-                  AND (s.sync_status IS NULL OR s.sync_status NOT IN ('synced', 'pending'))
+                  AND (s.sync_status IS NULL
+                       OR s.sync_status NOT IN ('synced', 'pending')
+                       OR (s.sync_status = 'synced'
+                           AND s.source_updated_at IS NOT r.content_updated_at))
                 ORDER BY r.started_at DESC
                 """,
                 (min_duration_seconds,),
             )
-            return [dict(row) for row in cursor.fetchall()]
+            return _dict_rows(cursor)
 
     def get_synced_recordings(self) -> list[dict[str, Any]]:
         """Get all synced recording IDs and file names."""
-        with self._conn() as conn:
-            conn.row_factory = sqlite3.Row
+        with self._read_conn() as conn:
             cursor = conn.execute("SELECT * FROM file_search_sync WHERE sync_status = 'synced'")
-            return [dict(row) for row in cursor.fetchall()]
+            return _dict_rows(cursor)
 
     def mark_for_deletion(self, rec_id: str) -> None:
         """Mark a sync record for deletion from cloud."""
@@ -661,10 +1305,9 @@ class Database:
 
     def get_pending_deletions(self) -> list[dict[str, Any]]:
         """Get recordings marked for deletion from cloud."""
-        with self._conn() as conn:
-            conn.row_factory = sqlite3.Row
+        with self._read_conn() as conn:
             cursor = conn.execute("SELECT * FROM file_search_sync WHERE sync_status = 'deleted'")
-            return [dict(row) for row in cursor.fetchall()]
+            return _dict_rows(cursor)
 
     # ==================== Chat History Methods ====================
 
@@ -687,8 +1330,7 @@ class Database:
 
     def get_chat_history(self, session_id: str, limit: int = 50) -> list[dict[str, Any]]:
         """Get chat history for a session."""
-        with self._conn() as conn:
-            conn.row_factory = sqlite3.Row
+        with self._read_conn() as conn:
             cursor = conn.execute(
                 """
                 SELECT * FROM chat_history
@@ -698,7 +1340,7 @@ class Database:
                 """,
                 (session_id, limit),
             )
-            return [dict(row) for row in cursor.fetchall()]
+            return _dict_rows(cursor)
 
     def clear_chat_history(self, session_id: str) -> None:
         """Clear chat history for a session."""
@@ -709,44 +1351,29 @@ class Database:
 
     def upsert_calendar_events(self, events: list[dict[str, Any]]) -> int:
         """Insert or update calendar events. Returns number of rows changed."""
-        total_changes = 0
+        synced_at = int(time.time())  # One timestamp for the whole batch
+        params = [
+            (
+                event["event_id"],
+                event.get("calendar_id", "primary"),
+                event["title"],
+                event["start_time"],
+                event["end_time"],
+                _event_epoch(event["start_time"]),
+                _event_epoch(event["end_time"]),
+                event.get("meet_link"),
+                event.get("attendees"),  # JSON string
+                event.get("organizer_email"),
+                event.get("etag"),
+                synced_at,
+                event.get("recurring_event_id"),
+            )
+            for event in events
+        ]
         with self._conn() as conn:
-            for event in events:
-                conn.execute(
-                    """
-                    INSERT INTO calendar_events
-                        (event_id, calendar_id, title, start_time, end_time,
-                         meet_link, attendees, organizer_email, etag, synced_at, recurring_event_id)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(event_id) DO UPDATE SET
-                        calendar_id = excluded.calendar_id,
-                        title = excluded.title,
-                        start_time = excluded.start_time,
-                        end_time = excluded.end_time,
-                        meet_link = excluded.meet_link,
-                        attendees = excluded.attendees,
-                        organizer_email = excluded.organizer_email,
-                        etag = excluded.etag,
-                        synced_at = excluded.synced_at,
-                        recurring_event_id = excluded.recurring_event_id,
-                        hidden = COALESCE(calendar_events.hidden, 0)
-                    """,
-                    (
-                        event["event_id"],
-                        event.get("calendar_id", "primary"),
-                        event["title"],
-                        event["start_time"],
-                        event["end_time"],
-                        event.get("meet_link"),
-                        event.get("attendees"),  # JSON string
-                        event.get("organizer_email"),
-                        event.get("etag"),
-                        datetime.now(),
-                        event.get("recurring_event_id"),
-                    ),
-                )
-                total_changes += conn.total_changes
-        return total_changes
+            # rowcount sums rows changed by each upsert, excluding trigger side effects
+            cursor = conn.executemany(_UPSERT_CALENDAR_EVENT_SQL, params)
+            return cursor.rowcount
 
     def save_calendar_event_notes(self, event_id: str, notes: str) -> None:
         """Save notes for a calendar event."""
@@ -758,7 +1385,7 @@ class Database:
 
     def get_calendar_event_notes(self, event_id: str) -> str:
         """Get notes for a calendar event."""
-        with self._conn() as conn:
+        with self._read_conn() as conn:
             cursor = conn.execute(
                 "SELECT notes FROM calendar_events WHERE event_id = ?", (event_id,)
             )
@@ -767,25 +1394,32 @@ class Database:
 
     def get_calendar_events(self, start_date: datetime, end_date: datetime) -> list[dict[str, Any]]:
         """Get calendar events in a date range with recording info."""
-        with self._conn() as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                """
-                SELECT
-                    ce.*,
-                    r.id as rec_id,
-                    r.title as rec_title,
-                    r.duration_seconds as rec_duration,
-                    r.status as rec_status
-                FROM calendar_events ce
-                LEFT JOIN recordings r ON ce.recording_id = r.id
-                WHERE ce.start_time >= ? AND ce.start_time < ?
-                  AND (ce.hidden IS NULL OR ce.hidden = 0)
-                ORDER BY ce.start_time ASC
-                """,
-                (start_date, end_date),
-            )
-            return [dict(row) for row in cursor.fetchall()]
+        return list(self.iter_calendar_events(start_date, end_date))
+
+    def iter_calendar_events(
+        self, start_date: datetime, end_date: datetime
+    ) -> Iterator[dict[str, Any]]:
+        """Yield calendar events in a date range with recording info."""
+        return self._iter_rows(
+            _CALENDAR_EVENTS_IN_RANGE_SQL, (_event_epoch(start_date), _event_epoch(end_date))
+        )
+
+    def get_calendar_events_partitioned(
+        self, start_date: datetime, now: datetime, end_date: datetime
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Get calendar events in a date range as (past, upcoming), split at now.
+
+        Events starting at or before now are past. Both halves come from indexed
+        start_ts range queries, so callers needn't parse start times to split them.
+        """
+        split = _event_epoch(now) + 1  # First whole second after now
+        past = list(
+            self._iter_rows(_CALENDAR_EVENTS_IN_RANGE_SQL, (_event_epoch(start_date), split))
+        )
+        upcoming = list(
+            self._iter_rows(_CALENDAR_EVENTS_IN_RANGE_SQL, (split, _event_epoch(end_date)))
+        )
+        return past, upcoming
 
     def get_todays_calendar_events(self) -> list[dict[str, Any]]:
         """Get today's calendar events with recording info."""
@@ -802,24 +1436,17 @@ class Database:
             )
 
     def get_current_meeting(self, buffer_minutes: int = 10) -> dict[str, Any] | None:
-        """Find a meeting happening now (within buffer window)."""
+        """Find a meeting happening now (within buffer window).
 
-        now = get_now()
-        window_start = now - timedelta(minutes=buffer_minutes)
-        window_end = now + timedelta(minutes=buffer_minutes)
+        Only looked up once per recording start, so the result isn't cached; a
+        cached answer could miss events added by a calendar sync moments earlier.
+        """
+        now = _event_epoch(get_now())
+        buffer_seconds = buffer_minutes * 60
 
-        with self._conn() as conn:
-            conn.row_factory = sqlite3.Row
+        with self._read_conn() as conn:
             cursor = conn.execute(
-                """
-                SELECT * FROM calendar_events
-                WHERE (start_time <= ? AND end_time >= ?
-                   OR (start_time >= ? AND start_time <= ?))
-                   AND (hidden IS NULL OR hidden = 0)
-                ORDER BY start_time ASC
-                LIMIT 1
-                """,
-                (now, now, window_start, window_end),
+                _CURRENT_MEETING_SQL, (now - buffer_seconds, now + buffer_seconds, now, now)
             )
             row = cursor.fetchone()
             return dict(row) if row else None
@@ -833,30 +1460,56 @@ class Database:
             )
 
     def get_calendar_event(self, event_id: str) -> dict[str, Any] | None:
-        """Get a single calendar event by ID."""
-        with self._conn() as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                """
-                SELECT
-                    ce.*,
-                    r.id as rec_id,
-                    r.title as rec_title,
-                    r.duration_seconds as rec_duration,
-                    r.status as rec_status
-                FROM calendar_events ce
-                LEFT JOIN recordings r ON ce.recording_id = r.id
-                WHERE ce.event_id = ?
-                """,
-                (event_id,),
-            )
+        """Get a single calendar event by ID.
+
+        The join costs one extra primary key probe, and none when the event has
+        no recording (SQLite skips the lookup for a NULL recording_id).
+        """
+        with self._read_conn() as conn:
+            cursor = conn.execute(_CALENDAR_EVENT_BY_ID_SQL, (event_id,))
             row = cursor.fetchone()
             return dict(row) if row else None
 
     def clear_calendar_events(self) -> None:
         """Clear all calendar events (for re-sync or logout)."""
+        # calendar_events only ever references other tables, so clearing it can't
+        # break a foreign key. With enforcement off SQLite truncates the table and
+        # its indexes instead of deleting row by row. The pragma is a no-op inside
+        # a transaction, which is fine since _conn() always commits on exit.
+        conn = self._get_connection()
+        conn.execute("PRAGMA foreign_keys=OFF")
+        try:
+            with self._conn() as conn:
+                conn.execute("DELETE FROM calendar_events")
+                # Drop the stale planner stats; on an empty table ANALYZE removes
+                # them, so the next sync is planned from defaults until re-analyzed
+                conn.execute("ANALYZE calendar_events")
+        finally:
+            conn.execute("PRAGMA foreign_keys=ON")
+
+    # ==================== Notification Tracking Methods ====================
+
+    def get_notified_ids(self, day: date, kind: str) -> set[str]:
+        """Get event keys already notified on a given day for a notification kind."""
+        with self._read_conn() as conn:
+            cursor = conn.execute(
+                "SELECT event_id FROM notified_events WHERE date = ? AND kind = ?",
+                (day.isoformat(), kind),
+            )
+            return {row[0] for row in cursor.fetchall()}
+
+    def add_notified_id(self, day: date, kind: str, event_id: str) -> None:
+        """Record that a notification was shown for an event on a given day."""
         with self._conn() as conn:
-            conn.execute("DELETE FROM calendar_events")
+            conn.execute(
+                "INSERT OR IGNORE INTO notified_events (date, kind, event_id) VALUES (?, ?, ?)",
+                (day.isoformat(), kind, event_id),
+            )
+
+    def prune_notified_ids(self, day: date) -> None:
+        """Forget notifications from before a given day; they are never read again."""
+        with self._conn() as conn:
+            conn.execute("DELETE FROM notified_events WHERE date < ?", (day.isoformat(),))
 
     # ==================== Folder Management Methods ====================
 
@@ -871,17 +1524,13 @@ class Database:
         """Create a new meeting folder."""
         with self._conn() as conn:
             conn.execute(
-                """
-                INSERT INTO meeting_folders
-                (id, name, parent_id, recurring_event_id, created_at, sort_order)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
+                _INSERT_FOLDER_SQL,
                 (
                     folder_id,
                     name,
                     parent_id,
                     recurring_event_id,
-                    datetime.now(),
+                    int(time.time()),
                     sort_order,
                 ),
             )
@@ -923,6 +1572,7 @@ class Database:
         Items in the folder will have their folder_id set to NULL (Uncategorized).
         Subfolders will have their parent_id set to NULL (become top-level).
         """
+        # One transaction: the unlinks and the delete commit (and fsync) together
         with self._conn() as conn:
             # Unlink subfolders
             conn.execute(
@@ -939,8 +1589,7 @@ class Database:
 
     def get_folder_by_recurring_id(self, recurring_id: str) -> dict[str, Any] | None:
         """Find a folder linked to a recurring event series."""
-        with self._conn() as conn:
-            conn.row_factory = sqlite3.Row
+        with self._read_conn() as conn:
             cursor = conn.execute(
                 "SELECT * FROM meeting_folders WHERE recurring_event_id = ?", (recurring_id,)
             )
@@ -949,39 +1598,44 @@ class Database:
 
     def get_folders(self) -> list[dict[str, Any]]:
         """Get all folders ordered by sort_order and name."""
-        with self._conn() as conn:
-            conn.row_factory = sqlite3.Row
+        with self._read_conn() as conn:
             cursor = conn.execute("SELECT * FROM meeting_folders ORDER BY sort_order ASC, name ASC")
-            return [dict(row) for row in cursor.fetchall()]
+            return _dict_rows(cursor)
 
     def set_recording_folder(self, rec_id: str, folder_id: str | None) -> None:
         """Move a recording to a folder."""
+        self.set_recording_folders([(rec_id, folder_id)])
+
+    def set_recording_folders(self, moves: list[tuple[str, str | None]]) -> None:
+        """Move several recordings, given as (rec_id, folder_id) pairs, in one transaction."""
         with self._conn() as conn:
-            conn.execute(
+            conn.executemany(
                 "UPDATE recordings SET folder_id = ? WHERE id = ?",
-                (folder_id, rec_id),
+                [(folder_id, rec_id) for rec_id, folder_id in moves],
             )
 
     def set_calendar_event_folder(self, event_id: str, folder_id: str | None) -> None:
         """Move a calendar event to a folder."""
+        self.set_calendar_event_folders([(event_id, folder_id)])
+
+    def set_calendar_event_folders(self, moves: list[tuple[str, str | None]]) -> None:
+        """Move several calendar events, given as (event_id, folder_id) pairs, in one transaction."""
         with self._conn() as conn:
-            conn.execute(
+            conn.executemany(
                 "UPDATE calendar_events SET folder_id = ? WHERE event_id = ?",
-                (folder_id, event_id),
+                [(folder_id, event_id) for event_id, folder_id in moves],
             )
 
     def get_folder(self, folder_id: str) -> dict[str, Any] | None:
         """Get a single folder by ID."""
-        with self._conn() as conn:
-            conn.row_factory = sqlite3.Row
+        with self._read_conn() as conn:
             cursor = conn.execute("SELECT * FROM meeting_folders WHERE id = ?", (folder_id,))
             row = cursor.fetchone()
             return dict(row) if row else None
 
     def get_event_for_recording(self, rec_id: str) -> dict[str, Any] | None:
         """Get the calendar event linked to a recording."""
-        with self._conn() as conn:
-            conn.row_factory = sqlite3.Row
+        with self._read_conn() as conn:
             cursor = conn.execute("SELECT * FROM calendar_events WHERE recording_id = ?", (rec_id,))
             row = cursor.fetchone()
             return dict(row) if row else None
@@ -990,12 +1644,11 @@ class Database:
         self, folder_id: str, limit: int | None = None
     ) -> list[dict[str, Any]]:
         """Get recordings in a folder, most recent first."""
-        with self._conn() as conn:
-            conn.row_factory = sqlite3.Row
+        with self._read_conn() as conn:
             query = "SELECT * FROM recordings WHERE folder_id = ? ORDER BY started_at DESC"
             params: list[str | int] = [folder_id]
             if limit is not None:
                 query += " LIMIT ?"
                 params.append(limit)
             cursor = conn.execute(query, params)
-            return [dict(row) for row in cursor.fetchall()]
+            return _dict_rows(cursor)
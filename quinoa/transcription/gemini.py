@@ -1,5 +1,6 @@
 import logging
 import os
+from collections.abc import Callable
 
 from google import genai
 from google.genai import types
@@ -59,7 +60,17 @@ class GeminiTranscriber:
             raise ValueError("GEMINI_API_KEY not found. Please set it in environment variables.")
         self.client = genai.Client(api_key=self.api_key)
 
-    def transcribe(self, audio_path: str, prompt: str | None = None) -> str:
+    def transcribe(
+        self,
+        audio_path: str,
+        prompt: str | None = None,
+        on_chunk: Callable[[str], None] | None = None,
+    ) -> str:
+        """Transcribe an audio file and return the JSON response text.
+
+        The response is streamed; `on_chunk` is called with each piece of text
+        as it arrives, so callers can show progress during long transcriptions.
+        """
         # Upload file
         logger.info("Uploading %s...", audio_path)
 
@@ -91,7 +102,7 @@ class GeminiTranscriber:
             prompt = DEFAULT_TRANSCRIPTION_PROMPT
 
         logger.info("Generating transcript...")
-        response = self.client.models.generate_content(
+        stream = self.client.models.generate_content_stream(
             model=config.get("gemini_model") or GEMINI_MODEL_TRANSCRIPTION,
             contents=[
                 types.Content(
@@ -111,4 +122,12 @@ class GeminiTranscriber:
             ),
         )
 
-        return str(response.text)
+        chunks: list[str] = []
+        for chunk in stream:
+            if not chunk.text:
+                continue
+            chunks.append(chunk.text)
+            if on_chunk:
+                on_chunk(chunk.text)
+
+        return "".join(chunks)
@@ -1,7 +1,7 @@
 """Audio player widget for playback controls."""
 
 from PyQt6.QtCore import Qt, QTime, QUrl
-from PyQt6.QtGui import QAction
+from PyQt6.QtGui import QAction, QIcon
 from PyQt6.QtMultimedia import QAudioOutput, QMediaPlayer
 from PyQt6.QtWidgets import (
     QFrame,
@@ -16,6 +16,8 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from quinoa.constants import PLAYBACK_UI_INTERVAL_MS
+
 
 class AudioPlayer(QFrame):
     """Audio player widget with playback controls."""
@@ -70,6 +72,13 @@ class AudioPlayer(QFrame):
         # State
         self._duration = 0
         self._seeking = False
+        self._last_ui_ms = 0  # Position last shown on the slider and label
+        # Time label cache: the total only changes with the duration, and the
+        # current time only needs reformatting when its whole second changes
+        self._label_total_ms = -1
+        self._label_second = -1
+        self._time_fmt = "mm:ss"
+        self._total_str = ""
 
     def _setup_ui(self):
         layout = QVBoxLayout(self)
@@ -83,9 +92,15 @@ class AudioPlayer(QFrame):
         # Play/Pause Button
         self.play_btn = QPushButton()
         self.play_btn.setFixedSize(32, 32)
+        # Built once; playback state changes just swap between them
         style = self.style()
-        if style:
-            self.play_btn.setIcon(style.standardIcon(QStyle.StandardPixmap.SP_MediaPlay))
+        self._play_icon = (
+            style.standardIcon(QStyle.StandardPixmap.SP_MediaPlay) if style else QIcon()
+        )
+        self._pause_icon = (
+            style.standardIcon(QStyle.StandardPixmap.SP_MediaPause) if style else QIcon()
+        )
+        self.play_btn.setIcon(self._play_icon)
         self.play_btn.clicked.connect(self.toggle_playback)
         self.play_btn.setStyleSheet("""
             QPushButton {
@@ -108,7 +123,9 @@ class AudioPlayer(QFrame):
         self.slider.setRange(0, 0)
         self.slider.sliderPressed.connect(self._on_slider_pressed)
         self.slider.sliderReleased.connect(self._on_slider_released)
-        self.slider.valueChanged.connect(self._on_slider_moved)
+        # sliderMoved only fires for user drags, not the setValue calls made on
+        # every playback position update
+        self.slider.sliderMoved.connect(self._on_slider_moved)
         controls_layout.addWidget(self.slider)
 
         # Speed Button
@@ -131,17 +148,34 @@ class AudioPlayer(QFrame):
         speed_menu = QMenu(self)
         for rate in [0.5, 0.75, 1.0, 1.25, 1.5, 2.0]:
             action = QAction(f"{rate}x", self)
-            action.triggered.connect(lambda checked, r=rate: self.set_playback_rate(r))
+            action.setData(rate)
             speed_menu.addAction(action)
+        speed_menu.triggered.connect(self._on_speed_action)
         self.speed_btn.setMenu(speed_menu)
         controls_layout.addWidget(self.speed_btn)
 
         layout.addLayout(controls_layout)
 
-    def load_audio(self, file_path: str):
-        """Load an audio file."""
+    def load_audio(self, file_path: str, reload: bool = False):
+        """Load an audio file.
+
+        Loading the file that is already playing keeps the media pipeline and
+        playback position. Pass reload=True when the file has changed on disk.
+        """
+        url = QUrl.fromLocalFile(file_path)
+        if url == self.player.source() and not reload:
+            if self.player.error() == QMediaPlayer.Error.NoError:
+                self._update_time_label(self.player.position(), self._duration)
+                self.play_btn.setEnabled(True)
+                self.slider.setEnabled(True)
+                return
+            # QMediaPlayer ignores setSource() with the current URL
+            reload = True
+
         self.stop()
-        self.player.setSource(QUrl.fromLocalFile(file_path))
+        if reload:
+            self.player.setSource(QUrl())
+        self.player.setSource(url)
         self.play_btn.setEnabled(True)
         self.slider.setEnabled(True)
 
@@ -165,24 +199,32 @@ class AudioPlayer(QFrame):
         self.player.setPlaybackRate(rate)
         self.speed_btn.setText(f"{rate}x")
 
+    def _on_speed_action(self, action: QAction):
+        self.set_playback_rate(action.data())
+
     def set_error(self, message: str):
         """Set error state."""
         self.stop()
         self.play_btn.setEnabled(False)
         self.slider.setEnabled(False)
         self.time_label.setText(message)
+        self._label_second = -1  # Redraw the time once audio loads again
 
     def _on_state_changed(self, state):
-        style = self.style()
-        if not style:
-            return
-
         if state == QMediaPlayer.PlaybackState.PlayingState:
-            self.play_btn.setIcon(style.standardIcon(QStyle.StandardPixmap.SP_MediaPause))
+            self.play_btn.setIcon(self._pause_icon)
         else:
-            self.play_btn.setIcon(style.standardIcon(QStyle.StandardPixmap.SP_MediaPlay))
+            self.play_btn.setIcon(self._play_icon)
 
     def _on_position_changed(self, position):
+        # positionChanged fires many times a second; the label only shows seconds.
+        # The start and end positions always go through so the UI settles exactly.
+        if (
+            abs(position - self._last_ui_ms) < PLAYBACK_UI_INTERVAL_MS
+            and 0 < position < self._duration
+        ):
+            return
+        self._last_ui_ms = position
         if not self._seeking:
             self.slider.setValue(position)
         self._update_time_label(position, self._duration)
@@ -193,14 +235,20 @@ class AudioPlayer(QFrame):
         self._update_time_label(self.player.position(), duration)
 
     def _update_time_label(self, current_ms, total_ms):
-        current = QTime(0, 0).addMSecs(current_ms)
-        total = QTime(0, 0).addMSecs(total_ms)
-
-        fmt = "mm:ss"
-        if total.hour() > 0:
-            fmt = "h:mm:ss"
+        if total_ms != self._label_total_ms:
+            total = QTime(0, 0).addMSecs(total_ms)
+            self._time_fmt = "h:mm:ss" if total.hour() > 0 else "mm:ss"
+            self._total_str = total.toString(self._time_fmt)
+            self._label_total_ms = total_ms
+            self._label_second = -1
+
+        second = current_ms // 1000
+        if second == self._label_second:
+            return
+        self._label_second = second
 
-        self.time_label.setText(f"{current.toString(fmt)} / {total.toString(fmt)}")
+        current = QTime(0, 0).addMSecs(current_ms)
+        self.time_label.setText(f"{current.toString(self._time_fmt)} / {self._total_str}")
 
     def _on_slider_pressed(self):
         self._seeking = True
@@ -210,10 +258,10 @@ class AudioPlayer(QFrame):
         self.player.setPosition(self.slider.value())
 
     def _on_slider_moved(self, value):
-        if self._seeking:
-            self._update_time_label(value, self._duration)
+        self._update_time_label(value, self._duration)
 
     def _on_error(self):
         self.play_btn.setEnabled(False)
         self.slider.setEnabled(False)
         self.time_label.setText("Error loading audio")
+        self._label_second = -1
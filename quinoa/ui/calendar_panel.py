@@ -2,36 +2,64 @@
 
 import json
 import logging
-from datetime import datetime, timedelta
-
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QAction, QDropEvent, QFont
+import re
+import time
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+from PyQt6.QtCore import (
+    QAbstractListModel,
+    QModelIndex,
+    QPoint,
+    QPointF,
+    QSize,
+    Qt,
+    QThread,
+    QTimer,
+    pyqtSignal,
+    pyqtSlot,
+)
+from PyQt6.QtGui import (
+    QAction,
+    QColor,
+    QDropEvent,
+    QFont,
+    QPainter,
+    QPalette,
+    QStaticText,
+    QTransform,
+)
 from PyQt6.QtWidgets import (
     QAbstractItemView,
     QHBoxLayout,
     QInputDialog,
-    QLabel,
     QLineEdit,
+    QListView,
     QListWidget,
     QListWidgetItem,
     QMenu,
     QMessageBox,
     QPushButton,
     QStackedWidget,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
     QTreeWidget,
     QTreeWidgetItem,
-    QTreeWidgetItemIterator,
     QVBoxLayout,
     QWidget,
 )
 
 from quinoa.calendar import is_authenticated
 from quinoa.constants import (
+    CALENDAR_AUTH_CHECK_SECONDS,
     ICON_BULLET,
     ICON_CHECKMARK,
     ICON_CIRCLE_EMPTY,
     ICON_PLAY,
     LAYOUT_MARGIN_SMALL,
+    SEARCH_CACHE_SIZE,
+    SEARCH_DEBOUNCE_MS,
     get_now,
 )
 from quinoa.storage.database import Database
@@ -39,17 +67,91 @@ from quinoa.ui.styles import TOGGLE_TAB
 
 logger = logging.getLogger("quinoa")
 
-# Meeting item types stored in UserRole+1
+# Meeting item types
 ITEM_TYPE_CALENDAR_EVENT = "calendar_event"
 ITEM_TYPE_RECORDING = "recording"
 ITEM_TYPE_HEADER = "header"
+ITEM_TYPE_FOLDER = "folder"
+
+# Meeting list items keep (item_type, item_id, recording_id) in this one role, so
+# each item is built and read with a single data call
+MEETING_DATA_ROLE = Qt.ItemDataRole.UserRole
+_HEADER_DATA = (ITEM_TYPE_HEADER, None, None)
+
+# Meeting link hosts and their (short, full) platform names, matched in one scan
+_PLATFORM_NAMES = {
+    "meet.google.com": ("Meet", "Google Meet"),
+    "zoom.us": ("Zoom", "Zoom"),
+    "teams.microsoft.com": ("Teams", "Microsoft Teams"),
+}
+_PLATFORM_RE = re.compile(r"(meet\.google\.com|zoom\.us|teams\.microsoft\.com)")
+
+# Meeting list rows: (MEETING_DATA_ROLE data, text, tooltip, font, foreground)
+_MeetingRow = tuple[
+    tuple[str, str | None, str | None], str, str | None, QFont | None, QColor | None
+]
+_SECTION_HEADER_COLOR = QColor(Qt.GlobalColor.gray)
+_DIMMED_COLOR = QColor(Qt.GlobalColor.darkGray)
+
+# Search results keep (title, date_str, snippet) here for SearchResultDelegate
+SEARCH_RESULT_ROLE = Qt.ItemDataRole.UserRole + 1
+# History tree items keep (item_type, item_id) in this one role, like the meeting
+# list; the same tuple keys the panel's record of the tree
+TREE_DATA_ROLE = Qt.ItemDataRole.UserRole
+_TreeKey = tuple[str, str | None]
+# Layout keys for the top level and the Uncategorized folder (a folder with no id,
+# which is also how a move to Uncategorized is expressed)
+_TREE_ROOT_KEY: _TreeKey = ("", None)
+_UNCATEGORIZED_KEY: _TreeKey = (ITEM_TYPE_FOLDER, None)
+
+_SEARCH_RESULT_PADDING = 8
+_SEARCH_RESULT_SPACING = 2
+
+# strftime formats for list, tree and search rows
+_TIME_FORMAT = "%I:%M %p"
+_TREE_TIME_FORMAT = "%b %d %I:%M %p"
+_SEARCH_DATE_FORMAT = "%b %d, %Y"
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO timestamp, memoized since the same rows are re-parsed on every refresh."""
+    return datetime.fromisoformat(value)
+
+
+@lru_cache(maxsize=4096)
+def _aware_to_local(dt: datetime) -> datetime:
+    """Convert an aware datetime to naive local time, memoized per instant."""
+    return dt.astimezone().replace(tzinfo=None)
+
+
+@lru_cache(maxsize=4096)
+def _fmt_time(iso: str) -> str:
+    """Format an ISO timestamp as 9:30 AM in local time."""
+    dt = _parse_iso(iso)
+    if dt.tzinfo is not None:
+        dt = _aware_to_local(dt)
+    return dt.strftime(_TIME_FORMAT).lstrip("0")
+
+
+@lru_cache(maxsize=64)
+def _date_group_label(rec_date: date, today: date) -> str:
+    """Get the date group label for a date, relative to today (memoized per pair)."""
+    if rec_date == today:
+        return "Today"
+    elif rec_date == today - timedelta(days=1):
+        return "Yesterday"
+    elif rec_date >= today - timedelta(days=7):
+        return rec_date.strftime("%A")  # Day name
+    else:
+        return rec_date.strftime("%b %d, %Y")  # Nov 27, 2025
 
 
 class FolderTree(QTreeWidget):
     """Custom TreeWidget to handle drag and drop."""
 
-    # Signal: item_id, new_folder_id (None for root/uncategorized depending on logic)
-    item_moved_to_folder = pyqtSignal(str, str)
+    # Signal: [(rec_id, new_folder_id), ...] for one drop (folder None for uncategorized)
+    items_moved_to_folder = pyqtSignal(list)
 
     def dropEvent(self, event: QDropEvent | None):
         if not event:
@@ -58,25 +160,245 @@ class FolderTree(QTreeWidget):
         super().dropEvent(event)
 
         # Iterate over selected items (the ones being dragged)
+        moves: list[tuple[str, str | None]] = []
         for item in self.selectedItems():
-            data = item.data(0, Qt.ItemDataRole.UserRole)
-            if not data:
-                continue
+            data = item.data(0, TREE_DATA_ROLE)
 
             # We only care about recordings moving
-            if data.startswith("rec:"):
-                rec_id = data.split(":", 1)[1]
+            if data and data[0] == ITEM_TYPE_RECORDING:
                 parent = item.parent()
 
                 folder_id = None
                 if parent:
-                    parent_data = parent.data(0, Qt.ItemDataRole.UserRole)
-                    if parent_data and parent_data.startswith("folder:"):
-                        fid = parent_data.split(":", 1)[1]
-                        if fid != "uncategorized":
-                            folder_id = fid
+                    parent_type, parent_id = parent.data(0, TREE_DATA_ROLE)
+                    if parent_type == ITEM_TYPE_FOLDER:
+                        folder_id = parent_id  # None for Uncategorized
+
+                moves.append((data[1], folder_id))
+
+        if moves:
+            self.items_moved_to_folder.emit(moves)
+
+
+class _HistoryLoadWorker(QThread):
+    """Background worker that reads everything the History tree shows."""
+
+    loaded = pyqtSignal(object)  # dict of query results, or None on failure
+
+    def __init__(self, db: Database, parent: QWidget | None = None):
+        super().__init__(parent)
+        self._db = db
+
+    def run(self) -> None:
+        try:
+            self.loaded.emit(
+                {
+                    "folders": self._db.get_folders(),
+                    "recordings": self._db.get_recordings(),
+                    # Notes/transcript indicators for every recording, in one query
+                    "flags": self._db.get_recording_flags(),
+                    # Past calendar events fill in gaps (unrecorded meetings). Cached
+                    # events are used even if auth is currently invalid (the sync
+                    # worker may have populated them before token expiry).
+                    "past_events": self._db.get_all_past_calendar_events(),
+                }
+            )
+        except Exception as e:
+            logger.error("Error loading folder tree: %s", e)
+            self.loaded.emit(None)
+        finally:
+            # This thread's connections aren't reused once it finishes
+            self._db.close()
+
+
+class SearchResultDelegate(QStyledItemDelegate):
+    """Paints search results (bold title, date, highlighted snippet) without widgets.
+
+    Each result's header and snippet are laid out once as QStaticText per view
+    width and reused for every repaint until clear_cache().
+    """
+
+    def __init__(self, parent: QWidget | None = None):
+        super().__init__(parent)
+        # (title, date_str, snippet, width) -> (header, snippet text, size hint)
+        self._layouts: dict[tuple, tuple[QStaticText, QStaticText | None, QSize]] = {}
+
+    def clear_cache(self) -> None:
+        """Drop cached layouts, e.g. when the result list is rebuilt."""
+        self._layouts.clear()
+
+    def _layout(
+        self, option: QStyleOptionViewItem, result: tuple[str, str, str | None]
+    ) -> tuple[QStaticText, QStaticText | None, QSize]:
+        # Rows span the viewport; option.rect isn't set when Qt asks for a size hint
+        widget = option.widget
+        viewport = widget.viewport() if isinstance(widget, QAbstractItemView) else None
+        width = viewport.width() if viewport is not None else option.rect.width()
+        key = (*result, width)
+        layout = self._layouts.get(key)
+        if layout is None:
+            title, date_str, snippet = result
+            text_width = max(width - 2 * _SEARCH_RESULT_PADDING, 1)
+
+            header = QStaticText(f"<b>{title}</b> <span style='color: #888;'>{date_str}</span>")
+            header.setTextFormat(Qt.TextFormat.RichText)
+            header.prepare(QTransform(), option.font)
+            height = 2 * _SEARCH_RESULT_PADDING + header.size().height()
+
+            snippet_text = None
+            if snippet:
+                snippet_text = QStaticText(f"<span style='color: #ccc;'>...{snippet}...</span>")
+                snippet_text.setTextFormat(Qt.TextFormat.RichText)
+                snippet_text.setTextWidth(text_width)
+                snippet_text.prepare(QTransform(), option.font)
+                height += _SEARCH_RESULT_SPACING + snippet_text.size().height()
+
+            layout = (header, snippet_text, QSize(width, int(height + 0.5)))
+            self._layouts[key] = layout
+        return layout
+
+    def paint(
+        self, painter: QPainter | None, option: QStyleOptionViewItem, index: QModelIndex
+    ) -> None:
+        result = index.data(SEARCH_RESULT_ROLE)
+        if painter is None or result is None:
+            # Plain rows, such as "No results found."
+            super().paint(painter, option, index)
+            return
+
+        self.initStyleOption(option, index)
+        style = option.widget.style() if option.widget else None
+        if style:
+            # Hover and selection background, as the default delegate draws it
+            style.drawPrimitive(
+                QStyle.PrimitiveElement.PE_PanelItemViewItem, option, painter, option.widget
+            )
+
+        header, snippet_text, _ = self._layout(option, result)
+        painter.save()
+        painter.setFont(option.font)
+        painter.setPen(option.palette.color(QPalette.ColorRole.Text))
+        x = option.rect.x() + _SEARCH_RESULT_PADDING
+        y: float = option.rect.y() + _SEARCH_RESULT_PADDING
+        painter.drawStaticText(QPointF(x, y), header)
+        if snippet_text is not None:
+            y += header.size().height() + _SEARCH_RESULT_SPACING
+            painter.drawStaticText(QPointF(x, y), snippet_text)
+        painter.restore()
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        result = index.data(SEARCH_RESULT_ROLE)
+        if result is None:
+            return super().sizeHint(option, index)
+        return self._layout(option, result)[2]
+
+
+class MeetingListModel(QAbstractListModel):
+    """Rows of the Today list, held as plain tuples and drawn by the view's delegate.
+
+    Loaders build a whole list of rows and hand it over in one reset (or one
+    insert when appending), instead of adding list widget items one by one.
+    """
 
-                self.item_moved_to_folder.emit(rec_id, folder_id)
+    def __init__(self, parent: QWidget | None = None):
+        super().__init__(parent)
+        self._rows: list[_MeetingRow] = []
+        # (item_type, item_id) -> row and recording_id -> first row showing it,
+        # so edits and selection can find their row without a scan
+        self._row_index: dict[tuple[str, str | None], int] = {}
+        self._recording_rows: dict[str, int] = {}
+
+    def rowCount(self, parent: QModelIndex | None = None) -> int:
+        return 0 if parent is not None and parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        meeting_data, text, tooltip, font, foreground = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return text
+        if role == MEETING_DATA_ROLE:
+            return meeting_data
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return tooltip
+        if role == Qt.ItemDataRole.FontRole:
+            return font
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return foreground
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid() or self._rows[index.row()][0][0] == ITEM_TYPE_HEADER:
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def set_rows(self, rows: list[_MeetingRow]) -> None:
+        """Replace every row."""
+        self.beginResetModel()
+        self._rows = rows
+        self._reindex()
+        self.endResetModel()
+
+    def append_rows(self, rows: list[_MeetingRow]) -> None:
+        """Add rows after the existing ones."""
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self._reindex(first)
+        self.endInsertRows()
+
+    def replace_row(self, row: int, new_row: _MeetingRow) -> None:
+        """Swap one row's contents in place."""
+        self._rows[row] = new_row
+        self._reindex(row)
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+    def remove_row(self, row: int) -> None:
+        """Drop one row."""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self._reindex(row)
+        self.endRemoveRows()
+
+    def row_of(self, item_type: str, item_id: str) -> int | None:
+        """Get the row showing the given meeting, or None."""
+        return self._row_index.get((item_type, item_id))
+
+    def row_for_recording(self, rec_id: str) -> int | None:
+        """Get the first row carrying ``rec_id``, whether a recording or a linked event."""
+        return self._recording_rows.get(rec_id)
+
+    def is_header(self, row: int) -> bool:
+        """Whether ``row`` is a section or date header."""
+        return self._rows[row][0][0] == ITEM_TYPE_HEADER
+
+    def _reindex(self, start: int = 0) -> None:
+        """Rebuild the row index from ``start`` onwards."""
+        if start == 0:
+            self._row_index.clear()
+            self._recording_rows.clear()
+        else:
+            self._row_index = {key: row for key, row in self._row_index.items() if row < start}
+            self._recording_rows = {
+                rec_id: row for rec_id, row in self._recording_rows.items() if row < start
+            }
+        for row in range(start, len(self._rows)):
+            item_type, item_id, recording_id = self._rows[row][0]
+            if item_type != ITEM_TYPE_HEADER:
+                self._row_index[(item_type, item_id)] = row
+            if recording_id is not None:
+                self._recording_rows.setdefault(recording_id, row)
+
+    def meeting_data_at(self, row: int) -> tuple[str, str | None, str | None]:
+        """Get one row's (item_type, item_id, recording_id)."""
+        return self._rows[row][0]
+
+    def meeting_data(self) -> list[tuple[str, str | None, str | None]]:
+        """Get each row's (item_type, item_id, recording_id), in row order."""
+        return [row[0] for row in self._rows]
 
 
 class CalendarPanel(QWidget):
@@ -90,15 +412,45 @@ class CalendarPanel(QWidget):
     impromptu_meeting_requested = pyqtSignal()
     new_meeting_requested = pyqtSignal()  # Alias for compatibility
     settings_requested = pyqtSignal()
+    meeting_not_found = pyqtSignal(str)  # rec_id of a deferred selection that failed
 
     def __init__(self, db: Database, parent: QWidget | None = None):
         super().__init__(parent)
         self.db = db
+        # Header fonts, shared by every header item instead of built per item
+        self._section_font = QFont()
+        self._section_font.setBold(True)
+        self._section_font.setPointSize(10)
+        self._date_font = QFont()
+        self._date_font.setBold(True)
+        self._date_font.setPointSize(9)
         self._selected_id: str | None = None
         self._selected_type: str | None = None
         self._oldest_loaded_date: datetime | None = None
         self._loading_more = False
         self._calendar_connected = False  # Cached auth state for scroll performance
+        self._auth_checked_at: float | None = None  # time.monotonic() of the last check
+        # FTS results by search text; cleared on refresh, when recordings may have changed
+        self._search_cache: dict[str, list[dict]] = {}
+        # Folders for the "Move to Folder" menus; dropped on every refresh (folder
+        # edits all refresh) and refilled from the History load or on first use
+        self._folders_cache: list[dict] | None = None
+        # Every history tree item with its lowercased text, built with the tree
+        self._tree_index: list[tuple[QTreeWidgetItem, str]] = []
+        # Text the tree is filtered by and the items that filter hid, so clearing
+        # it only touches those items and repeating it touches none
+        self._tree_filter = ""
+        self._tree_hidden: list[QTreeWidgetItem] = []
+        # History tree items kept across refreshes, keyed by their TREE_DATA_ROLE data,
+        # with the (text, tooltip) they show and each parent's child keys in order
+        self._tree_items: dict[_TreeKey, QTreeWidgetItem] = {}
+        self._tree_rows: dict[_TreeKey, tuple[str, str | None]] = {}
+        self._tree_children: dict[_TreeKey, list[_TreeKey]] = {}
+        # The running History tree load; refreshes during it queue one more load
+        self._history_worker: _HistoryLoadWorker | None = None
+        self._history_reload_pending = False
+        # Recording to select once the in-flight History load lands
+        self._pending_select_id: str | None = None
 
         self._setup_ui()
         self.refresh()
@@ -117,12 +469,12 @@ class CalendarPanel(QWidget):
         self.btn_today.setCheckable(True)
         self.btn_today.setChecked(True)
         self.btn_today.setStyleSheet(TOGGLE_TAB)
-        self.btn_today.clicked.connect(lambda: self._switch_view(0))
+        self.btn_today.clicked.connect(self._show_today)
 
         self.btn_history = QPushButton("History")
         self.btn_history.setCheckable(True)
         self.btn_history.setStyleSheet(TOGGLE_TAB)
-        self.btn_history.clicked.connect(lambda: self._switch_view(1))
+        self.btn_history.clicked.connect(self._show_history)
 
         toggle_layout.addWidget(self.btn_today)
         toggle_layout.addWidget(self.btn_history)
@@ -132,17 +484,19 @@ class CalendarPanel(QWidget):
         self.view_stack = QStackedWidget()
         layout.addWidget(self.view_stack, stretch=1)
 
-        # Page 0: Meeting List (Today) - Wrapper widget? No, list widget directly
-        self.meeting_list = QListWidget()
+        # Page 0: Meeting List (Today) - a view over MeetingListModel's plain rows
+        self.meeting_model = MeetingListModel(self)
+        self.meeting_list = QListView()
+        self.meeting_list.setModel(self.meeting_model)
         self.meeting_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.meeting_list.customContextMenuRequested.connect(self._show_context_menu)
-        self.meeting_list.itemClicked.connect(self._on_item_clicked)
+        self.meeting_list.clicked.connect(self._on_item_clicked)
         self.meeting_list.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
         self.meeting_list.setWordWrap(True)  # Wrap long meeting names
         self.meeting_list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         # Add spacing/padding for better readability (keeps native theme colors)
         self.meeting_list.setSpacing(4)
-        self.meeting_list.setStyleSheet("QListWidget::item { padding: 8px 6px; }")
+        self.meeting_list.setStyleSheet("QListView::item { padding: 8px 6px; }")
 
         # Connect scroll event for lazy loading
         self.meeting_list.verticalScrollBar().valueChanged.connect(self._on_scroll)
@@ -161,11 +515,21 @@ class CalendarPanel(QWidget):
         self.search_bar.textChanged.connect(self._on_search_text_changed)
         history_layout.addWidget(self.search_bar)
 
+        # Runs the search once typing pauses, instead of on every keystroke
+        self._pending_search = ""
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._run_search)
+
         # Folder Tree
         self.folder_tree = FolderTree()
         self.folder_tree.setHeaderHidden(True)
         self.folder_tree.setColumnCount(1)
         self.folder_tree.header().setStretchLastSection(True)
+        # Every row is one unwrapped line, so the view can size rows from the first
+        # one instead of measuring each item as it is inserted or scrolled past
+        self.folder_tree.setUniformRowHeights(True)
         self.folder_tree.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
 
         self.folder_tree.setDragEnabled(True)
@@ -174,7 +538,7 @@ class CalendarPanel(QWidget):
         self.folder_tree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.folder_tree.customContextMenuRequested.connect(self._show_tree_context_menu)
         self.folder_tree.itemClicked.connect(self._on_tree_item_clicked)
-        self.folder_tree.item_moved_to_folder.connect(self._on_item_moved_to_folder)
+        self.folder_tree.items_moved_to_folder.connect(self._on_items_moved_to_folder)
         self.folder_tree.setIndentation(16)
         self.folder_tree.setStyleSheet("QTreeWidget::item { padding: 6px 6px; margin: 1px 0px; }")
 
@@ -185,9 +549,13 @@ class CalendarPanel(QWidget):
         self.search_results_list.setWordWrap(True)
         self.search_results_list.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
         self.search_results_list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        # Re-query size hints on resize so snippets re-wrap to the new width
+        self.search_results_list.setResizeMode(QListWidget.ResizeMode.Adjust)
         self.search_results_list.setStyleSheet(
             "QListWidget { background: transparent; border: none; }"
         )
+        self._search_delegate = SearchResultDelegate(self.search_results_list)
+        self.search_results_list.setItemDelegate(self._search_delegate)
         self.search_results_list.itemClicked.connect(self._on_search_result_clicked)
         self.search_results_list.setVisible(False)
         history_layout.addWidget(self.search_results_list)
@@ -215,6 +583,15 @@ class CalendarPanel(QWidget):
         self.settings_btn.clicked.connect(self.settings_requested.emit)
         layout.addWidget(self.settings_btn)
 
+    @pyqtSlot()
+    def _show_today(self):
+        self._switch_view(0)
+
+    @pyqtSlot()
+    def _show_history(self):
+        self._switch_view(1)
+
+    @pyqtSlot(int)
     def _switch_view(self, index: int):
         self.view_stack.setCurrentIndex(index)
         self.btn_today.setChecked(index == 0)
@@ -225,40 +602,23 @@ class CalendarPanel(QWidget):
         if index == 1:
             self._refresh_history_tree()
 
-    def _add_section_header(self, label: str) -> None:
-        """Add a section header (UPCOMING, TODAY, etc.)."""
-        item = QListWidgetItem(label)
-        item.setFlags(Qt.ItemFlag.NoItemFlags)
-        item.setData(Qt.ItemDataRole.UserRole + 1, ITEM_TYPE_HEADER)
-        font = QFont()
-        font.setBold(True)
-        font.setPointSize(10)
-        item.setFont(font)
-        item.setForeground(Qt.GlobalColor.gray)
-        self.meeting_list.addItem(item)
-
-    def _add_date_header(self, label: str) -> None:
-        """Add a date group header."""
-        item = QListWidgetItem(label)
-        item.setFlags(Qt.ItemFlag.NoItemFlags)
-        item.setData(Qt.ItemDataRole.UserRole + 1, ITEM_TYPE_HEADER)
-        font = QFont()
-        font.setBold(True)
-        font.setPointSize(9)
-        item.setFont(font)
-        item.setForeground(Qt.GlobalColor.darkGray)
-        self.meeting_list.addItem(item)
+    def _section_header_row(self, label: str) -> _MeetingRow:
+        """Build a section header row (UPCOMING, TODAY, etc.)."""
+        return (_HEADER_DATA, label, None, self._section_font, _SECTION_HEADER_COLOR)
+
+    def _date_header_row(self, label: str) -> _MeetingRow:
+        """Build a date group header row."""
+        return (_HEADER_DATA, label, None, self._date_font, _DIMMED_COLOR)
 
     def _to_local(self, dt: datetime) -> datetime:
         """Convert datetime to local time, handling both aware and naive datetimes."""
         if dt.tzinfo is not None:
-            return dt.astimezone().replace(tzinfo=None)
+            return _aware_to_local(dt)
         return dt
 
-    def _format_time(self, dt: datetime) -> str:
-        """Format time as 9:30 AM (converting to local time if needed)."""
-        local_dt = self._to_local(dt)
-        return local_dt.strftime("%I:%M %p").lstrip("0")
+    def _format_time(self, iso: str) -> str:
+        """Format an ISO timestamp as 9:30 AM (converting to local time if needed)."""
+        return _fmt_time(iso)
 
     def _format_duration(self, seconds: float | None) -> str:
         """Format duration as '32 min'."""
@@ -271,33 +631,36 @@ class CalendarPanel(QWidget):
         """Detect meeting platform from link."""
         return get_meeting_platform(meet_link)
 
-    def _create_calendar_item(
+    def _calendar_event_row(
         self,
         event: dict,
         is_upcoming: bool = False,
-    ) -> QListWidgetItem:
-        """Create a list item for a calendar event."""
+        now: datetime | None = None,
+    ) -> _MeetingRow:
+        """Build the list row for a calendar event.
+
+        Pass ``now`` when building many rows so they share one clock reading.
+        """
         title = event["title"]
-        start_time_raw = datetime.fromisoformat(event["start_time"])
-        end_time_raw = datetime.fromisoformat(event["end_time"])
-        meet_link = event.get("meet_link")
         recording_id = event.get("rec_id")
         rec_duration = event.get("rec_duration")
 
-        # Convert to local naive datetimes for comparison with datetime.now()
-        start_time = self._to_local(start_time_raw)
-        end_time = self._to_local(end_time_raw)
-        now = get_now()
+        # Convert to local naive datetimes once for comparison with datetime.now()
+        start_time = self._to_local(_parse_iso(event["start_time"]))
+        end_time = self._to_local(_parse_iso(event["end_time"]))
+        if now is None:
+            now = get_now()
+        in_progress = start_time <= now <= end_time
 
-        time_str = self._format_time(start_time_raw)
-        platform = self._get_meeting_platform(meet_link)
+        time_str = self._format_time(event["start_time"])
+        platform = self._get_meeting_platform(event.get("meet_link"))
 
         # Determine status
         if recording_id and rec_duration:
             duration_str = self._format_duration(rec_duration)
             status_prefix = f"{ICON_CHECKMARK} "
             detail = f"{time_str} {ICON_BULLET} {duration_str}"
-        elif start_time <= now <= end_time:
+        elif in_progress:
             status_prefix = f"{ICON_PLAY} "
             detail = f"NOW {ICON_BULLET} {platform}" if platform else "NOW"
         elif is_upcoming:
@@ -313,41 +676,41 @@ class CalendarPanel(QWidget):
             status_prefix = f"{ICON_CIRCLE_EMPTY} "
             detail = time_str
 
-        item = QListWidgetItem(f"{status_prefix}{title}\n{detail}")
-        item.setToolTip(title)
-        item.setData(Qt.ItemDataRole.UserRole, event["event_id"])
-        item.setData(Qt.ItemDataRole.UserRole + 1, ITEM_TYPE_CALENDAR_EVENT)
-        item.setData(Qt.ItemDataRole.UserRole + 2, recording_id)
-
-        if not recording_id and start_time < now and not (start_time <= now <= end_time):
-            item.setForeground(Qt.GlobalColor.darkGray)
-
-        return item
+        dimmed = not recording_id and start_time < now and not in_progress
+        return (
+            (ITEM_TYPE_CALENDAR_EVENT, event["event_id"], recording_id),
+            f"{status_prefix}{title}\n{detail}",
+            title,
+            None,
+            _DIMMED_COLOR if dimmed else None,
+        )
 
-    def _create_recording_item(self, rec: dict) -> QListWidgetItem:
-        """Create a list item for an unlinked recording."""
+    def _recording_row(self, rec: dict) -> _MeetingRow:
+        """Build the list row for an unlinked recording."""
         title = rec["title"]
         ts = rec["started_at"]
         duration = rec["duration_seconds"]
 
         try:
-            dt = datetime.fromisoformat(ts)
-            time_str = self._format_time(dt)
+            time_str = self._format_time(ts)
         except (ValueError, TypeError):
             time_str = str(ts)
 
         duration_str = self._format_duration(duration)
         detail = f"{time_str} {ICON_BULLET} {duration_str}" if duration_str else time_str
 
-        item = QListWidgetItem(f"{ICON_CHECKMARK} {title}\n{detail}")
-        item.setToolTip(title)
-        item.setData(Qt.ItemDataRole.UserRole, rec["id"])
-        item.setData(Qt.ItemDataRole.UserRole + 1, ITEM_TYPE_RECORDING)
-
-        return item
+        return (
+            (ITEM_TYPE_RECORDING, rec["id"], rec["id"]),
+            f"{ICON_CHECKMARK} {title}\n{detail}",
+            title,
+            None,
+            None,
+        )
 
     def refresh(self):
         """Refresh the panel - show calendar events if connected, otherwise recordings."""
+        self._search_cache.clear()
+        self._folders_cache = None
         # Only refresh list if visible
         if self.view_stack.currentIndex() == 0:
             self._refresh_today_view()
@@ -358,254 +721,369 @@ class CalendarPanel(QWidget):
         # Disable updates during bulk load for smoother UI
         self.meeting_list.setUpdatesEnabled(False)
         try:
-            self.meeting_list.clear()
+            rows: list[_MeetingRow] = []
             self._oldest_loaded_date = None
 
-            # Cache auth state so we don't hit keyring on every scroll event
-            self._calendar_connected = is_authenticated()
+            # Cache auth state so we don't hit keyring on every refresh
+            self._check_calendar_connected()
+
+            # Today's events, already split at now by the database
+            now = get_now()
+            today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+            today_end = today_start.replace(hour=23, minute=59, second=59)
+            past, upcoming = self.db.get_calendar_events_partitioned(today_start, now, today_end)
 
             # Use calendar view if authenticated OR if we have cached events
             # from a previous sync (e.g. token expired but sync worker already
             # populated the DB before expiry).
-            has_cached_events = bool(self.db.get_todays_calendar_events())
+            has_cached_events = bool(past or upcoming)
 
             if self._calendar_connected or has_cached_events:
-                self._load_calendar_view()
+                self._load_calendar_view(rows, now, past, upcoming)
             else:
-                self._load_recordings_view()
+                self._load_recordings_view(rows)
+            self.meeting_model.set_rows(rows)
+            self._restore_selection()
         finally:
             self.meeting_list.setUpdatesEnabled(True)
 
+    def _check_calendar_connected(self) -> None:
+        """Update the cached auth state, reading the keyring at most every few seconds."""
+        now = time.monotonic()
+        if (
+            self._auth_checked_at is None
+            or now - self._auth_checked_at >= CALENDAR_AUTH_CHECK_SECONDS
+        ):
+            self._calendar_connected = is_authenticated()
+            self._auth_checked_at = now
+
+    def invalidate_calendar_auth(self) -> None:
+        """Re-check calendar auth on the next refresh (after connecting or disconnecting)."""
+        self._auth_checked_at = None
+
     def _refresh_history_tree(self):
-        """Refresh the folder tree (History view)."""
-        current_selection = self._selected_id
-        self.folder_tree.clear()
+        """Refresh the folder tree (History view).
+
+        The queries run on a background thread; the current tree stays up
+        (or a loading placeholder on first load) until the results arrive.
+        """
+        self._search_cache.clear()
+        self._folders_cache = None
 
         # Reset search filter
         self.search_bar.clear()
 
-        try:
-            # Get data
-            folders = self.db.get_folders()
-            recordings = self.db.get_recordings()
-
-            # Fetch past calendar events to fill in gaps (unrecorded meetings).
-            # Use cached events from DB even if auth is currently invalid
-            # (sync worker may have populated them before token expiry).
-            past_events: list[dict] = self.db.get_all_past_calendar_events()
-
-            # Build folder map
-            folder_map: dict[str, QTreeWidgetItem] = {}
-
-            # 1. Create Folder Items
-            for folder in folders:
-                item = QTreeWidgetItem([folder["name"]])
-                item.setData(0, Qt.ItemDataRole.UserRole, f"folder:{folder['id']}")
-                item.setFlags(
-                    item.flags() | Qt.ItemFlag.ItemIsEditable | Qt.ItemFlag.ItemIsDropEnabled
-                )
-                # Store sort order if needed
-                folder_map[folder["id"]] = item
-
-            # Parent folder items
-            root = self.folder_tree.invisibleRootItem()
-            for folder in folders:
-                item = folder_map[folder["id"]]
-                parent_id = folder["parent_id"]
-                if parent_id and parent_id in folder_map:
-                    folder_map[parent_id].addChild(item)
-                else:
-                    root.addChild(item)
-                item.setExpanded(True)  # Expand by default for now
+        if self.folder_tree.topLevelItemCount() == 0:
+            placeholder = QTreeWidgetItem(["Loading..."])
+            placeholder.setFlags(Qt.ItemFlag.NoItemFlags)
+            self.folder_tree.addTopLevelItem(placeholder)
 
-            # 2. Add Items (Recordings + Unrecorded Events)
-            uncategorized_item = QTreeWidgetItem(["Uncategorized"])
-            uncategorized_item.setData(0, Qt.ItemDataRole.UserRole, "folder:uncategorized")
-            uncategorized_item.setFlags(uncategorized_item.flags() | Qt.ItemFlag.ItemIsDropEnabled)
-            has_uncategorized = False
+        if self._history_worker is not None:
+            # Its results are stale; load again once it finishes
+            self._history_reload_pending = True
+            return
+        self._start_history_load()
+
+    def _start_history_load(self):
+        """Start the background History tree load."""
+        worker = _HistoryLoadWorker(self.db, self)
+        worker.loaded.connect(self._on_history_loaded)
+        worker.finished.connect(worker.deleteLater)
+        self._history_worker = worker
+        worker.start()
+
+    @pyqtSlot(object)
+    def _on_history_loaded(self, data: dict | None):
+        """Rebuild the folder tree from a finished background load."""
+        self._history_worker = None
+        if self._history_reload_pending:
+            self._history_reload_pending = False
+            self._start_history_load()
+            return
 
-            # Collect uncategorized items for date grouping
-            uncategorized_items: list[tuple[datetime | None, QTreeWidgetItem, str, str]] = []
+        if data is not None:
+            self._folders_cache = data["folders"]
+            self._populate_history_tree(
+                data["folders"], data["recordings"], data["flags"], data["past_events"]
+            )
+        else:
+            self._reset_history_tree()
 
-            # Helper to create tree item
-            def create_tree_item(title, timestamp, item_id, item_type, folder_id):
-                nonlocal has_uncategorized
+        if self._pending_select_id is not None:
+            rec_id, self._pending_select_id = self._pending_select_id, None
+            if not self.select_meeting(rec_id):
+                self.meeting_not_found.emit(rec_id)
 
-                dt = None
-                try:
-                    dt = datetime.fromisoformat(str(timestamp))
-                    # Normalize to naive (local) datetime for consistent comparisons
-                    if dt.tzinfo is not None:
-                        dt = dt.replace(tzinfo=None)
-                    time_str = dt.strftime("%b %d %I:%M %p").lstrip("0")
-                except (ValueError, TypeError):
-                    time_str = ""
+    def shutdown(self):
+        """Wait for a running History tree load before the app quits."""
+        if self._history_worker is not None:
+            self._history_worker.wait()
 
-                display_text = f"{title} ({time_str})"
+    def _populate_history_tree(
+        self,
+        folders: list[dict],
+        recordings: list[dict],
+        flags: dict[str, tuple[bool, bool]],
+        past_events: list[dict],
+    ) -> None:
+        """Bring the folder tree in line with the given folders and items.
+
+        Items are kept across refreshes, keyed by their TREE_DATA_ROLE data. Only rows
+        whose text changed are updated and only parents whose children changed
+        are refilled, so a rename or a move touches a handful of items. When
+        most rows differ the tree is rebuilt from scratch instead.
+        """
+        # Desired state: (text, tooltip) per row, and child keys per parent in order
+        rows: dict[_TreeKey, tuple[str, str | None]] = {}
+        children: dict[_TreeKey, list[_TreeKey]] = {_TREE_ROOT_KEY: []}
+
+        # 1. Folders
+        folder_keys = {folder["id"]: (ITEM_TYPE_FOLDER, folder["id"]) for folder in folders}
+        for folder in folders:
+            key = folder_keys[folder["id"]]
+            rows[key] = (folder["name"], None)
+            children[key] = []
+        for folder in folders:
+            parent_key = folder_keys.get(folder["parent_id"], _TREE_ROOT_KEY)
+            children[parent_key].append(folder_keys[folder["id"]])
+
+        # 2. Items (Recordings + Unrecorded Events)
+        # Collect uncategorized items for date grouping
+        uncategorized_items: list[tuple[datetime | None, _TreeKey]] = []
+
+        def add_row(title, timestamp, key, folder_id):
+            dt = None
+            try:
+                dt = _parse_iso(str(timestamp))
+                # Normalize to naive (local) datetime for consistent comparisons
+                if dt.tzinfo is not None:
+                    dt = dt.replace(tzinfo=None)
+                time_str = dt.strftime(_TREE_TIME_FORMAT).lstrip("0")
+            except (ValueError, TypeError):
+                time_str = ""
 
+            text = f"{title} ({time_str})"
+            if key[0] == ITEM_TYPE_RECORDING:
                 # Append inline indicators for notes/transcript
-                indicators = ""
-                if item_type == ITEM_TYPE_RECORDING:
-                    rec = self.db.get_recording(item_id)
-                    if rec:
-                        if rec.get("notes"):
-                            indicators += " \U0001f4c4"
-                        transcript = self.db.get_transcript(item_id)
-                        if transcript:
-                            indicators += " \U0001f4ac"
-
-                item = QTreeWidgetItem([display_text + indicators])
-                item.setToolTip(0, title)
-
-                if item_type == ITEM_TYPE_RECORDING:
-                    item.setData(0, Qt.ItemDataRole.UserRole, f"rec:{item_id}")
-                else:
-                    item.setData(0, Qt.ItemDataRole.UserRole, f"event:{item_id}")
+                has_notes, has_transcript = flags.get(key[1], (False, False))
+                if has_notes:
+                    text += " \U0001f4c4"
+                if has_transcript:
+                    text += " \U0001f4ac"
+            rows[key] = (text, title)
+
+            if folder_id and folder_id in folder_keys:
+                children[folder_keys[folder_id]].append(key)
+            else:
+                # Defer adding to uncategorized for date grouping
+                uncategorized_items.append((dt, key))
 
-                item.setFlags(
-                    Qt.ItemFlag.ItemIsSelectable
-                    | Qt.ItemFlag.ItemIsEnabled
-                    | Qt.ItemFlag.ItemIsDragEnabled
-                )
+        # Track added IDs to avoid duplicates
+        # (Recordings take precedence over calendar events)
+        added_recording_ids = set()
 
-                if folder_id and folder_id in folder_map:
-                    folder_map[folder_id].addChild(item)
-                else:
-                    # Defer adding to uncategorized for date grouping
-                    uncategorized_items.append((dt, item, item_id, item_type))
-                    has_uncategorized = True
-
-                return item
-
-            # Track added IDs to avoid duplicates
-            # (Recordings take precedence over calendar events)
-            added_recording_ids = set()
-
-            # Add Recordings
-            for rec in recordings:
-                # Helper uses rec dict, so we can't easily reuse it as-is for the column logic
-                # unless we update create_tree_item.
-                # But create_tree_item is generic for events too.
-                # Let's pass the 'rec' dict to create_tree_item optionally or handle it inside.
-
-                # Refactor create_tree_item to accept 'data_dict' for extra info
-                item = create_tree_item(
-                    rec["title"],
-                    rec["started_at"],
-                    rec["id"],
-                    ITEM_TYPE_RECORDING,
-                    rec.get("folder_id"),
-                )
-                added_recording_ids.add(rec["id"])
-
-                # Restore selection
-                if rec["id"] == current_selection and self._selected_type == ITEM_TYPE_RECORDING:
-                    item.setSelected(True)
-                    self.folder_tree.setCurrentItem(item)
-
-            # Add Unrecorded Past Events
-            for event in past_events:
-                # If event is linked to a recording we already added, skip it
-                if event.get("rec_id") and event["rec_id"] in added_recording_ids:
-                    continue
-
-                # Use calendar event folder_id if available
-                folder_id = event.get("folder_id")
-
-                item = create_tree_item(
-                    event["title"],
-                    event["start_time"],
-                    event["event_id"],
-                    ITEM_TYPE_CALENDAR_EVENT,
-                    folder_id,
-                )
-
-                # Restore selection
-                if (
-                    event["event_id"] == current_selection
-                    and self._selected_type == ITEM_TYPE_CALENDAR_EVENT
-                ):
-                    item.setSelected(True)
-                    self.folder_tree.setCurrentItem(item)
-
-            if has_uncategorized:
-                # Sort uncategorized items by date (newest first)
-                uncategorized_items.sort(key=lambda x: x[0] if x[0] else datetime.min, reverse=True)
-
-                # Group by date and add with date sub-headers
-                current_date_group = None
-                for dt, item, item_id, item_type in uncategorized_items:
-                    if dt:
-                        date_group = self._get_date_group(dt)
-                        if date_group != current_date_group:
-                            current_date_group = date_group
-                            date_header = QTreeWidgetItem([date_group])
-                            date_header.setData(0, Qt.ItemDataRole.UserRole, "header:date")
-                            date_header.setFlags(Qt.ItemFlag.NoItemFlags)
-                            font = QFont()
-                            font.setBold(True)
-                            font.setPointSize(9)
-                            date_header.setFont(0, font)
-                            date_header.setForeground(0, Qt.GlobalColor.gray)
-                            uncategorized_item.addChild(date_header)
-
-                    uncategorized_item.addChild(item)
-
-                    # Restore selection
-                    if item_type == ITEM_TYPE_RECORDING:
-                        if (
-                            item_id == current_selection
-                            and self._selected_type == ITEM_TYPE_RECORDING
-                        ):
-                            item.setSelected(True)
-                            self.folder_tree.setCurrentItem(item)
-                    elif (
-                        item_type == ITEM_TYPE_CALENDAR_EVENT
-                        and item_id == current_selection
-                        and self._selected_type == ITEM_TYPE_CALENDAR_EVENT
-                    ):
-                        item.setSelected(True)
-                        self.folder_tree.setCurrentItem(item)
-
-                root.addChild(uncategorized_item)
-                uncategorized_item.setExpanded(True)
+        # Add Recordings
+        for rec in recordings:
+            add_row(
+                rec["title"],
+                rec["started_at"],
+                (ITEM_TYPE_RECORDING, rec["id"]),
+                rec.get("folder_id"),
+            )
+            added_recording_ids.add(rec["id"])
+
+        # Add Unrecorded Past Events
+        for event in past_events:
+            # If event is linked to a recording we already added, skip it
+            if event.get("rec_id") and event["rec_id"] in added_recording_ids:
+                continue
+            # Use calendar event folder_id if available
+            add_row(
+                event["title"],
+                event["start_time"],
+                (ITEM_TYPE_CALENDAR_EVENT, event["event_id"]),
+                event.get("folder_id"),
+            )
+
+        if uncategorized_items:
+            rows[_UNCATEGORIZED_KEY] = ("Uncategorized", None)
+            children[_TREE_ROOT_KEY].append(_UNCATEGORIZED_KEY)
+            uncategorized_children = children[_UNCATEGORIZED_KEY] = []
+
+            # Sort uncategorized items by date (newest first)
+            uncategorized_items.sort(key=lambda x: x[0] if x[0] else datetime.min, reverse=True)
+
+            # Group by date with date sub-headers, labelling each date once
+            today = get_now().date()
+            current_date = None
+            current_date_group = None
+            for dt, key in uncategorized_items:
+                if dt and dt.date() != current_date:
+                    current_date = dt.date()
+                    date_group = self._get_date_group(dt, today)
+                    if date_group != current_date_group:
+                        current_date_group = date_group
+                        header_key = (ITEM_TYPE_HEADER, date_group)
+                        rows[header_key] = (date_group, None)
+                        uncategorized_children.append(header_key)
+                uncategorized_children.append(key)
+
+        # Rebuild outright when most rows are new or gone
+        if len(rows.keys() ^ self._tree_items.keys()) > len(rows) // 2:
+            self._tree_hidden = []
+            self.folder_tree.clear()
+            self._tree_items = {}
+            self._tree_rows = {}
+            self._tree_children = {}
+
+        # The loading placeholder (or a drop) can leave the top level out of step
+        old_children = self._tree_children
+        if self.folder_tree.topLevelItemCount() != len(old_children.get(_TREE_ROOT_KEY, [])):
+            old_children.pop(_TREE_ROOT_KEY, None)
+        changed_parents = {
+            key for key, keys in children.items() if old_children.get(key) != keys
+        } | (old_children.keys() - children.keys())
+
+        # Items are attached with one addChildren call per changed parent, with
+        # repaints and signals held off until the tree is complete
+        self.folder_tree.setUpdatesEnabled(False)
+        self.folder_tree.blockSignals(True)
+        self.folder_tree.setSortingEnabled(False)
+        try:
+            # Detach first, so items moving between parents are free to re-attach
+            for key in changed_parents:
+                parent = self._tree_parent_item(key)
+                if parent is not None:
+                    parent.takeChildren()
+
+            for key in self._tree_items.keys() - rows.keys():
+                del self._tree_items[key]
+            for key, row in rows.items():
+                item = self._tree_items.get(key)
+                if item is None:
+                    self._tree_items[key] = self._create_history_item(key, *row)
+                elif self._tree_rows.get(key) != row:
+                    text, tooltip = row
+                    item.setText(0, text)
+                    if tooltip is not None:
+                        item.setToolTip(0, tooltip)
+            self._tree_rows = rows
+            self._tree_children = children
+
+            for key in changed_parents:
+                parent = self._tree_parent_item(key)
+                if parent is not None and key in children:
+                    parent.addChildren([self._tree_items[child] for child in children[key]])
+
+            # Expand (expansion needs items in the tree)
+            for key in children:
+                if key != _TREE_ROOT_KEY:
+                    self._tree_items[key].setExpanded(True)  # Expand by default for now
+
+            self._tree_index = [
+                (self._tree_items[key], text.lower()) for key, (text, _) in rows.items()
+            ]
+            # Re-apply any active filter to the new and updated rows
+            filter_text, self._tree_filter = self._tree_filter, ""
+            if filter_text:
+                self._filter_tree(filter_text)
+
+            # Restore selection
+            selected_item = None
+            if self._selected_type in (ITEM_TYPE_RECORDING, ITEM_TYPE_CALENDAR_EVENT):
+                selected_item = self._tree_items.get((self._selected_type, self._selected_id))
+            if selected_item is not None:
+                selected_item.setSelected(True)
+                self.folder_tree.setCurrentItem(selected_item)
 
         except Exception as e:
             logger.error("Error refreshing folder tree: %s", e)
+            self._reset_history_tree()
+        finally:
+            self.folder_tree.blockSignals(False)
+            self.folder_tree.setUpdatesEnabled(True)
+
+    def _tree_parent_item(self, key: _TreeKey) -> QTreeWidgetItem | None:
+        """Get the tree item that holds the children laid out under key."""
+        if key == _TREE_ROOT_KEY:
+            root: QTreeWidgetItem | None = self.folder_tree.invisibleRootItem()
+            return root
+        return self._tree_items.get(key)
+
+    def _create_history_item(
+        self, key: _TreeKey, text: str, tooltip: str | None
+    ) -> QTreeWidgetItem:
+        """Create the folder tree item for a layout key."""
+        item = QTreeWidgetItem([text])
+        item.setData(0, TREE_DATA_ROLE, key)
+        item_type = key[0]
+        if item_type == ITEM_TYPE_HEADER:
+            item.setFlags(Qt.ItemFlag.NoItemFlags)
+            item.setFont(0, self._date_font)
+            item.setForeground(0, Qt.GlobalColor.gray)
+            return item
+
+        if key == _UNCATEGORIZED_KEY:
+            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsDropEnabled)
+        elif item_type == ITEM_TYPE_FOLDER:
+            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsEditable | Qt.ItemFlag.ItemIsDropEnabled)
+        else:
+            if tooltip is not None:
+                item.setToolTip(0, tooltip)
+            item.setFlags(
+                Qt.ItemFlag.ItemIsSelectable
+                | Qt.ItemFlag.ItemIsEnabled
+                | Qt.ItemFlag.ItemIsDragEnabled
+            )
+        return item
+
+    def _reset_history_tree(self) -> None:
+        """Empty the folder tree and forget its items, so the next load rebuilds it."""
+        self._tree_hidden = []
+        self.folder_tree.clear()
+        self._tree_items = {}
+        self._tree_rows = {}
+        self._tree_children = {}
+        self._tree_index = []
 
+    @pyqtSlot(str)
     def _on_search_text_changed(self, text: str):
-        """Handle search text change."""
-        search_text = text.lower().strip()
+        """Handle search text change, restarting the debounce timer."""
+        self._pending_search = text.lower().strip()
+        if not self._pending_search:
+            # Clearing the search restores the tree immediately
+            self._search_timer.stop()
+            self._run_search()
+        else:
+            self._search_timer.start()
+
+    @pyqtSlot()
+    def _run_search(self):
+        """Show results for the pending search text, or the tree when it's empty."""
+        search_text = self._pending_search
 
         if not search_text:
             self.folder_tree.setVisible(True)
             self.search_results_list.setVisible(False)
             self.new_folder_btn.setVisible(True)
             # Reset tree visibility
-            root = self.folder_tree.invisibleRootItem()
-            for i in range(root.childCount()):
-                self._filter_recursive(root.child(i), "")
+            self._filter_tree("")
             return
 
         self.new_folder_btn.setVisible(False)
         self.folder_tree.setVisible(False)
         self.search_results_list.setVisible(True)
         self.search_results_list.clear()
+        self._search_delegate.clear_cache()
 
-        # 1. Title Matches (from loaded tree data or DB? DB is better for global search)
-        # Using DB for consistency with FTS
-        # But we need recording titles.
-        # Let's assume FTS handles title search if we added title to FTS index?
-        # We didn't. We only added text/summary.
-        # So we should query recordings by title LIKE %query%
-
-        # We can implement a unified search method in DB or do it here.
-        # Doing it here requires two DB calls.
-
-        # Search FTS
-        fts_results = self.db.search_transcripts(search_text)
-
-        # TODO: Search titles too
+        # Search transcripts and titles (FTS), reusing results for repeated text
+        fts_results = self._search_cache.get(search_text)
+        if fts_results is None:
+            fts_results = self.db.search_transcripts(search_text)
+            if len(self._search_cache) >= SEARCH_CACHE_SIZE:
+                # Dicts keep insertion order, so this evicts the oldest query
+                del self._search_cache[next(iter(self._search_cache))]
+            self._search_cache[search_text] = fts_results
 
         if not fts_results:
             item = QListWidgetItem("No results found.")
@@ -624,36 +1102,18 @@ class CalendarPanel(QWidget):
         snippet = res.get("text_snippet")
 
         try:
-            dt = datetime.fromisoformat(res["started_at"])
-            date_str = dt.strftime("%b %d, %Y")
+            dt = _parse_iso(res["started_at"])
+            date_str = dt.strftime(_SEARCH_DATE_FORMAT)
         except (ValueError, TypeError):
             date_str = ""
 
-        # Create widget for rich text
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
-        layout.setContentsMargins(8, 8, 8, 8)
-        layout.setSpacing(2)
-
-        # Header: Title + Date
-        header_lbl = QLabel(f"<b>{title}</b> <span style='color: #888;'>{date_str}</span>")
-        header_lbl.setTextFormat(Qt.TextFormat.RichText)
-        layout.addWidget(header_lbl)
-
-        # Snippet
-        if snippet:
-            snippet_lbl = QLabel(f"<span style='color: #ccc;'>...{snippet}...</span>")
-            snippet_lbl.setTextFormat(Qt.TextFormat.RichText)
-            snippet_lbl.setWordWrap(True)
-            layout.addWidget(snippet_lbl)
-
-        # Add to list
-        item = QListWidgetItem(self.search_results_list)
-        item.setSizeHint(widget.sizeHint())
+        item = QListWidgetItem(title)
+        item.setToolTip(title)
         item.setData(Qt.ItemDataRole.UserRole, rec_id)
+        item.setData(SEARCH_RESULT_ROLE, (title, date_str, snippet))
         self.search_results_list.addItem(item)
-        self.search_results_list.setItemWidget(item, widget)
 
+    @pyqtSlot(QListWidgetItem)
     def _on_search_result_clicked(self, item: QListWidgetItem):
         """Handle click on search result."""
         rec_id = item.data(Qt.ItemDataRole.UserRole)
@@ -661,51 +1121,67 @@ class CalendarPanel(QWidget):
             search_term = self.search_bar.text().strip()
             self.search_result_selected.emit(rec_id, search_term)
 
-    def _filter_recursive(self, item: QTreeWidgetItem, text: str) -> bool:
-        """Recursively filter tree items."""
-        # Check if item matches
-        item_text = item.text(0).lower()
-        matches = text in item_text
-
-        # Check children
-        child_matches = False
-        for i in range(item.childCount()):
-            child = item.child(i)
-            if child is not None and self._filter_recursive(child, text):
-                child_matches = True
-
-        # If item matches or any child matches, show it
-        should_show = matches or child_matches
-        item.setHidden(not should_show)
-
-        # If showing because of child or match, expand if there is text
-        if should_show and text:
-            item.setExpanded(True)
+    def _filter_tree(self, text: str) -> None:
+        """Show only tree items whose text contains text, plus their ancestors.
+
+        Matches against the lowercased texts indexed when the tree was built,
+        rather than walking the tree and reading each item's text back from Qt.
+        Only items whose visibility changes are touched, so clearing an unfiltered
+        tree (as every refresh does) costs nothing.
+        """
+        if text == self._tree_filter:
+            return
+        for item in self._tree_hidden:
+            item.setHidden(False)
+        self._tree_filter = text
+        self._tree_hidden = []
+        if not text:
+            return
 
-        return should_show
+        matched = []
+        for item, item_text in self._tree_index:
+            if text in item_text:
+                matched.append(item)
+            else:
+                item.setHidden(True)
+                self._tree_hidden.append(item)
 
-    def _on_item_moved_to_folder(self, rec_id: str, folder_id: str | None):
-        """Handle item dropped into a folder."""
+        # Expand matches and reveal the folders containing them
+        for item in matched:
+            item.setExpanded(True)
+            parent = item.parent()
+            while parent is not None:
+                parent.setHidden(False)
+                parent.setExpanded(True)
+                parent = parent.parent()
+
+    @pyqtSlot(list)
+    def _on_items_moved_to_folder(self, moves: list[tuple[str, str | None]]):
+        """Handle items dropped into a folder."""
+        # Qt has already moved the items, so the recorded layout no longer matches;
+        # the next refresh refills every parent (reusing the items)
+        self._tree_children = {}
         try:
-            self.db.set_recording_folder(rec_id, folder_id)
+            self.db.set_recording_folders(moves)
         except Exception as e:
-            logger.error("Error moving recording: %s", e)
+            logger.error("Error moving recordings: %s", e)
             self._refresh_history_tree()  # Revert on error
 
+    @pyqtSlot(QTreeWidgetItem, int)
     def _on_tree_item_clicked(self, item: QTreeWidgetItem, column: int):
         """Handle tree selection."""
-        # Get data from column 0 (which stores the ID)
-        data = item.data(0, Qt.ItemDataRole.UserRole)
+        # Get data from column 0 (which stores the type and ID)
+        data = item.data(0, TREE_DATA_ROLE)
         if not data:
             return
 
-        if data.startswith("rec:"):
-            rec_id = data.split(":", 1)[1]
-            self._selected_id = rec_id
+        item_type, item_id = data
+        if item_type == ITEM_TYPE_RECORDING:
+            self._selected_id = item_id
             self._selected_type = ITEM_TYPE_RECORDING
-            self.recording_selected.emit(rec_id)
-        elif data.startswith("event:"):
-            event_id = data.split(":", 1)[1]
+            self.recording_selected.emit(item_id)
+        elif item_type == ITEM_TYPE_CALENDAR_EVENT:
+            event_id = item_id
             self._selected_id = event_id
             self._selected_type = ITEM_TYPE_CALENDAR_EVENT
             self.meeting_selected.emit(event_id)
@@ -713,34 +1189,20 @@ class CalendarPanel(QWidget):
             # Folder clicked
             pass
 
-    def _show_tree_context_menu(self, position):
+    @pyqtSlot(QPoint)
+    def _show_tree_context_menu(self, position: QPoint):
         item = self.folder_tree.itemAt(position)
         if not item:
             return
 
-        data = item.data(0, Qt.ItemDataRole.UserRole)
+        data = item.data(0, TREE_DATA_ROLE)
         if not data:
             return
 
+        item_type, item_id = data
         menu = QMenu(self)
-        if data.startswith("rec:"):
-            rec_id = data.split(":", 1)[1]
-
-            # Move to folder submenu
-            move_menu = menu.addMenu("Move to Folder")
-            folders = self.db.get_folders()
-
-            # Add Uncategorized option
-            uncat_action = QAction("Uncategorized", self)
-            uncat_action.triggered.connect(lambda: self._move_recording(rec_id, None))
-            move_menu.addAction(uncat_action)
-            move_menu.addSeparator()
-
-            for folder in folders:
-                action = QAction(folder["name"], self)
-                action.triggered.connect(lambda f=folder: self._move_recording(rec_id, f["id"]))
-                move_menu.addAction(action)
-
+        if item_type == ITEM_TYPE_RECORDING:
+            self._add_move_menu(menu, item_type, item_id)
             menu.addSeparator()
 
             rename_action = QAction("Rename", self)
@@ -751,37 +1213,21 @@ class CalendarPanel(QWidget):
             delete_action.triggered.connect(lambda: self._delete_recording_from_tree(item))
             menu.addAction(delete_action)
 
-        elif data.startswith("event:"):
-            event_id = data.split(":", 1)[1]
-
-            # Move to folder submenu (for events)
-            move_menu = menu.addMenu("Move to Folder")
-            folders = self.db.get_folders()
-
-            # Add Uncategorized option
-            uncat_action = QAction("Uncategorized", self)
-            uncat_action.triggered.connect(lambda: self._move_calendar_event(event_id, None))
-            move_menu.addAction(uncat_action)
-            move_menu.addSeparator()
-
-            for folder in folders:
-                action = QAction(folder["name"], self)
-                action.triggered.connect(
-                    lambda f=folder: self._move_calendar_event(event_id, f["id"])
-                )
-                move_menu.addAction(action)
+        elif item_type == ITEM_TYPE_CALENDAR_EVENT:
+            event_id = item_id
 
+            self._add_move_menu(menu, item_type, event_id)
             menu.addSeparator()
 
             hide_action = QAction("Hide from list", self)
             hide_action.triggered.connect(lambda: self._hide_calendar_event(event_id, item.text(0)))
             menu.addAction(hide_action)
 
-        elif data.startswith("folder:"):
-            if data == "folder:uncategorized":
+        elif item_type == ITEM_TYPE_FOLDER:
+            if item_id is None:
                 return  # Cannot modify uncategorized
 
-            folder_id = data.split(":", 1)[1]
+            folder_id = item_id
 
             rename_action = QAction("Rename", self)
             rename_action.triggered.connect(lambda: self._rename_folder(folder_id, item.text(0)))
@@ -793,6 +1239,42 @@ class CalendarPanel(QWidget):
 
         menu.exec(self.folder_tree.viewport().mapToGlobal(position))
 
+    def _add_move_menu(self, menu: QMenu, item_type: str, item_id: str) -> None:
+        """Add a "Move to Folder" submenu for a recording or calendar event.
+
+        Each action carries its (item_type, item_id, folder_id) as data, and the
+        submenu's triggered signal drives one slot, instead of a closure per folder.
+        """
+        move_menu = QMenu("Move to Folder", menu)
+        menu.addMenu(move_menu)
+        move_menu.triggered.connect(self._on_move_action_triggered)
+
+        # Add Uncategorized option
+        uncategorized_action = QAction("Uncategorized", move_menu)
+        uncategorized_action.setData((item_type, item_id, None))
+        move_menu.addAction(uncategorized_action)
+        move_menu.addSeparator()
+
+        for folder in self._folders():
+            folder_action = QAction(folder["name"], move_menu)
+            folder_action.setData((item_type, item_id, folder["id"]))
+            move_menu.addAction(folder_action)
+
+    @pyqtSlot(QAction)
+    def _on_move_action_triggered(self, action: QAction) -> None:
+        """Move the recording or event a "Move to Folder" action was built for."""
+        item_type, item_id, folder_id = action.data()
+        if item_type == ITEM_TYPE_RECORDING:
+            self._move_recording(item_id, folder_id)
+        else:
+            self._move_calendar_event(item_id, folder_id)
+
+    def _folders(self) -> list[dict]:
+        """Get all folders, querying the database only when the cache is empty."""
+        if self._folders_cache is None:
+            self._folders_cache = self.db.get_folders()
+        return self._folders_cache
+
     def _move_calendar_event(self, event_id: str, folder_id: str | None):
         """Move a calendar event to a folder."""
         try:
@@ -801,6 +1283,7 @@ class CalendarPanel(QWidget):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to move event: {e}")
 
+    @pyqtSlot()
     def _create_folder(self):
         name, ok = QInputDialog.getText(self, "New Folder", "Folder Name:")
         if ok and name:
@@ -845,10 +1328,9 @@ class CalendarPanel(QWidget):
             QMessageBox.critical(self, "Error", f"Failed to move recording: {e}")
 
     def _rename_recording_from_tree(self, item: QTreeWidgetItem):
-        data = item.data(0, Qt.ItemDataRole.UserRole)
-        if not data or not data.startswith("rec:"):
+        item_type, rec_id = item.data(0, TREE_DATA_ROLE)
+        if item_type != ITEM_TYPE_RECORDING:
             return
-        rec_id = data.split(":", 1)[1]
 
         current_text = item.text(0)
         if "(" in current_text:
@@ -867,112 +1349,93 @@ class CalendarPanel(QWidget):
                 QMessageBox.critical(self, "Error", f"Failed to rename recording: {e}")
 
     def _delete_recording_from_tree(self, item: QTreeWidgetItem):
-        data = item.data(0, Qt.ItemDataRole.UserRole)
-        if not data or not data.startswith("rec:"):
+        item_type, rec_id = item.data(0, TREE_DATA_ROLE)
+        if item_type != ITEM_TYPE_RECORDING:
             return
-        rec_id = data.split(":", 1)[1]
         self._delete_recording_by_id(rec_id, None)  # Reuse existing delete logic but refresh tree
         # The existing _delete_recording_by_id refreshes the whole panel which is fine
         # But we need to ensure it refreshes the tree if we are in tree mode
         # Let's just override the refresh call or let it be.
         # Actually _delete_recording_by_id calls self.refresh(), which now handles both views.
 
-    def _load_calendar_view(self):
-        """Load the meetings-first calendar view."""
-        now = get_now()
+    def _load_calendar_view(
+        self, rows: list[_MeetingRow], now: datetime, past: list[dict], upcoming: list[dict]
+    ) -> None:
+        """Build the rows of the meetings-first calendar view from today's events."""
         today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
         today_end = today_start.replace(hour=23, minute=59, second=59)
 
-        events = self.db.get_calendar_events(today_start, today_end)
-
-        upcoming = []
-        past = []
-
-        for event in events:
-            start_time = self._to_local(datetime.fromisoformat(event["start_time"]))
-            if start_time > now:
-                upcoming.append(event)
-            else:
-                past.append(event)
-
         # UPCOMING section
         if upcoming:
-            self._add_section_header("UPCOMING")
+            rows.append(self._section_header_row("UPCOMING"))
             for event in upcoming:
-                item = self._create_calendar_item(event, is_upcoming=True)
-                self.meeting_list.addItem(item)
-                self._restore_selection(event["event_id"], ITEM_TYPE_CALENDAR_EVENT, item)
+                rows.append(self._calendar_event_row(event, is_upcoming=True, now=now))
 
         # TODAY section - past calendar events + unlinked recordings
-        self._add_section_header("EARLIER")
+        rows.append(self._section_header_row("EARLIER"))
 
         # Add past calendar events from today
         for event in reversed(past):
-            item = self._create_calendar_item(event, is_upcoming=False)
-            self.meeting_list.addItem(item)
-            self._restore_selection(event["event_id"], ITEM_TYPE_CALENDAR_EVENT, item)
+            rows.append(self._calendar_event_row(event, is_upcoming=False, now=now))
 
         # Add unlinked recordings from today
-        linked_ids = {e.get("rec_id") for e in events if e.get("rec_id")}
+        linked_ids = {e["rec_id"] for e in past + upcoming if e.get("rec_id")}
         todays_recordings = self._get_recordings_for_date(today_start, today_end)
         for rec in todays_recordings:
             if rec["id"] not in linked_ids:
-                item = self._create_recording_item(rec)
-                self.meeting_list.addItem(item)
-                self._restore_selection(rec["id"], ITEM_TYPE_RECORDING, item)
+                rows.append(self._recording_row(rec))
 
         # Track oldest loaded date for lazy loading
         self._oldest_loaded_date = today_start
 
-    def _load_recordings_view(self):
-        """Load the traditional recordings-only view (when calendar not connected)."""
+    def _load_recordings_view(self, rows: list[_MeetingRow]) -> None:
+        """Build the rows of the recordings-only view (when calendar not connected)."""
         # Limit to today's recordings to match "Today" view semantics
         now = get_now()
         today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
         today_end = today_start.replace(hour=23, minute=59, second=59)
 
         recordings = self.db.get_recordings_in_range(today_start, today_end)
+        today = today_start.date()
+        current_date = None
         current_group = None
 
         for rec in recordings:
             ts = rec["started_at"]
             try:
-                dt = datetime.fromisoformat(ts)
+                dt = _parse_iso(ts)
             except (ValueError, TypeError):
                 dt = None
 
-            if dt:
-                group = self._get_date_group(dt)
+            if dt and dt.date() != current_date:
+                current_date = dt.date()
+                group = self._get_date_group(dt, today)
                 if group != current_group:
                     current_group = group
-                    self._add_date_header(group)
+                    rows.append(self._date_header_row(group))
 
-            item = self._create_recording_item(rec)
-            self.meeting_list.addItem(item)
-            self._restore_selection(rec["id"], ITEM_TYPE_RECORDING, item)
+            rows.append(self._recording_row(rec))
 
         # Don't set _oldest_loaded_date so scroll won't trigger history load
 
-    def _get_date_group(self, dt: datetime) -> str:
-        """Get the date group label for a datetime."""
-        today = get_now().date()
-        rec_date = dt.date() if isinstance(dt, datetime) else dt
-
-        if rec_date == today:
-            return "Today"
-        elif rec_date == today - timedelta(days=1):
-            return "Yesterday"
-        elif rec_date >= today - timedelta(days=7):
-            return dt.strftime("%A")  # Day name
-        else:
-            return dt.strftime("%b %d, %Y")  # Nov 27, 2025
+    def _get_date_group(self, dt: datetime | date, today: date | None = None) -> str:
+        """Get the date group label for a datetime.
 
-    def _restore_selection(self, item_id: str, item_type: str, item: QListWidgetItem):
-        """Restore selection state for an item."""
-        if self._selected_id == item_id and self._selected_type == item_type:
-            item.setSelected(True)
-            self.meeting_list.setCurrentItem(item)
+        Pass ``today`` when labelling many rows so they share one clock reading.
+        """
+        if today is None:
+            today = get_now().date()
+        return _date_group_label(dt.date() if isinstance(dt, datetime) else dt, today)
 
+    def _restore_selection(self) -> None:
+        """Re-select the row of the selected meeting, if the list shows it."""
+        if self._selected_id is None:
+            return
+        row = self.meeting_model.row_of(self._selected_type, self._selected_id)
+        if row is not None:
+            self.meeting_list.setCurrentIndex(self.meeting_model.index(row))
+
+    @pyqtSlot(int)
     def _on_scroll(self, value: int):
         """Handle scroll - load more history when near bottom."""
         # Only load more history if we are NOT in today-only mode
@@ -991,7 +1454,8 @@ class CalendarPanel(QWidget):
         start_date = end_date - timedelta(days=days)
 
         # Limit to 30 days max
-        max_history = get_now() - timedelta(days=30)
+        now = get_now()
+        max_history = now - timedelta(days=30)
         if start_date < max_history:
             start_date = max_history
 
@@ -1015,6 +1479,7 @@ class CalendarPanel(QWidget):
             recordings_by_date[date_key].append(rec)
 
         # Iterate through each day and add content
+        rows: list[_MeetingRow] = []
         current_date = end_date - timedelta(days=1)  # Start from yesterday
         while current_date >= start_date:
             date_key = current_date.strftime("%Y-%m-%d")
@@ -1023,24 +1488,24 @@ class CalendarPanel(QWidget):
 
             if day_events or day_recordings:
                 # Add date header
-                date_str = self._get_date_group(current_date)
-                self._add_date_header(date_str)
+                date_str = self._get_date_group(current_date, now.date())
+                rows.append(self._date_header_row(date_str))
 
                 # Add calendar events
                 for event in reversed(day_events):
-                    item = self._create_calendar_item(event, is_upcoming=False)
-                    self.meeting_list.addItem(item)
+                    rows.append(self._calendar_event_row(event, is_upcoming=False, now=now))
 
                 # Add unlinked recordings
                 linked_ids = {e.get("rec_id") for e in day_events if e.get("rec_id")}
                 for rec in day_recordings:
                     if rec["id"] not in linked_ids:
-                        item = self._create_recording_item(rec)
-                        self.meeting_list.addItem(item)
-                        self._restore_selection(rec["id"], ITEM_TYPE_RECORDING, item)
+                        rows.append(self._recording_row(rec))
 
             current_date -= timedelta(days=1)
 
+        self.meeting_model.append_rows(rows)
+        self._restore_selection()
+
         # Update oldest loaded date
         self._oldest_loaded_date = start_date
 
@@ -1050,7 +1515,8 @@ class CalendarPanel(QWidget):
             return
 
         # Check if we've hit the limit
-        max_history = get_now() - timedelta(days=30)
+        now = get_now()
+        max_history = now - timedelta(days=30)
         if self._oldest_loaded_date <= max_history:
             return
 
@@ -1069,21 +1535,21 @@ class CalendarPanel(QWidget):
             # Only add content if there's something to show
             if events or recordings:
                 # Add date header
-                date_str = self._get_date_group(start)
-                self._add_date_header(date_str)
+                date_str = self._get_date_group(start, now.date())
+                rows = [self._date_header_row(date_str)]
 
                 # Add calendar events (reversed for chronological order within day)
                 for event in reversed(events):
-                    item = self._create_calendar_item(event, is_upcoming=False)
-                    self.meeting_list.addItem(item)
+                    rows.append(self._calendar_event_row(event, is_upcoming=False, now=now))
 
                 # Add unlinked recordings from this date
                 linked_ids = {e.get("rec_id") for e in events if e.get("rec_id")}
                 for rec in recordings:
                     if rec["id"] not in linked_ids:
-                        item = self._create_recording_item(rec)
-                        self.meeting_list.addItem(item)
-                        self._restore_selection(rec["id"], ITEM_TYPE_RECORDING, item)
+                        rows.append(self._recording_row(rec))
+
+                self.meeting_model.append_rows(rows)
+                self._restore_selection()
 
             # Always advance the date, even if nothing to show
             self._oldest_loaded_date = start
@@ -1096,10 +1562,10 @@ class CalendarPanel(QWidget):
         """Get recordings within a date range."""
         return self.db.get_recordings_in_range(start, end)
 
-    def _on_item_clicked(self, item: QListWidgetItem):
+    @pyqtSlot(QModelIndex)
+    def _on_item_clicked(self, index: QModelIndex):
         """Handle item click."""
-        item_type = item.data(Qt.ItemDataRole.UserRole + 1)
-        item_id = item.data(Qt.ItemDataRole.UserRole)
+        item_type, item_id, recording_id = index.data(MEETING_DATA_ROLE)
 
         if item_type == ITEM_TYPE_HEADER:
             return
@@ -1109,7 +1575,6 @@ class CalendarPanel(QWidget):
 
         if item_type == ITEM_TYPE_CALENDAR_EVENT:
             # Check if it has a linked recording
-            recording_id = item.data(Qt.ItemDataRole.UserRole + 2)
             if recording_id:
                 self.recording_selected.emit(recording_id)
             else:
@@ -1117,13 +1582,14 @@ class CalendarPanel(QWidget):
         elif item_type == ITEM_TYPE_RECORDING:
             self.recording_selected.emit(item_id)
 
-    def _show_context_menu(self, position):
+    @pyqtSlot(QPoint)
+    def _show_context_menu(self, position: QPoint):
         """Show context menu for items."""
-        item = self.meeting_list.itemAt(position)
-        if not item:
+        index = self.meeting_list.indexAt(position)
+        if not index.isValid():
             return
 
-        item_type = item.data(Qt.ItemDataRole.UserRole + 1)
+        item_type, item_id, recording_id = index.data(MEETING_DATA_ROLE)
         if item_type == ITEM_TYPE_HEADER:
             return
 
@@ -1132,31 +1598,30 @@ class CalendarPanel(QWidget):
         if item_type == ITEM_TYPE_RECORDING:
             # Existing recording actions
             rename_action = QAction("Rename", self)
-            rename_action.triggered.connect(lambda: self._rename_recording(item))
+            rename_action.triggered.connect(lambda: self._rename_recording(index))
             menu.addAction(rename_action)
 
             delete_action = QAction("Delete", self)
-            delete_action.triggered.connect(lambda: self._delete_recording(item))
+            delete_action.triggered.connect(lambda: self._delete_recording(index))
             menu.addAction(delete_action)
 
         elif item_type == ITEM_TYPE_CALENDAR_EVENT:
-            recording_id = item.data(Qt.ItemDataRole.UserRole + 2)
             if recording_id:
                 # Has recording - show recording actions
                 rename_action = QAction("Rename Recording", self)
                 rename_action.triggered.connect(
-                    lambda: self._rename_recording_by_id(recording_id, item)
+                    lambda: self._rename_recording_by_id(recording_id, index)
                 )
                 menu.addAction(rename_action)
 
                 delete_action = QAction("Delete Recording", self)
                 delete_action.triggered.connect(
-                    lambda: self._delete_recording_by_id(recording_id, item)
+                    lambda: self._delete_recording_by_id(recording_id, index)
                 )
                 menu.addAction(delete_action)
             else:
                 # No recording yet
-                event_id = item.data(Qt.ItemDataRole.UserRole)
+                event_id = item_id
                 event = self.db.get_calendar_event(event_id)
                 if event:
                     title = event.get("title", "Unknown")
@@ -1202,16 +1667,20 @@ class CalendarPanel(QWidget):
         if reply == QMessageBox.StandardButton.Yes:
             try:
                 self.db.set_calendar_event_hidden(event_id, True)
-                self.refresh()
+                if not (
+                    self._today_view_shown()
+                    and self._remove_today_row(ITEM_TYPE_CALENDAR_EVENT, event_id)
+                ):
+                    self.refresh()
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to hide meeting: {e}")
 
-    def _rename_recording(self, item: QListWidgetItem):
-        """Rename a recording from its list item."""
-        rec_id = item.data(Qt.ItemDataRole.UserRole)
-        self._rename_recording_by_id(rec_id, item)
+    def _rename_recording(self, index: QModelIndex):
+        """Rename a recording from its list row."""
+        _, rec_id, _ = index.data(MEETING_DATA_ROLE)
+        self._rename_recording_by_id(rec_id, index)
 
-    def _rename_recording_by_id(self, rec_id: str, item: QListWidgetItem | None):
+    def _rename_recording_by_id(self, rec_id: str, index: QModelIndex | None):
         """Rename a recording by its ID."""
         rec = self.db.get_recording(rec_id)
         if not rec:
@@ -1225,17 +1694,25 @@ class CalendarPanel(QWidget):
         if ok and new_title:
             try:
                 self.db.update_recording_title(rec_id, new_title)
-                self.refresh()
+                if self._today_view_shown():
+                    # Only an unlinked recording's row shows its title
+                    self._search_cache.clear()
+                    row = self.meeting_model.row_of(ITEM_TYPE_RECORDING, rec_id)
+                    if row is not None:
+                        rec = dict(rec, title=new_title)
+                        self.meeting_model.replace_row(row, self._recording_row(rec))
+                else:
+                    self.refresh()
                 self.meeting_renamed.emit(rec_id, new_title)
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to rename recording: {e}")
 
-    def _delete_recording(self, item: QListWidgetItem):
-        """Delete a recording from its list item."""
-        rec_id = item.data(Qt.ItemDataRole.UserRole)
-        self._delete_recording_by_id(rec_id, item)
+    def _delete_recording(self, index: QModelIndex):
+        """Delete a recording from its list row."""
+        _, rec_id, _ = index.data(MEETING_DATA_ROLE)
+        self._delete_recording_by_id(rec_id, index)
 
-    def _delete_recording_by_id(self, rec_id: str, item: QListWidgetItem | None):
+    def _delete_recording_by_id(self, rec_id: str, index: QModelIndex | None):
         """Delete a recording by its ID."""
         rec = self.db.get_recording(rec_id)
         if not rec:
@@ -1257,77 +1734,93 @@ class CalendarPanel(QWidget):
                 if self._selected_id == rec_id:
                     self._selected_id = None
                     self._selected_type = None
-                self.refresh()
+                if self._today_view_shown() and self._remove_today_row(ITEM_TYPE_RECORDING, rec_id):
+                    self._search_cache.clear()
+                    self._unlink_today_event_rows(rec_id)
+                else:
+                    self.refresh()
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to delete recording: {e}")
 
+    def _today_view_shown(self) -> bool:
+        return bool(self.view_stack.currentIndex() == 0)
+
+    def _remove_today_row(self, item_type: str, item_id: str) -> bool:
+        """Remove one meeting's row from the Today list in place.
+
+        Returns False if that would leave a header with nothing under it, so
+        the caller can rebuild the list instead.
+        """
+        model = self.meeting_model
+        row = model.row_of(item_type, item_id)
+        if row is None:
+            return True
+        last = row + 1 == model.rowCount()
+        if row > 0 and model.is_header(row - 1) and (last or model.is_header(row + 1)):
+            return False
+        model.remove_row(row)
+        return True
+
+    def _unlink_today_event_rows(self, rec_id: str) -> None:
+        """Redraw Today rows for calendar events whose recording was deleted."""
+        now = get_now()
+        for row, (item_type, event_id, recording_id) in enumerate(
+            self.meeting_model.meeting_data()
+        ):
+            if item_type != ITEM_TYPE_CALENDAR_EVENT or recording_id != rec_id:
+                continue
+            event = self.db.get_calendar_event(event_id)
+            if event:
+                start_time = self._to_local(_parse_iso(event["start_time"]))
+                row_data = self._calendar_event_row(event, is_upcoming=start_time > now, now=now)
+                self.meeting_model.replace_row(row, row_data)
+
+    @pyqtSlot()
     def _on_impromptu_clicked(self):
         """Handle impromptu meeting button click."""
         self.clear_selection()
         self.impromptu_meeting_requested.emit()
         self.new_meeting_requested.emit()  # For compatibility
 
-    def select_meeting(self, rec_id: str) -> bool:
+    def select_meeting(self, rec_id: str, wait_for_history: bool = False) -> bool:
         """Programmatically select a recording by ID.
 
         Searches Today list and History tree. Switches view if found.
         Returns True if found and selected, False otherwise.
-        """
-        # 1. Search Today list
-        for i in range(self.meeting_list.count()):
-            item = self.meeting_list.item(i)
-            if not item:
-                continue
-            item_type = item.data(Qt.ItemDataRole.UserRole + 1)
-
-            # Check for direct recording or calendar event linked to this recording
-            found = False
-            if item_type == ITEM_TYPE_RECORDING:
-                if item.data(Qt.ItemDataRole.UserRole) == rec_id:
-                    found = True
-            elif (
-                item_type == ITEM_TYPE_CALENDAR_EVENT
-                and item.data(Qt.ItemDataRole.UserRole + 2) == rec_id
-            ):
-                found = True
-
-            if found:
-                self._switch_view(0)
-                self.meeting_list.setCurrentItem(item)
-                self._on_item_clicked(item)  # Triggers signals
-                return True
-
-        # 2. Search History tree (FolderTree)
-        # Tree items use a prefixed format in UserRole: "rec:{id}" or "event:{id}"
-        it = QTreeWidgetItemIterator(self.folder_tree)
-        while it.value():
-            item = it.value()
-            if not item:
-                it += 1
-                continue
-
-            data = item.data(0, Qt.ItemDataRole.UserRole)
-            if not data or not isinstance(data, str):
-                it += 1
-                continue
 
-            found = False
-            if data.startswith("rec:") and data.split(":", 1)[1] == rec_id:
-                found = True
-
-            if found:
-                self._switch_view(1)
-                # Ensure parents are expanded
-                parent = item.parent()
-                while parent:
-                    parent.setExpanded(True)
-                    parent = parent.parent()
-
-                self.folder_tree.setCurrentItem(item)
-                self._on_tree_item_clicked(item, 0)  # Triggers signals
-                self.folder_tree.scrollToItem(item)
-                return True
-            it += 1
+        With wait_for_history, a recording missing while the History tree is
+        loading is selected once it loads (returning True); if it still isn't
+        found, meeting_not_found is emitted instead.
+        """
+        # 1. Look up the Today list; direct recordings and calendar events linked
+        # to this recording both carry it as their recording_id
+        row = self.meeting_model.row_for_recording(rec_id)
+        if row is not None:
+            index = self.meeting_model.index(row)
+            self._switch_view(0)
+            self.meeting_list.setCurrentIndex(index)
+            self._on_item_clicked(index)  # Triggers signals
+            return True
+
+        # 2. Look up the History tree (FolderTree) item by its key
+        item = self._tree_items.get((ITEM_TYPE_RECORDING, rec_id))
+        if item is not None:
+            self._switch_view(1)
+            # Ensure parents are expanded
+            parent = item.parent()
+            while parent:
+                parent.setExpanded(True)
+                parent = parent.parent()
+
+            self.folder_tree.setCurrentItem(item)
+            self._on_tree_item_clicked(item, 0)  # Triggers signals
+            self.folder_tree.scrollToItem(item)
+            return True
+
+        if wait_for_history and self._history_worker is not None:
+            # The tree is being reloaded; try again once the new one is built
+            self._pending_select_id = rec_id
+            return True
 
         logger.warning("Failed to find meeting %s for selection", rec_id)
         return False
@@ -1345,16 +1838,16 @@ class CalendarPanel(QWidget):
             self.recording_selected.emit(self._selected_id)
         elif self._selected_type == ITEM_TYPE_CALENDAR_EVENT:
             # Return the linked recording ID if any
-            for i in range(self.meeting_list.count()):
-                item = self.meeting_list.item(i)
-                if item and item.data(Qt.ItemDataRole.UserRole) == self._selected_id:
-                    rec_id: str | None = item.data(Qt.ItemDataRole.UserRole + 2)
-                    return rec_id
+            row = self.meeting_model.row_of(ITEM_TYPE_CALENDAR_EVENT, self._selected_id)
+            if row is not None:
+                rec_id: str | None = self.meeting_model.meeting_data_at(row)[2]
+                return rec_id
         return None
 
 
+@lru_cache(maxsize=1024)
 def get_meeting_platform(meet_link: str | None, full_name: bool = False) -> str:
-    """Detect meeting platform from link.
+    """Detect meeting platform from link (memoized; a handful of links repeat across rows).
 
     Args:
         meet_link: The video meeting URL
@@ -1363,10 +1856,7 @@ def get_meeting_platform(meet_link: str | None, full_name: bool = False) -> str:
     """
     if not meet_link:
         return ""
-    if "meet.google.com" in meet_link:
-        return "Google Meet" if full_name else "Meet"
-    if "zoom.us" in meet_link:
-        return "Zoom"
-    if "teams.microsoft.com" in meet_link:
-        return "Microsoft Teams" if full_name else "Teams"
-    return "Video"
+    match = _PLATFORM_RE.search(meet_link)
+    if match is None:
+        return "Video"
+    return _PLATFORM_NAMES[match.group(1)][full_name]
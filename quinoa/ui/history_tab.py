@@ -227,8 +227,13 @@ class HistoryTab:
         self._worker = TranscribeWorker(session_dir)
         self._worker.finished.connect(self._on_transcription_finished)
         self._worker.error.connect(self._on_transcription_error)
+        self._worker.progress.connect(self._on_transcription_progress)
         self._worker.start()
 
+    def _on_transcription_progress(self, received: int):
+        """Show how much of the transcript has streamed in."""
+        self.transcript_edit.setText(f"Receiving transcript... ({received:,} characters)")
+
     def _on_transcription_finished(self, json_str: str):
         """Handle successful transcription."""
         self.transcribe_btn.setText("Re-transcribe")
@@ -78,6 +78,7 @@ class MainWindow(QMainWindow):
         self.left_panel.search_result_selected.connect(self._on_search_result_selected)
         self.left_panel.new_meeting_requested.connect(self._on_new_meeting)
         self.left_panel.settings_requested.connect(self._open_settings)
+        self.left_panel.meeting_not_found.connect(self._on_meeting_not_found)
         self.splitter.addWidget(self.left_panel)
 
         # Middle panel - Notes/Transcript + Recording controls
@@ -237,7 +238,7 @@ class MainWindow(QMainWindow):
             # Initialize sync worker
             self._sync_worker = SyncWorker(self.db, self._file_search)
             self._sync_worker.store_ready.connect(self._on_store_ready)
-            self._sync_worker.sync_completed.connect(self._on_sync_completed)
+            self._sync_worker.sync_completed_batch.connect(self._on_sync_completed)
             self._sync_worker.sync_failed.connect(self._on_sync_failed)
 
             # Connect transcription completion to sync queue
@@ -412,6 +413,7 @@ class MainWindow(QMainWindow):
 
     def _on_calendar_connected(self) -> None:
         """Handle calendar connection from settings dialog."""
+        self.left_panel.invalidate_calendar_auth()
         # Start the sync worker
         self._init_calendar_sync()
         # Start notification worker
@@ -427,17 +429,20 @@ class MainWindow(QMainWindow):
         # Clear calendar events from database
         self.db.clear_calendar_events()
         # Refresh left panel
+        self.left_panel.invalidate_calendar_auth()
         self.left_panel.refresh()
 
     def _on_store_ready(self, store_name: str) -> None:
-        """Handle store ready signal - save store name to config."""
+        """Handle store ready signal - save store name and its last check to config."""
         config.set("file_search_store_name", store_name)
+        if self._file_search is not None:
+            config.set("file_search_store_verified", self._file_search.store_verified)
         self.right_panel.set_enabled(True)
         logger.info("File Search store ready: %s", store_name)
 
-    def _on_sync_completed(self, rec_id: str) -> None:
-        """Handle successful sync."""
-        logger.debug("Synced recording %s to File Search", rec_id)
+    def _on_sync_completed(self, rec_ids: list[str]) -> None:
+        """Handle a batch of successful syncs."""
+        logger.debug("Synced %d recordings to File Search: %s", len(rec_ids), rec_ids)
 
     def _on_sync_failed(self, rec_id: str, error: str) -> None:
         """Handle sync failure."""
@@ -462,12 +467,16 @@ class MainWindow(QMainWindow):
 
     def _on_citation_clicked(self, rec_id: str) -> None:
         """Handle citation click in AI chat."""
-        if not self.left_panel.select_meeting(rec_id):
-            QMessageBox.information(
-                self,
-                "Meeting Not Found",
-                "This meeting is no longer available or couldn't be located.",
-            )
+        if not self.left_panel.select_meeting(rec_id, wait_for_history=True):
+            self._on_meeting_not_found(rec_id)
+
+    def _on_meeting_not_found(self, rec_id: str) -> None:
+        """Tell the user a cited meeting couldn't be selected."""
+        QMessageBox.information(
+            self,
+            "Meeting Not Found",
+            "This meeting is no longer available or couldn't be located.",
+        )
 
     def _on_new_meeting(self):
         """Handle new meeting request - return to idle/recording mode."""
@@ -643,6 +652,8 @@ class MainWindow(QMainWindow):
             self._stop_compression_worker()
             # Stop device monitor
             self.middle_panel.stop_device_monitor()
+            # Wait for a History tree load still running
+            self.left_panel.shutdown()
             # Clean up D-Bus / tray
             self.tray_manager.cleanup()
             a0.accept()
@@ -920,7 +920,7 @@ class MiddlePanel(QWidget):
             if not audio_path or not os.path.exists(audio_path):
                 audio_path = rec.get("mic_path")
             if audio_path and os.path.exists(audio_path):
-                self.audio_player.load_audio(audio_path)
+                self.audio_player.load_audio(audio_path, reload=True)
 
         # Notify history panel to refresh
         if self.on_history_changed:
@@ -2038,8 +2038,13 @@ class MiddlePanel(QWidget):
         self._worker = TranscribeWorker(session_dir)
         self._worker.finished.connect(self._on_transcription_finished)
         self._worker.error.connect(self._on_transcription_error)
+        self._worker.progress.connect(self._on_transcription_progress)
         self._worker.start()
 
+    def _on_transcription_progress(self, received: int):
+        """Show how much of the transcript has streamed in."""
+        self.status_label.setText(f"Transcribing... ({received:,} characters received)")
+
     def _on_transcription_finished(self, json_str: str):
         """Handle transcription completion."""
         self.status_label.setText("Transcription Complete")
@@ -4,6 +4,7 @@ import os
 
 from PyQt6.QtCore import QThread, pyqtSignal
 
+from quinoa.audio.converter import compress_audio
 from quinoa.config import config
 from quinoa.transcription.gemini import GeminiTranscriber
 from quinoa.transcription.processor import create_stereo_mix
@@ -14,10 +15,12 @@ class TranscribeWorker(QThread):
 
     finished = pyqtSignal(str)
     error = pyqtSignal(str)
+    progress = pyqtSignal(int)  # Characters of the response received so far
 
     def __init__(self, output_dir):
         super().__init__()
         self.output_dir = output_dir
+        self._received = 0
 
     def run(self):
         try:
@@ -36,12 +39,28 @@ class TranscribeWorker(QThread):
             else:
                 upload_path = mic_path
 
-            # 2. Transcribe
+            # 2. Encode to Opus for upload: a fraction of the WAV size, and Gemini
+            # transcribes it just as well. Stereo is kept for speaker attribution.
+            encoded_path = compress_audio(upload_path, "opus")
+
+            # 3. Transcribe
             api_key = config.get("api_key")
             transcriber = GeminiTranscriber(api_key=api_key)
-            transcript = transcriber.transcribe(upload_path)
+            self._received = 0
+            try:
+                transcript = transcriber.transcribe(
+                    str(encoded_path or upload_path), on_chunk=self._on_chunk
+                )
+            finally:
+                # Only needed for the upload; a later re-mix would leave it stale
+                if encoded_path:
+                    encoded_path.unlink(missing_ok=True)
 
             self.finished.emit(transcript)
 
         except Exception as e:
             self.error.emit(str(e))
+
+    def _on_chunk(self, text: str) -> None:
+        self._received += len(text)
+        self.progress.emit(self._received)
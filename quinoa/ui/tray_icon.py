@@ -165,6 +165,8 @@ class TrayIconManager(QObject):
         self.tray_icon: QSystemTrayIcon | None = None
         self.record_action: QAction | None = None
         self._dbus_notifier = None
+        self._play_icon = QIcon()
+        self._stop_icon = QIcon()
 
     def setup(self):
         """Initialize the system tray icon."""
@@ -174,12 +176,13 @@ class TrayIconManager(QObject):
 
         self.tray_icon = QSystemTrayIcon(self._parent_window)
 
-        # Use a standard icon
-        icon = _std_icon(self._parent_window, QStyle.StandardPixmap.SP_MediaPlay)
-        if icon.isNull():
+        # Use standard icons, built once; recording state changes just swap between them
+        self._play_icon = _std_icon(self._parent_window, QStyle.StandardPixmap.SP_MediaPlay)
+        self._stop_icon = _std_icon(self._parent_window, QStyle.StandardPixmap.SP_MediaStop)
+        if self._play_icon.isNull():
             logger.warning("Standard icon SP_MediaPlay not found")
 
-        self.tray_icon.setIcon(icon)
+        self.tray_icon.setIcon(self._play_icon)
 
         # Context Menu
         menu = QMenu()
@@ -235,14 +238,10 @@ class TrayIconManager(QObject):
 
         if is_recording:
             self.record_action.setText("Stop Recording")
-            self.tray_icon.setIcon(
-                _std_icon(self._parent_window, QStyle.StandardPixmap.SP_MediaStop)
-            )
+            self.tray_icon.setIcon(self._stop_icon)
         else:
             self.record_action.setText("Start Recording")
-            self.tray_icon.setIcon(
-                _std_icon(self._parent_window, QStyle.StandardPixmap.SP_MediaPlay)
-            )
+            self.tray_icon.setIcon(self._play_icon)
 
     def is_visible(self) -> bool:
         """Check if tray icon is visible."""
@@ -0,0 +1,200 @@
+import sqlite3
+
+import pytest
+
+from quinoa.storage.database import Database
+
+# Schema as created by releases before user_version tracking: a standalone
+# transcripts_fts index and foreign keys without ON DELETE CASCADE
+BASELINE_SCHEMA = """
+CREATE TABLE recordings (
+    id TEXT PRIMARY KEY,
+    title TEXT,
+    started_at TIMESTAMP,
+    ended_at TIMESTAMP,
+    duration_seconds REAL,
+    mic_path TEXT,
+    sys_path TEXT,
+    stereo_path TEXT,
+    status TEXT,
+    mic_device_id TEXT,
+    mic_device_name TEXT,
+    directory_path TEXT,
+    notes TEXT DEFAULT '',
+    enhanced_notes TEXT,
+    folder_id TEXT REFERENCES meeting_folders(id)
+);
+CREATE TABLE meeting_folders (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    parent_id TEXT,
+    recurring_event_id TEXT,
+    created_at TIMESTAMP,
+    sort_order INTEGER DEFAULT 0,
+    FOREIGN KEY(parent_id) REFERENCES meeting_folders(id)
+);
+CREATE TABLE speaker_profiles (
+    name TEXT PRIMARY KEY,
+    usage_count INTEGER DEFAULT 1,
+    last_used_at TIMESTAMP
+);
+CREATE TABLE transcripts (
+    recording_id TEXT PRIMARY KEY,
+    text TEXT,
+    summary TEXT,
+    utterances TEXT,
+    speaker_names TEXT,
+    created_at TIMESTAMP,
+    FOREIGN KEY(recording_id) REFERENCES recordings(id)
+);
+CREATE TABLE action_items (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    recording_id TEXT NOT NULL,
+    text TEXT NOT NULL,
+    assignee TEXT,
+    status TEXT DEFAULT 'open',
+    FOREIGN KEY(recording_id) REFERENCES recordings(id)
+);
+CREATE TABLE file_search_sync (
+    recording_id TEXT PRIMARY KEY,
+    file_search_file_name TEXT,
+    last_synced_at TIMESTAMP,
+    content_hash TEXT,
+    sync_status TEXT DEFAULT 'pending',
+    error_message TEXT,
+    FOREIGN KEY(recording_id) REFERENCES recordings(id)
+);
+CREATE VIRTUAL TABLE transcripts_fts USING fts5(
+    recording_id UNINDEXED,
+    text,
+    summary
+);
+CREATE TRIGGER transcripts_ai AFTER INSERT ON transcripts BEGIN
+  INSERT INTO transcripts_fts(recording_id, text, summary)
+  VALUES (new.recording_id, new.text, new.summary);
+END;
+CREATE TRIGGER transcripts_ad AFTER DELETE ON transcripts BEGIN
+  DELETE FROM transcripts_fts WHERE recording_id = old.recording_id;
+END;
+CREATE TRIGGER transcripts_au AFTER UPDATE ON transcripts BEGIN
+  UPDATE transcripts_fts SET text = new.text, summary = new.summary
+  WHERE recording_id = new.recording_id;
+END;
+CREATE TABLE chat_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    session_id TEXT NOT NULL,
+    role TEXT NOT NULL,
+    content TEXT NOT NULL,
+    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    citations TEXT
+);
+CREATE TABLE calendar_events (
+    event_id TEXT PRIMARY KEY,
+    calendar_id TEXT DEFAULT 'primary',
+    title TEXT NOT NULL,
+    start_time TIMESTAMP NOT NULL,
+    end_time TIMESTAMP NOT NULL,
+    meet_link TEXT,
+    attendees TEXT,
+    organizer_email TEXT,
+    etag TEXT,
+    synced_at TIMESTAMP,
+    recording_id TEXT,
+    hidden INTEGER DEFAULT 0,
+    notes TEXT DEFAULT '',
+    folder_id TEXT REFERENCES meeting_folders(id),
+    recurring_event_id TEXT,
+    FOREIGN KEY(recording_id) REFERENCES recordings(id)
+);
+CREATE INDEX idx_calendar_events_start ON calendar_events(start_time);
+CREATE INDEX idx_calendar_events_recording ON calendar_events(recording_id);
+CREATE INDEX idx_calendar_events_recurring ON calendar_events(recurring_event_id);
+
+INSERT INTO recordings (id, title, started_at, duration_seconds, status)
+VALUES
+    ('rec-1', 'Budget review', '2026-10-01 10:00:00', 1800, 'completed'),
+    ('rec-2', 'HR sync', '2026-10-02 11:00:00', 900, 'completed');
+INSERT INTO transcripts (recording_id, text, summary)
+VALUES
+    ('rec-1', 'We agreed to cut the travel budget next quarter.', 'Travel budget cut'),
+    ('rec-2', 'Hiring plan for the platform team.', 'Hiring plan');
+INSERT INTO action_items (recording_id, text) VALUES ('rec-1', 'Send the new budget');
+INSERT INTO file_search_sync (recording_id, content_hash, sync_status)
+VALUES ('rec-1', 'abc123', 'synced');
+INSERT INTO calendar_events (event_id, title, start_time, end_time, recording_id)
+VALUES
+    ('evt-1', 'Budget review', '2026-10-01T10:00:00+00:00', '2026-10-01T10:30:00+00:00',
+     'rec-1'),
+    ('evt-2', 'Deleted meeting', '2026-10-03T09:00:00+00:00', '2026-10-03T09:30:00+00:00',
+     'rec-gone');
+"""
+
+
+@pytest.fixture
+def baseline_db(tmp_path):
+    path = tmp_path / "quinoa.db"
+    conn = sqlite3.connect(path)
+    conn.executescript(BASELINE_SCHEMA)
+    conn.close()
+    db = Database(path)
+    yield db
+    db.close()
+
+
+def test_migration_keeps_database_intact(baseline_db):
+    with baseline_db._conn() as conn:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == Database.SCHEMA_VERSION
+        assert conn.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+        assert conn.execute("PRAGMA foreign_key_check").fetchall() == []
+        # Raises if the external-content index disagrees with transcripts
+        conn.execute("INSERT INTO transcripts_fts(transcripts_fts) VALUES ('integrity-check')")
+
+    assert baseline_db.get_recording("rec-1")["title"] == "Budget review"
+    assert baseline_db.get_transcript("rec-2")["text"] == "Hiring plan for the platform team."
+    # The dangling link to a recording that no longer exists is cleared
+    assert baseline_db.get_calendar_event("evt-2")["recording_id"] is None
+
+
+def test_migration_indexes_existing_transcripts_and_titles(baseline_db):
+    results = baseline_db.search_transcripts("travel")
+    assert [r["recording_id"] for r in results] == ["rec-1"]
+    assert "<b>travel</b>" in results[0]["text_snippet"]
+
+    results = baseline_db.search_transcripts("review")
+    assert [r["recording_id"] for r in results] == ["rec-1"]
+
+
+def test_delete_recording_cascades_after_migration(baseline_db):
+    baseline_db.delete_recording("rec-1")
+
+    with baseline_db._conn() as conn:
+        for table in ("transcripts", "action_items", "file_search_sync"):
+            count = conn.execute(
+                f"SELECT COUNT(*) FROM {table} WHERE recording_id = 'rec-1'"
+            ).fetchone()[0]
+            assert count == 0, table
+        assert conn.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+
+    assert baseline_db.search_transcripts("travel") == []
+    assert [r["recording_id"] for r in baseline_db.search_transcripts("hiring")] == ["rec-2"]
+    # The calendar event is kept, just unlinked
+    assert baseline_db.get_calendar_event("evt-1")["recording_id"] is None
+
+
+def test_current_database_skips_migrations(baseline_db, monkeypatch):
+    def fail(*args):
+        raise AssertionError("migration ran on an up-to-date database")
+
+    monkeypatch.setattr(Database, "_migrations", fail)
+    db = Database(baseline_db.db_path)
+    try:
+        assert db.get_recording("rec-2")["title"] == "HR sync"
+    finally:
+        db.close()
+
+
+def test_search_matches_short_title_words(baseline_db):
+    # Too short for the trigram title index; matched with LIKE instead
+    assert [r["recording_id"] for r in baseline_db.search_transcripts("HR")] == ["rec-2"]
+    assert [r["recording_id"] for r in baseline_db.search_transcripts("hr sync")] == ["rec-2"]
+    assert baseline_db.search_transcripts("HR budget") == []
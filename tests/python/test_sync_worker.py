@@ -0,0 +1,92 @@
+import time
+from datetime import datetime
+
+import pytest
+
+from quinoa.search import sync_worker
+from quinoa.search.sync_worker import SyncWorker
+from quinoa.storage.database import Database
+
+
+class FakeFileSearch:
+    """Records uploads and deletes instead of calling the File Search API."""
+
+    store_name = "stores/test"
+
+    def __init__(self):
+        self.uploads: list[str] = []
+        self.deletes: list[str] = []
+
+    def upload_meeting(self, rec_id, content, meeting_date):
+        self.uploads.append(rec_id)
+        return f"documents/{rec_id}-{len(self.uploads)}"
+
+    def delete_meeting(self, document_name):
+        self.deletes.append(document_name)
+        return True
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = Database(tmp_path / "quinoa.db")
+    db.add_recording("rec-1", "Budget review", datetime(2026, 10, 1, 10), "mic.wav", "sys.wav")
+    db.update_recording_status("rec-1", "completed", duration=600)
+    db.save_transcript("rec-1", "We agreed to cut the travel budget.")
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def worker(db):
+    worker = SyncWorker(db, FakeFileSearch())
+    yield worker
+    worker._executor.shutdown()
+
+
+@pytest.fixture
+def format_calls(monkeypatch):
+    calls: list[str] = []
+    format_and_hash = sync_worker.format_and_hash
+
+    def counting_format_and_hash(recording, *args, **kwargs):
+        calls.append(recording["id"])
+        return format_and_hash(recording, *args, **kwargs)
+
+    monkeypatch.setattr(sync_worker, "format_and_hash", counting_format_and_hash)
+    return calls
+
+
+def test_unchanged_recording_is_skipped_without_formatting(db, worker, format_calls):
+    assert worker._sync_recording("rec-1") is True
+    assert worker.file_search.uploads == ["rec-1"]
+    assert format_calls == ["rec-1"]
+
+    assert worker._sync_recording("rec-1") is False
+    assert worker.file_search.uploads == ["rec-1"]
+    assert format_calls == ["rec-1"]
+
+
+def test_touched_but_identical_content_is_not_reuploaded(db, worker, format_calls):
+    worker._sync_recording("rec-1")
+    time.sleep(0.01)  # content_updated_at has millisecond resolution
+    db.update_recording_title("rec-1", "Budget review")
+
+    # Reformatted because the source rows changed, but the hash matches
+    assert worker._sync_recording("rec-1") is False
+    assert format_calls == ["rec-1", "rec-1"]
+    assert worker.file_search.uploads == ["rec-1"]
+
+    # The refreshed marker skips formatting next time
+    assert worker._sync_recording("rec-1") is False
+    assert format_calls == ["rec-1", "rec-1"]
+
+
+def test_changed_recording_replaces_its_document(db, worker):
+    worker._sync_recording("rec-1")
+    time.sleep(0.01)
+    db.update_recording_title("rec-1", "Travel budget review")
+
+    assert worker._sync_recording("rec-1") is True
+    assert worker.file_search.uploads == ["rec-1", "rec-1"]
+    assert worker.file_search.deletes == ["documents/rec-1-1"]
+    assert db.get_sync_status("rec-1")["file_search_file_name"] == "documents/rec-1-2"